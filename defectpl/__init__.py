@@ -7,11 +7,15 @@ Public API
 Core physics engines::
 
     from defectpl import Photoluminescence, Photoabsorption, VibrationalSpectra1D
+    from defectpl import PhotoluminescenceAbsorption
     from defectpl import ConfigurationCoordinateDiagram
 
 ``Photoluminescence`` uses **ground-state phonons** and computes the PL emission
 spectrum.  ``Photoabsorption`` uses **excited-state phonons** (a phonopy run on
 the ES geometry) and computes only the absorption spectrum.
+``PhotoluminescenceAbsorption`` takes the ``Photoluminescence`` inputs and
+returns both spectra (mirror-image absorption) and the Stokes shift from one
+generating function.
 
 Phonon helpers::
 
@@ -38,8 +42,10 @@ defectpl.physics.*    — physics computation engines
 
 from defectpl.defectpl import (
     ConfigurationCoordinateDiagram,
+    LineshapeSweep,
     Photoabsorption,
     Photoluminescence,
+    PhotoluminescenceAbsorption,
     VibrationalSpectra1D,
 )
 from defectpl.phonon import read_band_yaml
@@ -51,8 +57,10 @@ __version__ = "0.3.0"
 __all__ = [
     # Physics engines
     "ConfigurationCoordinateDiagram",
+    "LineshapeSweep",
     "Photoabsorption",
     "Photoluminescence",
+    "PhotoluminescenceAbsorption",
     "VibrationalSpectra1D",
     # Phonon helpers
     "read_band_yaml",
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed on-disk cache for parsed phonon data.
+
+:func:`~defectpl.phonon.read_band_yaml` (and everything built on it, such as
+:meth:`~defectpl.io.vasp.VaspReader.read_band_yaml` and the CLI commands)
+stores its result as an uncompressed ``.npz`` file named after the BLAKE2b
+hash of the input file's *content* and the ``q_idx`` block.  A repeat read of
+the same file — under any name or path — then costs an ``np.load`` instead of
+a full parse (the hash itself is remembered per path, size and modification
+time, so an unchanged file is not even re-read).  Editing the file changes
+its hash, so stale entries are never returned.
+
+The cache is bounded: after every write the least recently used entries are
+deleted until the total size is below the cap.
+
+Configuration (environment variables)
+-------------------------------------
+``DEFECTPL_CACHE_DIR``
+    Cache directory.  Default ``$XDG_CACHE_HOME/defectpl`` or
+    ``~/.cache/defectpl``.
+``DEFECTPL_CACHE_MAX_MB``
+    Size cap in MiB.  Default 1024.
+``DEFECTPL_CACHE``
+    Set to ``0`` (or ``false``/``off``) to disable the cache.
+
+Example
+-------
+>>> from defectpl.cache import cache_info, clear_cache
+>>> cache_info()["entries"]
+3
+>>> clear_cache()
+3
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Bump when the layout or meaning of the stored arrays changes
+CACHE_VERSION = 1
+DEFAULT_MAX_MB = 1024
+_CHUNK = 1 << 20
+_DIGEST_INDEX = "digests.json"
+_DIGEST_INDEX_SIZE = 1000
+
+
+def cache_enabled() -> bool:
+    """Return ``False`` when the cache is switched off with ``DEFECTPL_CACHE=0``."""
+    return os.environ.get("DEFECTPL_CACHE", "1").strip().lower() not in (
+        "0",
+        "false",
+        "off",
+        "no",
+    )
+
+
+def get_cache_dir() -> Path:
+    """Return the cache directory (not created until the first write)."""
+    env = os.environ.get("DEFECTPL_CACHE_DIR")
+    if env:
+        return Path(env).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "defectpl"
+
+
+def max_cache_bytes() -> int:
+    """Return the size cap in bytes (``DEFECTPL_CACHE_MAX_MB``, default 1024 MiB)."""
+    try:
+        mb = float(os.environ.get("DEFECTPL_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    except ValueError:
+        raise ValueError(
+            "DEFECTPL_CACHE_MAX_MB must be a number, got "
+            f"{os.environ['DEFECTPL_CACHE_MAX_MB']!r}."
+        )
+    return int(mb * 1024 * 1024)
+
+
+def _hash_file(path: Union[str, Path]) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    BLAKE2b hex digest of the content of *path*.
+
+    Digests are remembered in ``digests.json`` in the cache directory under
+    the file's path, size, inode and nanosecond modification time, so an
+    unchanged file is not hashed again.
+    """
+    st = os.stat(path)
+    stamp = f"{os.path.abspath(path)}|{st.st_size}|{st.st_ino}|{st.st_mtime_ns}"
+    index_path = get_cache_dir() / _DIGEST_INDEX
+    try:
+        index = json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        index = {}
+    digest = index.get(stamp)
+    if digest is not None:
+        return digest
+
+    digest = _hash_file(path)
+    index[stamp] = digest
+    # Keep the most recent entries only (dicts preserve insertion order)
+    index = dict(list(index.items())[-_DIGEST_INDEX_SIZE:])
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, index_path)
+    except OSError:
+        pass
+    return digest
+
+
+def cache_key(path: Union[str, Path], kind: str, **params) -> str:
+    """
+    Build the cache key of a parse of *path*.
+
+    Parameters
+    ----------
+    path : str or Path
+        Input file; only its content enters the key.
+    kind : str
+        Name of the parsed product, e.g. ``"band_yaml"``.
+    **params
+        Further parse options (e.g. ``q_idx=0``) that change the result.
+    """
+    opts = "-".join(f"{k}{params[k]}" for k in sorted(params))
+    parts = [kind, file_digest(path), opts, f"v{CACHE_VERSION}"]
+    return "-".join(p for p in parts if p)
+
+
+def _entry(key: str) -> Path:
+    return get_cache_dir() / f"{key}.npz"
+
+
+def load(key: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Return the arrays stored under *key*, or ``None`` on a miss.
+
+    A hit refreshes the entry's modification time, which is the recency
+    used for LRU eviction.
+    """
+    path = _entry(key)
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return arrays
+
+
+def store(key: str, **arrays: np.ndarray) -> None:
+    """
+    Store *arrays* under *key*, then evict down to the size cap.
+
+    The file is written to a temporary name and renamed into place, so
+    concurrent readers never see a partial entry.  Failures to write (e.g.
+    a read-only cache directory) are ignored: the cache is an optimisation.
+    """
+    directory = get_cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, _entry(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        return
+    evict()
+
+
+def _entries() -> list:
+    """Return ``(mtime, size, path)`` of every entry, least recently used first."""
+    directory = get_cache_dir()
+    if not directory.is_dir():
+        return []
+    entries = []
+    for path in directory.glob("*.npz"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    return sorted(entries)
+
+
+def evict(max_bytes: Optional[int] = None) -> int:
+    """
+    Delete least recently used entries until the cache fits in *max_bytes*.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Size cap.  Defaults to :func:`max_cache_bytes`.
+
+    Returns
+    -------
+    int
+        Number of entries deleted.
+    """
+    limit = max_cache_bytes() if max_bytes is None else max_bytes
+    entries = _entries()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= limit:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def cache_info() -> Dict[str, object]:
+    """
+    Summarise the cache.
+
+    Returns
+    -------
+    dict
+        ``directory``, ``enabled``, ``entries``, ``size_bytes`` and
+        ``max_bytes``.
+    """
+    entries = _entries()
+    return {
+        "directory": str(get_cache_dir()),
+        "enabled": cache_enabled(),
+        "entries": len(entries),
+        "size_bytes": sum(size for _, size, _ in entries),
+        "max_bytes": max_cache_bytes(),
+    }
+
+
+def clear_cache() -> int:
+    """Delete every cache entry and return how many were removed."""
+    entries = _entries()
+    for _, _, path in entries:
+        path.unlink(missing_ok=True)
+    (get_cache_dir() / _DIGEST_INDEX).unlink(missing_ok=True)
+    return len(entries)
+
+
+def cached_arrays(
+    path: Union[str, Path], kind: str, names: Tuple[str, ...], compute, **params
+) -> Tuple[np.ndarray, ...]:
+    """
+    Return ``compute()`` for *path*, served from the cache when possible.
+
+    Parameters
+    ----------
+    path : str or Path
+        Input file the result is derived from.
+    kind : str
+        Name of the parsed product (part of the key).
+    names : tuple of str
+        Names under which the arrays returned by *compute* are stored.
+    compute : callable
+        Zero-argument function returning a tuple of arrays, called on a miss.
+    **params
+        Parse options that change the result (part of the key).
+    """
+    if not cache_enabled():
+        return compute()
+    key = cache_key(path, kind, **params)
+    hit = load(key)
+    if hit is not None and all(name in hit for name in names):
+        return tuple(hit[name] for name in names)
+    result = compute()
+    store(key, **dict(zip(names, result)))
+    return result
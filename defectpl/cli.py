@@ -8,6 +8,7 @@ displacements, Configuration Coordinate Diagrams (CCD), and phonon properties.
 import json
 import traceback
 from pathlib import Path
+from typing import Optional
 import click
 
 _verbose = False
@@ -29,9 +30,27 @@ def _set_verbose(ctx, param, value):
     callback=_set_verbose,
     help="Show the full error traceback instead of a condensed message.",
 )
-def main():
+@click.option(
+    "--fft_backend",
+    type=click.Choice(["numpy", "scipy", "pyfftw"]),
+    default="numpy",
+    show_default=True,
+    help="FFT library used by the lineshape engines (scipy/pyfftw are multi-threaded).",
+)
+@click.option(
+    "--fft_workers",
+    type=int,
+    default=None,
+    help="Number of FFT threads for the scipy/pyfftw backends (default: all cores).",
+)
+def main(fft_backend, fft_workers):
     """defectpl command utility suite for defect photoluminescence modeling."""
-    pass
+    from defectpl.fft import set_fft_backend
+
+    try:
+        set_fft_backend(fft_backend, fft_workers)
+    except ImportError as exc:
+        raise click.UsageError(str(exc))
 
 
 # =====================================================================
@@ -58,12 +77,45 @@ def _parse_sigma(sigma_str: str):
     )
 
 
+def _parse_energy_window(window_str: Optional[str]):
+    """Parse '--energy_window 0.5,2.5' into an ``(emin, emax)`` tuple (or None)."""
+    if not window_str:
+        return None
+    parts = [s.strip() for s in window_str.split(",")]
+    if len(parts) != 2:
+        raise click.BadParameter(
+            "energy_window must be two comma-separated energies in eV (e.g. '0.5,2.5')."
+        )
+    return (float(parts[0]), float(parts[1]))
+
+
+def _read_phonon_input(band_yaml, band_hdf5, structure=None):
+    """Frequencies, eigenvectors and masses from ``--band_yaml`` or ``--band_hdf5``."""
+    from defectpl.phonon import read_band_hdf5, read_band_yaml
+
+    if band_hdf5:
+        if band_yaml:
+            raise click.BadParameter(
+                "Give either --band_yaml or --band_hdf5, not both."
+            )
+        return read_band_hdf5(band_hdf5, structure=structure)
+    return read_band_yaml(band_yaml or "./band.yaml")
+
+
 @pl_group.command(name="displacement")
 @click.option(
     "--band_yaml",
-    default="./band.yaml",
+    default=None,
+    type=click.Path(exists=True),
+    help="Phonopy band.yaml configuration file tracking destination path "
+    "(default ./band.yaml).",
+)
+@click.option(
+    "--band_hdf5",
+    default=None,
     type=click.Path(exists=True),
-    help="Phonopy band.yaml configuration file tracking destination path.",
+    help="Phonopy band/mesh/qpoints.hdf5 to read instead of band.yaml "
+    "(Γ point only; masses from the neighbouring phonopy.yaml).",
 )
 @click.option(
     "--contcar_gs",
@@ -121,6 +173,18 @@ def _parse_sigma(sigma_str: str):
     type=float,
     help="Upper energy axis limit in eV.",
 )
+@click.option(
+    "--auto_grid",
+    is_flag=True,
+    default=False,
+    help="Round the energy grid up to a fast FFT length (same spacing, slightly wider axis).",
+)
+@click.option(
+    "--energy_window",
+    "energy_window_str",
+    default=None,
+    help="Comma-separated photon-energy window in eV kept in the spectrum (e.g., '0.5,2.5').",
+)
 @click.option(
     "--json_out",
     default=None,
@@ -150,6 +214,7 @@ def _parse_sigma(sigma_str: str):
 )
 def pl_displacement(
     band_yaml,
+    band_hdf5,
     contcar_gs,
     contcar_es,
     out_dir,
@@ -159,6 +224,8 @@ def pl_displacement(
     sigma_str,
     resolution,
     max_energy,
+    auto_grid,
+    energy_window_str,
     json_out,
     plot_all,
     fig_format,
@@ -166,7 +233,6 @@ def pl_displacement(
     max_freq,
 ):
     """Run PL calculations using atomic structural shifts (Displacement Mode)."""
-    from defectpl.phonon import read_band_yaml
     from pymatgen.core import Structure
     from defectpl.io.vasp import calc_dR
     from defectpl.defectpl import Photoluminescence
@@ -174,10 +240,13 @@ def pl_displacement(
 
     try:
         sigma = _parse_sigma(sigma_str)
+        energy_window = _parse_energy_window(energy_window_str)
         click.echo("Initializing multi-mode PL calculation via Displacement Mode...")
-        frequencies, eigenvectors, masses = read_band_yaml(band_yaml)
         struct_gs = Structure.from_file(contcar_gs)
         struct_es = Structure.from_file(contcar_es)
+        frequencies, eigenvectors, masses = _read_phonon_input(
+            band_yaml, band_hdf5, structure=struct_gs
+        )
         dR = calc_dR(struct_gs, struct_es)
 
         pl_engine = Photoluminescence(
@@ -192,6 +261,8 @@ def pl_displacement(
             max_energy=max_energy,
             sigma=sigma,
             temperature=temperature,
+            auto_grid=auto_grid,
+            energy_window=energy_window,
         )
         click.echo("Photoluminescence engine data properties calculated successfully.")
         click.echo(f"  HR factor      : {pl_engine.HR_factor:.4f}")
@@ -226,9 +297,17 @@ def pl_displacement(
 @pl_group.command(name="force")
 @click.option(
     "--band_yaml",
-    default="./band.yaml",
+    default=None,
     type=click.Path(exists=True),
-    help="Phonopy band.yaml configuration file tracking destination path.",
+    help="Phonopy band.yaml configuration file tracking destination path "
+    "(default ./band.yaml).",
+)
+@click.option(
+    "--band_hdf5",
+    default=None,
+    type=click.Path(exists=True),
+    help="Phonopy band/mesh/qpoints.hdf5 to read instead of band.yaml "
+    "(Γ point only; masses from the neighbouring phonopy.yaml).",
 )
 @click.option(
     "--outcar_gs",
@@ -286,6 +365,18 @@ def pl_displacement(
     type=float,
     help="Upper energy axis limit in eV.",
 )
+@click.option(
+    "--auto_grid",
+    is_flag=True,
+    default=False,
+    help="Round the energy grid up to a fast FFT length (same spacing, slightly wider axis).",
+)
+@click.option(
+    "--energy_window",
+    "energy_window_str",
+    default=None,
+    help="Comma-separated photon-energy window in eV kept in the spectrum (e.g., '0.5,2.5').",
+)
 @click.option(
     "--json_out",
     default=None,
@@ -315,6 +406,7 @@ def pl_displacement(
 )
 def pl_force(
     band_yaml,
+    band_hdf5,
     outcar_gs,
     outcar_es,
     out_dir,
@@ -324,6 +416,8 @@ def pl_force(
     sigma_str,
     resolution,
     max_energy,
+    auto_grid,
+    energy_window_str,
     json_out,
     plot_all,
     fig_format,
@@ -331,15 +425,15 @@ def pl_force(
     max_freq,
 ):
     """Run PL calculations using force-difference vectors at vertical excitation (Force Mode)."""
-    from defectpl.phonon import read_band_yaml
     from defectpl.io.vasp import prepare_dF_files
     from defectpl.defectpl import Photoluminescence
     from monty.serialization import dumpfn
 
     try:
         sigma = _parse_sigma(sigma_str)
+        energy_window = _parse_energy_window(energy_window_str)
         click.echo("Initializing multi-mode PL calculation via Force Mode...")
-        frequencies, eigenvectors, masses = read_band_yaml(band_yaml)
+        frequencies, eigenvectors, masses = _read_phonon_input(band_yaml, band_hdf5)
         dF = prepare_dF_files(outcar_gs, outcar_es)
 
         pl_engine = Photoluminescence(
@@ -354,6 +448,8 @@ def pl_force(
             max_energy=max_energy,
             sigma=sigma,
             temperature=temperature,
+            auto_grid=auto_grid,
+            energy_window=energy_window,
         )
         click.echo("Photoluminescence engine data properties calculated successfully.")
         click.echo(f"  HR factor      : {pl_engine.HR_factor:.4f}")
@@ -457,9 +553,17 @@ def absorption_group():
 @absorption_group.command(name="displacement")
 @click.option(
     "--band_yaml",
-    default="./band.yaml",
+    default=None,
     type=click.Path(exists=True),
-    help="Excited-state phonopy band.yaml (phonopy run on the ES geometry).",
+    help="Excited-state phonopy band.yaml (phonopy run on the ES geometry; "
+    "default ./band.yaml).",
+)
+@click.option(
+    "--band_hdf5",
+    default=None,
+    type=click.Path(exists=True),
+    help="Excited-state phonopy band/mesh/qpoints.hdf5 to read instead of band.yaml "
+    "(Γ point only; masses from the neighbouring phonopy.yaml).",
 )
 @click.option(
     "--contcar_gs",
@@ -546,6 +650,7 @@ def absorption_group():
 )
 def absorption_displacement(
     band_yaml,
+    band_hdf5,
     contcar_gs,
     contcar_es,
     out_dir,
@@ -562,7 +667,6 @@ def absorption_displacement(
     max_freq,
 ):
     """Run photoabsorption calculations using atomic structural shifts (Displacement Mode)."""
-    from defectpl.phonon import read_band_yaml
     from pymatgen.core import Structure
     from defectpl.io.vasp import calc_dR
     from defectpl.defectpl import Photoabsorption
@@ -571,9 +675,11 @@ def absorption_displacement(
     try:
         sigma = _parse_sigma(sigma_str)
         click.echo("Initializing photoabsorption calculation via Displacement Mode...")
-        frequencies, eigenvectors, masses = read_band_yaml(band_yaml)
         struct_gs = Structure.from_file(contcar_gs)
         struct_es = Structure.from_file(contcar_es)
+        frequencies, eigenvectors, masses = _read_phonon_input(
+            band_yaml, band_hdf5, structure=struct_es
+        )
         dR = calc_dR(struct_gs, struct_es)
 
         abs_engine = Photoabsorption(
@@ -622,9 +728,17 @@ def absorption_displacement(
 @absorption_group.command(name="force")
 @click.option(
     "--band_yaml",
-    default="./band.yaml",
+    default=None,
     type=click.Path(exists=True),
-    help="Excited-state phonopy band.yaml (phonopy run on the ES geometry).",
+    help="Excited-state phonopy band.yaml (phonopy run on the ES geometry; "
+    "default ./band.yaml).",
+)
+@click.option(
+    "--band_hdf5",
+    default=None,
+    type=click.Path(exists=True),
+    help="Excited-state phonopy band/mesh/qpoints.hdf5 to read instead of band.yaml "
+    "(Γ point only; masses from the neighbouring phonopy.yaml).",
 )
 @click.option(
     "--outcar_gs",
@@ -711,6 +825,7 @@ def absorption_displacement(
 )
 def absorption_force(
     band_yaml,
+    band_hdf5,
     outcar_gs,
     outcar_es,
     out_dir,
@@ -727,7 +842,6 @@ def absorption_force(
     max_freq,
 ):
     """Run photoabsorption calculations using force-difference vectors (Force Mode)."""
-    from defectpl.phonon import read_band_yaml
     from defectpl.io.vasp import prepare_dF_files
     from defectpl.defectpl import Photoabsorption
     from monty.serialization import dumpfn
@@ -735,7 +849,7 @@ def absorption_force(
     try:
         sigma = _parse_sigma(sigma_str)
         click.echo("Initializing photoabsorption calculation via Force Mode...")
-        frequencies, eigenvectors, masses = read_band_yaml(band_yaml)
+        frequencies, eigenvectors, masses = _read_phonon_input(band_yaml, band_hdf5)
         dF = prepare_dF_files(outcar_gs, outcar_es)
 
         abs_engine = Photoabsorption(
@@ -1130,6 +1244,7 @@ def plot_individual(json_file, plot_type, out_dir, fmt, iylim, max_freq):
                 out_dir=out_dir,
                 iylim=parsed_iylim,
                 fig_format=fmt,
+                energies=pl_engine.energies,
             )
 
         if pt in ("absorption", "all"):
@@ -1148,6 +1263,7 @@ def plot_individual(json_file, plot_type, out_dir, fmt, iylim, max_freq):
                 plot=False,
                 out_dir=out_dir,
                 fig_format=fmt,
+                energies=pl_engine.energies,
             )
 
     except Exception as exc:
@@ -1172,10 +1288,17 @@ def plot_individual(json_file, plot_type, out_dir, fmt, iylim, max_freq):
 @click.option(
     "--abs",
     "abs_json",
-    required=True,
+    default=None,
     type=click.Path(exists=True),
     help="Path to a serialized Photoabsorption JSON file.",
 )
+@click.option(
+    "--mirror",
+    is_flag=True,
+    default=False,
+    help="Derive the absorption from the PL generating function (mirror image, "
+    "no --abs needed) and report the Stokes shift.",
+)
 @click.option(
     "--out_dir",
     default="./",
@@ -1191,21 +1314,30 @@ def plot_individual(json_file, plot_type, out_dir, fmt, iylim, max_freq):
     default=None,
     help="Comma-separated y-axis limits for the overlay plot (e.g., '0,1.2').",
 )
-def overlay(pl_json, abs_json, out_dir, fmt, iylim):
+def overlay(pl_json, abs_json, mirror, out_dir, fmt, iylim):
     """Overlay PL emission and photoabsorption spectra on a single plot.
 
     Loads a Photoluminescence JSON (GS phonons) and a Photoabsorption JSON
     (ES phonons) and calls plot_pl_absorption_vs_penergy to render both on
-    a shared energy axis.
+    a shared energy axis.  With --mirror the absorption is instead obtained
+    from the same generating function as the PL (one FFT for both spectra).
 
     \b
     Example:
       defectpl overlay --pl pl.json --abs abs.json --out_dir figs/ --fmt png
+      defectpl overlay --pl pl.json --mirror
     """
-    from defectpl.defectpl import Photoluminescence, Photoabsorption
+    from defectpl.defectpl import (
+        Photoabsorption,
+        Photoluminescence,
+        PhotoluminescenceAbsorption,
+    )
     from defectpl.plot import Plotter
     from monty.serialization import loadfn
 
+    if mirror == (abs_json is not None):
+        raise click.UsageError("Give exactly one of --abs and --mirror.")
+
     try:
         click.echo(f"Loading PL JSON: {pl_json}")
         pl_engine = loadfn(pl_json)
@@ -1214,10 +1346,17 @@ def overlay(pl_json, abs_json, out_dir, fmt, iylim):
                 f"'{pl_json}' does not contain a Photoluminescence object."
             )
 
-        click.echo(f"Loading absorption JSON: {abs_json}")
-        abs_engine = loadfn(abs_json)
-        if not isinstance(abs_engine, Photoabsorption):
-            raise ValueError(f"'{abs_json}' does not contain a Photoabsorption object.")
+        if mirror:
+            pl_engine = PhotoluminescenceAbsorption.from_photoluminescence(pl_engine)
+            abs_engine = pl_engine
+            click.echo(f"Stokes shift: {pl_engine.stokes_shift:.4f} eV")
+        else:
+            click.echo(f"Loading absorption JSON: {abs_json}")
+            abs_engine = loadfn(abs_json)
+            if not isinstance(abs_engine, Photoabsorption):
+                raise ValueError(
+                    f"'{abs_json}' does not contain a Photoabsorption object."
+                )
 
         plotter = Plotter()
         iplot_xlim = (
@@ -1236,6 +1375,8 @@ def overlay(pl_json, abs_json, out_dir, fmt, iylim):
             plot=False,
             out_dir=out_dir,
             fig_format=fmt,
+            energies=pl_engine.energies,
+            abs_energies=abs_engine.energies,
         )
         click.echo(f"Overlay plot written to {out_dir}")
     except Exception as exc:
@@ -1630,7 +1771,15 @@ def compare_json(files, xmin, xmax, legends, out_dir, fmt):
     default="compare_yaml_intensity.pdf",
     help="Output plot filename template destination.",
 )
-def compare_yaml(yamls, gs, es, out_dir, ezpl, gamma, xmin, xmax, file_name):
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=int,
+    show_default=True,
+    help="Worker processes parsing band.yaml files in parallel (0 = all cores).",
+)
+def compare_yaml(yamls, gs, es, out_dir, ezpl, gamma, xmin, xmax, file_name, jobs):
     """Dynamically compile, build, and plot comparative intensities for lists of phonopy inputs configurations."""
     from pymatgen.core import Structure
     from defectpl.io.vasp import run_dynamic_yaml_comparison
@@ -1650,6 +1799,7 @@ def compare_yaml(yamls, gs, es, out_dir, ezpl, gamma, xmin, xmax, file_name):
             xmin=xmin,
             xmax=xmax,
             file_name=file_name,
+            jobs=jobs,
         )
         click.echo(
             f"Dynamic execution spectra comparison chart saved successfully to {out_path}."
@@ -1900,9 +2050,47 @@ def ksplot(eigenval, vbm, cbm, espan, kidx, out_img, out_json):
         )
 
 
+# =====================================================================
+# PARSED-DATA CACHE COMMANDS
+# =====================================================================
+
+
+@click.group(name="cache")
+def cache_group():
+    """Inspect and clear the on-disk cache of parsed band.yaml files."""
+    pass
+
+
+@cache_group.command(name="info")
+def cache_info_cmd():
+    """Show the cache directory, number of entries and size."""
+    from defectpl.cache import cache_info
+
+    info = cache_info()
+    click.echo(f"Directory : {info['directory']}")
+    click.echo(f"Enabled   : {'yes' if info['enabled'] else 'no (DEFECTPL_CACHE=0)'}")
+    click.echo(f"Entries   : {info['entries']}")
+    click.echo(
+        f"Size      : {info['size_bytes'] / 2**20:.1f} MiB "
+        f"(cap {info['max_bytes'] / 2**20:.0f} MiB)"
+    )
+
+
+@cache_group.command(name="clear")
+def cache_clear_cmd():
+    """Delete every cached entry."""
+    from defectpl.cache import clear_cache
+
+    removed = clear_cache()
+    click.echo(f"Removed {removed} cache entr{'y' if removed == 1 else 'ies'}.")
+
+
 # Link the nested PL group structure into our root application workspace
 main.add_command(pl_group)
 
+# Link the cache group into the root application workspace
+main.add_command(cache_group)
+
 # Link the absorption group into the root application workspace
 main.add_command(absorption_group)
 
@@ -4,6 +4,7 @@ defectpl.core — code-agnostic data containers and type definitions.
 
 Sub-modules
 -----------
+lazy          Cached, dependency-tracked properties for the lineshape engines.
 structures    PhononData and EigenvalData dataclasses.
 types         TypedDict definitions for structured dictionaries.
 """
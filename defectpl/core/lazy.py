@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Cached, dependency-tracked attributes for the lineshape engines.
+
+A :class:`lazy_property` is computed on first access and cached on the
+instance.  Each one declares the attributes it is computed from, which gives
+the owning class an explicit dependency graph.  :class:`LazyGraphMixin` uses
+that graph to drop, on every attribute assignment, exactly the cached values
+that depend (directly or transitively) on the attribute that changed; they are
+recomputed on their next access and nothing else is touched.
+
+Example
+-------
+>>> class Engine(LazyGraphMixin):
+...     def __init__(self, x):
+...         self.x = x
+...     @lazy_property("x")
+...     def y(self):
+...         return 2 * self.x
+...     @lazy_property("y")
+...     def z(self):
+...         return self.y + 1
+>>> e = Engine(1)
+>>> e.z
+3
+>>> e.x = 5          # invalidates y and z only
+>>> e.z
+11
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator, Set
+
+_CACHE = "_lazy_cache"
+
+
+class lazy_property:
+    """
+    Decorator turning a method into a cached attribute with declared inputs.
+
+    Parameters
+    ----------
+    *depends_on : str
+        Names of the instance attributes (plain inputs or other
+        :class:`lazy_property` nodes) the value is computed from.
+
+    Notes
+    -----
+    Assigning to a lazy property stores the value in the cache as if it had
+    been computed, which is how deserialisation restores stored results.
+    """
+
+    def __init__(self, *depends_on: str):
+        self.depends_on = depends_on
+        self.fn: Callable = None
+        self.name: str = None
+
+    def __call__(self, fn: Callable) -> "lazy_property":
+        self.fn = fn
+        self.__doc__ = fn.__doc__
+        return self
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        cache = obj.__dict__.setdefault(_CACHE, {})
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.fn(obj)
+            return value
+
+    def __set__(self, obj, value):
+        obj.__dict__.setdefault(_CACHE, {})[self.name] = value
+
+
+class LazyGraphMixin:
+    """
+    Invalidate dependent :class:`lazy_property` values on attribute assignment.
+    """
+
+    @classmethod
+    def _lazy_nodes(cls) -> Iterator[lazy_property]:
+        """Yield every :class:`lazy_property` defined on the class or its bases."""
+        seen = set()
+        for klass in cls.__mro__:
+            for name, attr in vars(klass).items():
+                if isinstance(attr, lazy_property) and name not in seen:
+                    seen.add(name)
+                    yield attr
+
+    @classmethod
+    def _lazy_dependents(cls) -> Dict[str, Set[str]]:
+        """Map each attribute name to the lazy properties computed directly from it."""
+        graph = cls.__dict__.get("_lazy_graph")
+        if graph is None:
+            graph = {}
+            for node in cls._lazy_nodes():
+                for dep in node.depends_on:
+                    graph.setdefault(dep, set()).add(node.name)
+            cls._lazy_graph = graph
+        return graph
+
+    def _invalidate(self, name: str) -> Set[str]:
+        """Drop every cached value downstream of *name*; return their names."""
+        cache = self.__dict__.get(_CACHE)
+        graph = self._lazy_dependents()
+        stale, stack = set(), list(graph.get(name, ()))
+        while stack:
+            node = stack.pop()
+            if node in stale:
+                continue
+            stale.add(node)
+            stack.extend(graph.get(node, ()))
+        if cache:
+            for node in stale:
+                cache.pop(node, None)
+        return stale
+
+    def is_computed(self, name: str) -> bool:
+        """Return whether the lazy property *name* currently holds a cached value."""
+        return name in self.__dict__.get(_CACHE, {})
+
+    def __setattr__(self, name: str, value):
+        self._invalidate(name)
+        super().__setattr__(name, value)
@@ -10,10 +10,20 @@ They carry no DFT-code-specific logic and require no optional dependencies.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 
+# File names of the on-disk layout written by PhononData.save_npy
+NPY_FILES = {
+    "frequencies": "frequencies.npy",
+    "eigenvectors": "eigenvectors.npy",
+    "masses": "masses.npy",
+}
+NPY_META = "meta.json"
+
 
 @dataclass
 class PhononData:
@@ -34,6 +44,16 @@ class PhononData:
         Number of phonon modes (usually 3 × natoms).
     meta : dict
         Arbitrary metadata (source file, code name, etc.).
+
+    Notes
+    -----
+    For large supercells the eigenvector tensor (``3N × N × 3`` doubles, about
+    200 MB for 1000 atoms) need not be held in memory: write the data once
+    with :meth:`save_npy` (or convert a band.yaml directly with
+    :func:`~defectpl.phonon.band_yaml_to_npy`) and reopen it with
+    :meth:`load_npy`, which memory-maps ``eigenvectors.npy``.  A memory-mapped
+    ``float64`` array is kept as is, and the projections in
+    :mod:`defectpl.utils` read it in blocks of modes.
     """
 
     frequencies: np.ndarray
@@ -45,7 +65,8 @@ class PhononData:
 
     def __post_init__(self) -> None:
         self.frequencies = np.asarray(self.frequencies, dtype=float)
-        self.eigenvectors = np.asarray(self.eigenvectors, dtype=float)
+        # asanyarray keeps a float64 np.memmap mapped instead of reading it
+        self.eigenvectors = np.asanyarray(self.eigenvectors, dtype=float)
         self.masses = np.asarray(self.masses, dtype=float)
 
     @property
@@ -53,6 +74,75 @@ class PhononData:
         """Return ``(frequencies, eigenvectors, masses)`` for legacy callers."""
         return (self.frequencies, self.eigenvectors, self.masses)
 
+    @property
+    def is_memmapped(self) -> bool:
+        """``True`` when the eigenvectors are a memory-mapped file."""
+        return isinstance(self.eigenvectors, np.memmap)
+
+    def save_npy(self, directory: Union[str, Path]) -> Path:
+        """
+        Write the arrays as ``.npy`` files (plus ``meta.json``) to *directory*.
+
+        The directory is created if needed.  Reopen it with :meth:`load_npy`.
+
+        Returns
+        -------
+        pathlib.Path
+            The directory written to.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, filename in NPY_FILES.items():
+            np.save(directory / filename, getattr(self, name))
+        (directory / NPY_META).write_text(json.dumps(self.meta, default=str))
+        return directory
+
+    @classmethod
+    def load_npy(
+        cls, directory: Union[str, Path], mmap_mode: Optional[str] = "r"
+    ) -> "PhononData":
+        """
+        Open phonon data written by :meth:`save_npy`.
+
+        Parameters
+        ----------
+        directory : str or Path
+            Directory holding ``frequencies.npy``, ``eigenvectors.npy`` and
+            ``masses.npy``.
+        mmap_mode : {'r', 'r+', 'c', None}, optional
+            Memory-map mode of ``eigenvectors.npy`` (see :func:`numpy.load`).
+            Default ``'r'`` maps the file read-only, so only the pages that
+            are touched are read from disk; ``None`` loads it into memory.
+
+        Raises
+        ------
+        FileNotFoundError
+            If one of the ``.npy`` files is missing.
+        ValueError
+            If the array shapes do not agree.
+        """
+        directory = Path(directory)
+        frequencies = np.load(directory / NPY_FILES["frequencies"])
+        masses = np.load(directory / NPY_FILES["masses"])
+        eigenvectors = np.load(
+            directory / NPY_FILES["eigenvectors"], mmap_mode=mmap_mode
+        )
+        if eigenvectors.shape != (len(frequencies), len(masses), 3):
+            raise ValueError(
+                f"eigenvectors.npy has shape {eigenvectors.shape}, expected "
+                f"({len(frequencies)}, {len(masses)}, 3)."
+            )
+        meta_path = directory / NPY_META
+        meta = json.loads(meta_path.read_text()) if meta_path.is_file() else {}
+        return cls(
+            frequencies=frequencies,
+            eigenvectors=eigenvectors,
+            masses=masses,
+            natoms=len(masses),
+            nmodes=len(frequencies),
+            meta=meta,
+        )
+
 
 @dataclass
 class EigenvalData:
@@ -6,7 +6,8 @@ Authors: Shibu Meher, Manoj Dey
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+import itertools
 import json
 from pathlib import Path
 from shutil import copyfile
@@ -21,13 +22,502 @@ if TYPE_CHECKING:
     from pymatgen.core import Structure
 
 from defectpl.constants import AMU2KG, ANG2M, EV2J, HBAR_EVS
+from defectpl.core.lazy import LazyGraphMixin, lazy_property
+from defectpl.fft import get_fft_backend, validate_fft_backend
 from defectpl.plot import Plotter
 import defectpl.utils as utils
 from defectpl.io.vasp import calc_delta_Q, get_q_from_structure
 
 
 @dataclass
-class Photoluminescence(MSONable):
+class LineshapeSweep:
+    """
+    Batch of lineshapes produced by :meth:`Photoluminescence.sweep`.
+
+    Row ``i`` of every array belongs to the parameter combination
+    ``(EZPL[i], gamma[i], sigma[i], temperature[i])``.
+
+    Parameters
+    ----------
+    EZPL : numpy.ndarray, shape (nparams,)
+        Zero-phonon line energy of each row in **eV**.
+    gamma : numpy.ndarray, shape (nparams,)
+        ZPL broadening of each row in **meV**.
+    sigma : list
+        Gaussian broadening of each row in **eV** (float or ``(low, high)``).
+    temperature : numpy.ndarray, shape (nparams,)
+        Lattice temperature of each row in **Kelvin**.
+    C_total : numpy.ndarray, shape (nparams,)
+        Zero-time thermal correction :math:`C(0,T)` of each row.
+    energies : numpy.ndarray, shape (npoints,)
+        Photon energy axis shared by all rows in **eV**.
+    A_line : numpy.ndarray, shape (nparams, npoints)
+        Complex optical spectral function of each row.
+    intensity : numpy.ndarray, shape (nparams, npoints)
+        PL intensity of each row on the ``energies`` axis.
+    """
+
+    EZPL: np.ndarray
+    gamma: np.ndarray
+    sigma: List[Union[float, Tuple[float, float]]]
+    temperature: np.ndarray
+    C_total: np.ndarray
+    energies: np.ndarray
+    A_line: np.ndarray
+    intensity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.EZPL)
+
+    @property
+    def parameters(self) -> List[Dict[str, object]]:
+        """Parameter combination of each row as a list of dictionaries."""
+        return [
+            {
+                "EZPL": float(self.EZPL[i]),
+                "gamma": float(self.gamma[i]),
+                "sigma": self.sigma[i],
+                "temperature": float(self.temperature[i]),
+            }
+            for i in range(len(self))
+        ]
+
+
+def _sweep_values(value) -> list:
+    """Normalise a sweep argument (scalar or sequence) to a list of values."""
+    if isinstance(value, np.ndarray) and value.ndim == 0:
+        return [value.item()]
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return list(value)
+    return [value]
+
+
+def _sigma_key(sigma) -> Union[float, Tuple[float, float]]:
+    """Hashable form of a broadening width (float or ``(low, high)`` pair)."""
+    if np.ndim(sigma) == 0:
+        return float(sigma)
+    return tuple(float(s) for s in sigma)
+
+
+class _LineshapeEngine(LazyGraphMixin):
+    """
+    Lazily evaluated pipeline shared by :class:`Photoluminescence` and
+    :class:`Photoabsorption`.
+
+    Every derived attribute is a :class:`~defectpl.core.lazy.lazy_property`
+    computed on first access and cached.  Each declares the attributes it is
+    computed from; assigning an input (directly or through :meth:`update`)
+    drops only the cached values downstream of it.  Changing ``gamma``
+    therefore invalidates ``Gts`` and the spectrum, changing ``temperature``
+    the thermal branch (``nks``, ``C_omega``, ``Cts``, ``C_total``) and what
+    follows, while ``qks``, ``Sks``, the IPRs and S(ω) stay cached.
+    """
+
+    _ARRAY_INPUTS = ("frequencies", "eigenvectors", "masses", "dR", "dF")
+
+    def __post_init__(self):
+        for name in self._ARRAY_INPUTS:
+            setattr(self, name, self._coerce_input(name, getattr(self, name)))
+        self._validate_inputs()
+
+    @property
+    def _real_dtype(self) -> type:
+        """Floating-point type of the spectral pipeline for ``precision``."""
+        return np.float32 if self.precision == "single" else np.float64
+
+    @property
+    def _fft(self):
+        """FFT backend of this engine (the global default unless overridden)."""
+        return get_fft_backend(self.fft_backend, self.fft_workers)
+
+    def _working(self, x: np.ndarray) -> np.ndarray:
+        """Cast a per-mode array to the pipeline precision."""
+        return np.asarray(x, dtype=self._real_dtype)
+
+    def _coerce_input(self, name: str, value):
+        """Normalise array and window inputs (``None`` passes through)."""
+        if isinstance(value, np.memmap):
+            # Never read a mapped file as a whole; the projections stream it
+            return value
+        if name == "eigenvectors" and value is not None:
+            return self._working(value)
+        if name in self._ARRAY_INPUTS and value is not None:
+            return np.asarray(value)
+        if name == "energy_window" and value is not None:
+            return tuple(float(e) for e in value)
+        return value
+
+    def _validate_inputs(self):
+        validate_fft_backend(self.fft_backend)
+        if self.precision not in ("double", "single"):
+            raise ValueError(
+                f"precision must be 'double' or 'single', got {self.precision!r}."
+            )
+        if self.st_method not in ("fft", "direct"):
+            raise ValueError(
+                f"st_method must be 'fft' or 'direct', got {self.st_method!r}."
+            )
+        if not (
+            (self.dF is not None and np.any(self.dF))
+            or (self.dR is not None and np.any(self.dR))
+        ):
+            raise ValueError(
+                "Either dR or dF must be provided and non-zero to compute qks."
+            )
+        if self.energy_window is not None:
+            if len(self.energy_window) != 2 or not (
+                self.energy_window[0] < self.energy_window[1]
+            ):
+                raise ValueError(
+                    f"energy_window must be (emin, emax) with emin < emax, "
+                    f"got {self.energy_window!r}."
+                )
+
+    def update(self, **inputs):
+        """
+        Change one or more inputs, invalidating only what depends on them.
+
+        Parameters
+        ----------
+        **inputs
+            New values for constructor inputs, e.g. ``gamma=5.0`` or
+            ``temperature=300.0``.
+
+        Returns
+        -------
+        self
+            The same engine, so calls can be chained:
+            ``pl.update(gamma=5.0).intensity``.
+
+        Raises
+        ------
+        TypeError
+            If a name is not a constructor input.
+
+        Notes
+        -----
+        Stale attributes are recomputed on their next access, so only the
+        part of the pipeline that is actually read again is re-evaluated.
+        """
+        names = {f.name for f in fields(self)}
+        unknown = sorted(set(inputs) - names)
+        if unknown:
+            raise TypeError(f"update() got unknown input(s): {', '.join(unknown)}")
+        if "precision" in inputs:
+            # Set first so the eigenvectors are stored in the new precision
+            self.precision = inputs.pop("precision")
+            inputs.setdefault("eigenvectors", self.eigenvectors)
+        for name, value in inputs.items():
+            setattr(self, name, self._coerce_input(name, value))
+        self._validate_inputs()
+        return self
+
+    def compute_properties(self):
+        """
+        Evaluate every derived attribute now instead of on first access.
+
+        With ``st_method='direct'`` the energy-grid densities ``S_omega`` and
+        ``C_omega`` are left to be built on demand.
+        """
+        skip = ("S_omega", "C_omega") if self.st_method == "direct" else ()
+        for node in self._lazy_nodes():
+            if node.name not in skip:
+                getattr(self, node.name)
+
+    # Properties that depend only on the phonon set (and the common inputs),
+    # shared by every engine built by from_configurations()
+    _PHONON_ONLY = ("natoms", "iprs", "iprs_alkauskas", "localization_ratio", "nks")
+
+    @classmethod
+    def from_configurations(
+        cls,
+        frequencies: np.ndarray,
+        eigenvectors: np.ndarray,
+        masses: np.ndarray,
+        EZPL,
+        dR: Optional[np.ndarray] = None,
+        dF: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> List[_LineshapeEngine]:
+        """
+        Build one engine per displacement (or force) vector of a stack.
+
+        All configurations share one phonon set.  Their q\\ :sub:`k` come from
+        a single GEMM against the ``(nmodes, 3 natoms)`` eigenvector matrix
+        (:func:`~defectpl.utils.calc_qks_batch` /
+        :func:`~defectpl.utils.calc_qks_force_batch`), the eigenvectors are
+        stored once and shared, and the properties that depend only on the
+        phonons (``iprs``, ``iprs_alkauskas``, ``localization_ratio``,
+        ``nks``) are computed once and cached on every engine.
+
+        Parameters
+        ----------
+        frequencies, eigenvectors, masses
+            Phonon set, as for the constructor.
+        EZPL : float or sequence of float
+            ZPL energy in **eV**, shared or one per configuration.
+        dR : numpy.ndarray, shape (nconfigs, natoms, 3), optional
+            Stack of displacement vectors in **Å**.
+        dF : numpy.ndarray, shape (nconfigs, natoms, 3), optional
+            Stack of force differences in **eV/Å**.  Takes priority over
+            *dR*, as in the constructor.
+        **kwargs
+            Any other constructor input (``sigma``, ``temperature``,
+            ``precision``, ...), applied to every configuration.
+
+        Returns
+        -------
+        list of Photoluminescence or Photoabsorption
+            One engine of the calling class per configuration, in stack order.
+
+        Raises
+        ------
+        ValueError
+            If neither stack is given, a stack is not ``(nconfigs, natoms, 3)``,
+            the stacks differ in length, or *EZPL* has the wrong length.
+
+        Examples
+        --------
+        >>> dRs = np.stack([np.load(f"dR_{m}.npy") for m in ("gs", "zpl", "ems")])
+        >>> engines = Photoluminescence.from_configurations(
+        ...     freqs, evecs, masses, EZPL=1.945, dR=dRs
+        ... )
+        >>> [pl.HR_factor for pl in engines]
+        """
+        masses = np.asarray(masses)
+        frequencies = np.asarray(frequencies)
+        stacks = {}
+        for name, stack in (("dR", dR), ("dF", dF)):
+            if stack is None:
+                continue
+            stack = np.asarray(stack)
+            if stack.ndim != 3 or stack.shape[1:] != (len(masses), 3):
+                raise ValueError(
+                    f"{name} must have shape (nconfigs, {len(masses)}, 3), "
+                    f"got {stack.shape}."
+                )
+            stacks[name] = stack
+        if not stacks:
+            raise ValueError("from_configurations() needs a dR or dF stack.")
+        nconf = {len(stack) for stack in stacks.values()}
+        if len(nconf) != 1:
+            raise ValueError("dR and dF stacks must have the same length.")
+        nconf = nconf.pop()
+        ezpls = np.asarray(EZPL, dtype=float)
+        if ezpls.ndim == 0:
+            ezpls = np.full(nconf, float(ezpls))
+        elif ezpls.shape != (nconf,):
+            raise ValueError(
+                f"EZPL must be a scalar or have one value per configuration ({nconf})."
+            )
+
+        engines = []
+        for i in range(nconf):
+            engines.append(
+                cls(
+                    frequencies=frequencies,
+                    eigenvectors=(engines[0].eigenvectors if engines else eigenvectors),
+                    masses=masses,
+                    EZPL=float(ezpls[i]),
+                    dR=stacks["dR"][i] if "dR" in stacks else None,
+                    dF=stacks["dF"][i] if "dF" in stacks else None,
+                    **kwargs,
+                )
+            )
+        if not engines:
+            return engines
+
+        # Same rule as the qks property: a non-zero force row wins over dR
+        first = engines[0]
+        w_masses = first._working(masses)
+        qks = np.zeros((nconf, len(frequencies)))
+        force_rows = np.zeros(nconf, dtype=bool)
+        if "dF" in stacks:
+            force_rows = np.any(stacks["dF"].reshape(nconf, -1), axis=1)
+            if force_rows.any():
+                qks[force_rows] = utils.calc_qks_force_batch(
+                    w_masses,
+                    first._working(stacks["dF"][force_rows]),
+                    first.eigenvectors,
+                    frequencies,
+                )
+        if not force_rows.all():
+            qks[~force_rows] = utils.calc_qks_batch(
+                w_masses,
+                first._working(stacks["dR"][~force_rows]),
+                first.eigenvectors,
+            )
+        for eng, row in zip(engines, qks):
+            eng.qks = row
+            for name in cls._PHONON_ONLY:
+                setattr(eng, name, getattr(first, name))
+        return engines
+
+    def _restore(self, d: dict, name: str, array: bool = False, dtype=None):
+        """Seed the cache of *name* from a serialised dict when a value is stored."""
+        value = d.get(name)
+        if value is not None:
+            setattr(self, name, np.array(value, dtype=dtype) if array else value)
+
+    @lazy_property("masses")
+    def natoms(self) -> int:
+        return len(self.masses)
+
+    @lazy_property("max_energy", "resolution", "auto_grid")
+    def omega_range(self) -> List[Union[float, int]]:
+        npts = int(self.max_energy * self.resolution)
+        if not self.auto_grid:
+            return [0.0, self.max_energy, npts]
+        # Extend the axis to the next fast FFT length at the same spacing
+        npts = utils.next_fast_len(npts)
+        return [0.0, npts / self.resolution, npts]
+
+    @lazy_property("omega_range", "resolution", "energy_window")
+    def energies(self) -> np.ndarray:
+        idx = utils.energy_window_indices(
+            self.omega_range[2], self.resolution, self.energy_window
+        )
+        return idx / float(self.resolution)
+
+    @lazy_property("dR")
+    def delR(self) -> float:
+        return utils.calc_delR(self.dR) if self.dR is not None else 0.0
+
+    @lazy_property("masses", "dR")
+    def delQ(self) -> float:
+        return utils.calc_delQ(self.masses, self.dR) if self.dR is not None else 0.0
+
+    @lazy_property("masses", "dR", "dF", "eigenvectors", "frequencies", "precision")
+    def qks(self) -> np.ndarray:
+        # The projection runs in the eigenvector precision; q_k (~1e-24 in SI
+        # units) is returned in float64 so that S_k ∝ q_k² cannot underflow.
+        masses = self._working(self.masses)
+        if self.dF is not None and np.any(self.dF):
+            qks = utils.calc_qks_force_vectorized(
+                masses, self._working(self.dF), self.eigenvectors, self.frequencies
+            )
+        elif self.dR is not None and np.any(self.dR):
+            qks = utils.calc_qks_vectorized(
+                masses, self._working(self.dR), self.eigenvectors
+            )
+        else:
+            raise ValueError(
+                "Either dR or dF must be provided and non-zero to compute qks."
+            )
+        return np.asarray(qks, dtype=float)
+
+    @lazy_property("qks", "frequencies")
+    def Sks(self) -> np.ndarray:
+        return utils.calc_Sks(self.qks, self.frequencies)
+
+    @lazy_property("Sks")
+    def HR_factor(self) -> float:
+        return float(np.sum(self.Sks))
+
+    @lazy_property("HR_factor")
+    def DW_factor(self) -> float:
+        return float(np.exp(-self.HR_factor))
+
+    @lazy_property("eigenvectors")
+    def iprs(self) -> np.ndarray:
+        return utils.calc_IPR(self.eigenvectors)
+
+    @lazy_property("eigenvectors")
+    def iprs_alkauskas(self) -> np.ndarray:
+        return utils.calc_IPR_alkauskas(self.eigenvectors)
+
+    @lazy_property("natoms", "iprs")
+    def localization_ratio(self) -> np.ndarray:
+        return self.natoms * self.iprs
+
+    @lazy_property("frequencies", "qks")
+    def effective_phonon_freq(self) -> float:
+        return utils.calc_effective_phonon_frequency(self.frequencies, self.qks)
+
+    # Thermal branch
+    @lazy_property("frequencies", "temperature")
+    def nks(self) -> np.ndarray:
+        return utils.calc_phonon_occupation(self.frequencies, self.temperature)
+
+    @lazy_property("frequencies", "Sks", "nks", "omega_range", "sigma", "precision")
+    def C_omega(self) -> np.ndarray:
+        return utils.calc_C_omega(
+            self.frequencies,
+            self._working(self.Sks),
+            self._working(self.nks),
+            self.omega_range,
+            self.sigma,
+        )
+
+    @lazy_property(
+        "C_omega",
+        "frequencies",
+        "Sks",
+        "nks",
+        "omega_range",
+        "sigma",
+        "st_method",
+        "weight_cutoff",
+        "precision",
+    )
+    def Cts(self) -> np.ndarray:
+        if self.st_method == "direct":
+            return utils.calc_Ct_direct(
+                self.frequencies,
+                self._working(self.Sks),
+                self._working(self.nks),
+                self.omega_range,
+                self.sigma,
+                self.weight_cutoff,
+            )
+        return utils.calc_Ct(self.C_omega, backend=self._fft)
+
+    @lazy_property("nks", "Sks")
+    def C_total(self) -> float:
+        return utils.calc_C_total(self.nks, self.Sks)
+
+    # Spectral branch
+    @lazy_property("frequencies", "Sks", "omega_range", "sigma", "precision")
+    def S_omega(self) -> np.ndarray:
+        return utils.calc_S_omega(
+            self.frequencies, self._working(self.Sks), self.omega_range, self.sigma
+        )
+
+    @lazy_property(
+        "S_omega",
+        "frequencies",
+        "Sks",
+        "omega_range",
+        "sigma",
+        "st_method",
+        "weight_cutoff",
+        "precision",
+    )
+    def Sts(self) -> np.ndarray:
+        if self.st_method == "direct":
+            return utils.calc_St_direct(
+                self.frequencies,
+                self._working(self.Sks),
+                self.omega_range,
+                self.sigma,
+                self.weight_cutoff,
+            )
+        return utils.calc_St(self.S_omega, backend=self._fft)
+
+    @lazy_property("Sts", "HR_factor", "gamma", "resolution", "Cts", "C_total")
+    def Gts(self) -> np.ndarray:
+        return utils.calc_Gts(
+            self.Sts,
+            self.HR_factor,
+            self.gamma,
+            self.resolution,
+            Cts=self.Cts,
+            C_total=self.C_total,
+        )
+
+
+@dataclass
+class Photoluminescence(_LineshapeEngine, MSONable):
     """
     Core engine for first-principles photoluminescence lineshape calculations.
 
@@ -48,6 +538,10 @@ class Photoluminescence(MSONable):
         Phonon mode frequencies at the Γ point in **eV**.
     eigenvectors : numpy.ndarray, shape (nmodes, natoms, 3)
         Mass-normalised phonon displacement eigenvectors (real part only).
+        A :class:`numpy.memmap` (e.g. from
+        :meth:`~defectpl.core.structures.PhononData.load_npy`) is kept
+        mapped and streamed in blocks of modes by the projections, in its
+        stored dtype, so large supercells need not fit in memory.
     masses : numpy.ndarray, shape (natoms,)
         Atomic masses in atomic mass units (amu).
     EZPL : float
@@ -77,9 +571,52 @@ class Photoluminescence(MSONable):
         occupation :math:`\\bar{n}_k(T)`.  Pass 0 (default) to reproduce the
         T = 0 K limit where the thermal correction vanishes and the result
         is identical to the original Alkauskas (2014) formula.
+    st_method : {'fft', 'direct'}, optional
+        How S(t) and C(t, T) are obtained.  ``'fft'`` (default) broadens the
+        mode weights onto the energy grid and inverse-FFTs them.  ``'direct'``
+        evaluates the closed-form Gaussian-broadened sums on the time grid
+        (:func:`~defectpl.utils.calc_St_direct`), skipping S(ω), C(ω, T) and
+        the extra FFT; ``S_omega`` and ``C_omega`` are then only built if
+        accessed (e.g. by :meth:`generate_plots`).
+    weight_cutoff : float, optional
+        With ``st_method='direct'``, skip modes whose :math:`S_k` (or
+        :math:`\\bar{n}_k S_k` for C(t, T)) is at most ``weight_cutoff``
+        times the largest one, so a fine ``resolution`` stays cheap when
+        few modes couple.  Default 0.0 (keep every non-zero mode).
+    auto_grid : bool, optional
+        Round the number of grid points ``int(max_energy * resolution)`` up
+        to the next 5-smooth length (:func:`~defectpl.utils.next_fast_len`)
+        so that every FFT runs on a fast size.  The spacing ``1/resolution``
+        is kept and the energy axis is extended slightly past
+        ``max_energy``.  Default ``False``.
+    energy_window : (float, float), optional
+        ``(emin, emax)`` photon-energy window in **eV**.  When given, the
+        spectrum arrays hold only the grid points inside it (see
+        ``energies``), which keeps results and JSON files small.  Default
+        ``None`` (full grid).
+    precision : {'double', 'single'}, optional
+        Floating-point precision of the spectral pipeline.  ``'single'``
+        stores the eigenvectors as float32, runs the mode projection in
+        float32 and keeps S(ω), S(t), G(t) and the spectrum in
+        float32/complex64, halving their memory for high-throughput
+        screening; ``qks``, ``Sks`` and the HR factor stay float64.  See
+        Notes for the accuracy.  Default ``'double'``.
+    fft_backend : {'numpy', 'scipy', 'pyfftw'}, optional
+        FFT backend of this engine, including its :meth:`sweep` batches.
+        ``None`` (default) follows the global choice made with
+        :func:`defectpl.fft.set_fft_backend` at the time a spectrum is first
+        accessed (not at construction).  A runtime setting: it does not
+        change the results and is not serialised.
+    fft_workers : int, optional
+        Threads for the scipy and pyfftw backends.  ``None`` (default) uses
+        the global setting, or every core.
 
     Attributes
     ----------
+    All attributes below are lazy: each is computed on first access, cached,
+    and invalidated only when an input it depends on changes (see
+    :meth:`update`).
+
     natoms : int
         Number of atoms in the supercell.
     delR : float
@@ -125,6 +662,9 @@ class Photoluminescence(MSONable):
         Fourier transform of S(ω) used in the generating function.
     Gts : numpy.ndarray
         Generating function G(t) = exp[S(t) − S] · exp(−γ|t|).
+    energies : numpy.ndarray
+        Photon energy axis of ``A_line`` and ``intensity`` in **eV**
+        (restricted to ``energy_window`` when set).
     A_line : numpy.ndarray
         Photon energy axis for the lineshape in **eV**.
     intensity : numpy.ndarray
@@ -149,6 +689,16 @@ class Photoluminescence(MSONable):
     and :math:`S(t) = \\int_0^{\\infty} S(\\hbar\\omega)\\,
     e^{-i\\omega t}\\, d(\\hbar\\omega)`.
 
+    **Single precision.**  With ``precision='single'`` the rounding error of
+    the float32 pipeline grows like :math:`\\epsilon_{32}(S + \\log_2 N)`
+    (:math:`\\epsilon_{32} \\approx 6\\times10^{-8}`, N grid points).  For
+    S ≲ 100 the spectrum deviates from the double-precision result by less
+    than :math:`2\\times10^{-5}` of its peak, the HR factor by less than
+    :math:`10^{-6}` relative, and peak position and FWHM agree to the grid
+    spacing.  float32 overflows once the real part of the G(t) exponent
+    exceeds ≈ 88, which only happens for unphysically large HR factors
+    (S ≳ 300 on the default grid); use double precision there.
+
     References
     ----------
     Alkauskas, Buckley, Awschalom & Van de Walle,
@@ -168,6 +718,7 @@ class Photoluminescence(MSONable):
     ...     dR=dR,
     ... )
     >>> print(f"S = {pl.HR_factor:.3f},  DW = {pl.DW_factor:.4f}")
+    >>> spectrum = pl.update(gamma=5.0).intensity  # only G(t) is recomputed
     """
 
     # 1. Mandatory Core Inputs (No Default Values Allowed First)
@@ -190,100 +741,33 @@ class Photoluminescence(MSONable):
     )
     gamma: float = 2.0  # Homogeneous/inhomogeneous ZPL broadening factor
     temperature: float = 0.0  # Lattice temperature in K (0 = T=0 limit)
-
-    # Dependent calculated properties stored dynamically downstream
-    natoms: int = field(init=False)
-    delR: float = field(init=False, default=None)
-    delQ: float = field(init=False, default=None)
-    qks: np.ndarray = field(init=False, default=None)
-    Sks: np.ndarray = field(init=False, default=None)
-    HR_factor: float = field(init=False, default=None)
-    DW_factor: float = field(init=False, default=None)
-    iprs: np.ndarray = field(init=False, default=None)
-    iprs_alkauskas: np.ndarray = field(init=False, default=None)
-    localization_ratio: np.ndarray = field(init=False, default=None)
-    nks: np.ndarray = field(init=False, default=None)
-    C_omega: np.ndarray = field(init=False, default=None)
-    Cts: np.ndarray = field(init=False, default=None)
-    C_total: float = field(init=False, default=0.0)
-    effective_phonon_freq: float = field(init=False, default=None)
-    omega_range: List[Union[float, int]] = field(init=False, default=None)
-    S_omega: np.ndarray = field(init=False, default=None)
-    Sts: np.ndarray = field(init=False, default=None)
-    Gts: np.ndarray = field(init=False, default=None)
-    A_line: np.ndarray = field(init=False, default=None)
-    intensity: np.ndarray = field(init=False, default=None)
-
-    def __post_init__(self):
-        self.frequencies = np.asarray(self.frequencies)
-        self.eigenvectors = np.asarray(self.eigenvectors)
-        self.masses = np.asarray(self.masses)
-        if self.dR is not None:
-            self.dR = np.asarray(self.dR)
-        if self.dF is not None:
-            self.dF = np.asarray(self.dF)
-
-        self.natoms = len(self.masses)
-        self.omega_range = [
-            0.0,
-            self.max_energy,
-            int(self.max_energy * self.resolution),
-        ]
-        self.compute_properties()
-
-    def compute_properties(self):
-        """Run the full calculation pipeline and populate all derived attributes."""
-        self.delR = utils.calc_delR(self.dR) if self.dR is not None else 0.0
-        self.delQ = (
-            utils.calc_delQ(self.masses, self.dR) if self.dR is not None else 0.0
+    st_method: str = "fft"  # S(t)/C(t,T) route: "fft" (energy grid) or "direct"
+    weight_cutoff: float = 0.0  # "direct": skip modes with S_k <= cutoff * max
+    auto_grid: bool = False  # Round the grid up to a 5-smooth (fast) FFT length
+    energy_window: Optional[Tuple[float, float]] = None  # (emin, emax) kept, eV
+    precision: str = "double"  # "double" (float64) or "single" (float32/complex64)
+    fft_backend: Optional[str] = None  # "numpy"/"scipy"/"pyfftw"; None = global
+    fft_workers: Optional[int] = None  # FFT threads (scipy/pyfftw); None = all
+
+    # Spectrum (derived properties shared with Photoabsorption live on
+    # _LineshapeEngine as lazy, dependency-tracked attributes)
+    @lazy_property("Gts", "EZPL", "resolution", "energy_window")
+    def _spectrum(self) -> Tuple[np.ndarray, np.ndarray]:
+        return utils.calc_Spectrum_Intensity(
+            self.Gts,
+            self.EZPL,
+            self.resolution,
+            energy_window=self.energy_window,
+            backend=self._fft,
         )
 
-        if self.dF is not None and np.any(self.dF):
-            self.qks = utils.calc_qks_force_vectorized(
-                self.masses, self.dF, self.eigenvectors, self.frequencies
-            )
-        elif self.dR is not None and np.any(self.dR):
-            self.qks = utils.calc_qks_vectorized(
-                self.masses, self.dR, self.eigenvectors
-            )
-        else:
-            raise ValueError(
-                "Either dR or dF must be provided and non-zero to compute qks."
-            )
-
-        self.Sks = utils.calc_Sks(self.qks, self.frequencies)
-        self.HR_factor = float(np.sum(self.Sks))
-        self.DW_factor = float(np.exp(-self.HR_factor))
-
-        self.iprs = utils.calc_IPR(self.eigenvectors)
-        self.iprs_alkauskas = utils.calc_IPR_alkauskas(self.eigenvectors)
-        self.localization_ratio = self.natoms * self.iprs
-
-        self.nks = utils.calc_phonon_occupation(self.frequencies, self.temperature)
-        self.C_omega = utils.calc_C_omega(
-            self.frequencies, self.Sks, self.nks, self.omega_range, self.sigma
-        )
-        self.Cts = utils.calc_Ct(self.C_omega)
-        self.C_total = utils.calc_C_total(self.nks, self.Sks)
-        self.effective_phonon_freq = utils.calc_effective_phonon_frequency(
-            self.frequencies, self.qks
-        )
+    @lazy_property("_spectrum")
+    def A_line(self) -> np.ndarray:
+        return self._spectrum[0]
 
-        self.S_omega = utils.calc_S_omega(
-            self.frequencies, self.Sks, self.omega_range, self.sigma
-        )
-        self.Sts = utils.calc_St(self.S_omega)
-        self.Gts = utils.calc_Gts(
-            self.Sts,
-            self.HR_factor,
-            self.gamma,
-            self.resolution,
-            Cts=self.Cts,
-            C_total=self.C_total,
-        )
-        self.A_line, self.intensity = utils.calc_Spectrum_Intensity(
-            self.Gts, self.EZPL, self.resolution
-        )
+    @lazy_property("_spectrum")
+    def intensity(self) -> np.ndarray:
+        return self._spectrum[1]
 
     def as_dict(self) -> dict:
         """
@@ -308,6 +792,13 @@ class Photoluminescence(MSONable):
             "max_energy": self.max_energy,
             "sigma": list(self.sigma) if hasattr(self.sigma, "__len__") else self.sigma,
             "temperature": self.temperature,
+            "st_method": self.st_method,
+            "weight_cutoff": self.weight_cutoff,
+            "auto_grid": self.auto_grid,
+            "precision": self.precision,
+            "energy_window": (
+                list(self.energy_window) if self.energy_window is not None else None
+            ),
             # Safe Real-Valued Computed Properties
             "natoms": self.natoms,
             "delR": float(self.delR) if hasattr(self.delR, "__float__") else self.delR,
@@ -336,7 +827,7 @@ class Photoluminescence(MSONable):
                 else None
             ),
             "nks": self.nks.tolist() if self.nks is not None else None,
-            "C_omega": self.C_omega.tolist() if self.C_omega is not None else None,
+            "C_omega": self.C_omega.tolist() if self.st_method == "fft" else None,
             "C_total": float(self.C_total),
             "effective_phonon_freq": (
                 float(self.effective_phonon_freq)
@@ -344,7 +835,7 @@ class Photoluminescence(MSONable):
                 else None
             ),
             "omega_range": self.omega_range,
-            "S_omega": self.S_omega.tolist() if self.S_omega is not None else None,
+            "S_omega": self.S_omega.tolist() if self.st_method == "fft" else None,
             # Drop complex/spectral arrays — cheaply recomputed by from_dict
             "Sts": None,
             "Gts": None,
@@ -360,14 +851,14 @@ class Photoluminescence(MSONable):
 
         Core inputs and real-valued computed properties are loaded directly;
         complex arrays (``Sts``, ``Gts``) and the intensity spectrum are
-        recomputed on the fly from the stored S(ω).
+        recomputed from the stored S(ω) on first access.
         """
-        # Create an uninitialized instance to handle assignment without tripping standard __post_init__ loops
         obj = cls.__new__(cls)
 
         # Load Core Inputs
+        obj.precision = d.get("precision", "double")
         obj.frequencies = np.array(d["frequencies"])
-        obj.eigenvectors = np.array(d["eigenvectors"])
+        obj.eigenvectors = obj._coerce_input("eigenvectors", d["eigenvectors"])
         obj.masses = np.array(d["masses"])
         obj.dR = np.array(d["dR"]) if d.get("dR") is not None else None
         obj.dF = np.array(d["dF"]) if d.get("dF") is not None else None
@@ -378,57 +869,24 @@ class Photoluminescence(MSONable):
         _sigma = d.get("sigma", 6e-3)
         obj.sigma = tuple(_sigma) if isinstance(_sigma, list) else _sigma
         obj.temperature = d.get("temperature", 0.0)
-
-        # Load Stored Real-Valued Properties
-        obj.natoms = d.get("natoms", len(obj.masses))
-        obj.delR = d.get("delR")
-        obj.delQ = d.get("delQ")
-        obj.qks = np.array(d["qks"]) if d.get("qks") is not None else None
-        obj.Sks = np.array(d["Sks"]) if d.get("Sks") is not None else None
-        obj.HR_factor = d.get("HR_factor")
-        obj.DW_factor = d.get("DW_factor")
-        obj.iprs = np.array(d["iprs"]) if d.get("iprs") is not None else None
-        obj.iprs_alkauskas = (
-            np.array(d["iprs_alkauskas"])
-            if d.get("iprs_alkauskas") is not None
-            else None
-        )
-        obj.localization_ratio = (
-            np.array(d["localization_ratio"])
-            if d.get("localization_ratio") is not None
-            else None
-        )
-        obj.nks = np.array(d["nks"]) if d.get("nks") is not None else None
-        obj.C_omega = np.array(d["C_omega"]) if d.get("C_omega") is not None else None
-        obj.C_total = float(d.get("C_total", 0.0))
-        obj.effective_phonon_freq = d.get("effective_phonon_freq")
-        obj.omega_range = d.get(
-            "omega_range", [0.0, obj.max_energy, int(obj.max_energy * obj.resolution)]
-        )
-        obj.S_omega = np.array(d["S_omega"]) if d.get("S_omega") is not None else None
-
-        # Placeholders for complex/derived arrays (recomputed below)
-        obj.Sts = None
-        obj.Gts = None
-        obj.A_line = None
-        obj.intensity = None
-        obj.Cts = None
-
-        # Recompute complex-dependent pipeline from stored S_omega and C_omega
-        if obj.intensity is None:
-            obj.Cts = utils.calc_Ct(obj.C_omega) if obj.C_omega is not None else None
-            obj.Sts = utils.calc_St(obj.S_omega)
-            obj.Gts = utils.calc_Gts(
-                obj.Sts,
-                obj.HR_factor,
-                obj.gamma,
-                obj.resolution,
-                Cts=obj.Cts,
-                C_total=obj.C_total,
-            )
-            obj.A_line, obj.intensity = utils.calc_Spectrum_Intensity(
-                obj.Gts, obj.EZPL, obj.resolution
-            )
+        obj.st_method = d.get("st_method", "fft")
+        obj.weight_cutoff = d.get("weight_cutoff", 0.0)
+        obj.auto_grid = d.get("auto_grid", False)
+        obj.energy_window = obj._coerce_input("energy_window", d.get("energy_window"))
+
+        # Seed the lazy cache with the stored real-valued properties, in
+        # dependency order so that no restored value invalidates another
+        for name in ("natoms", "omega_range", "delR", "delQ"):
+            obj._restore(d, name)
+        for name in ("qks", "Sks"):
+            obj._restore(d, name, array=True)
+        for name in ("HR_factor", "DW_factor", "effective_phonon_freq"):
+            obj._restore(d, name)
+        for name in ("iprs", "iprs_alkauskas", "localization_ratio", "nks"):
+            obj._restore(d, name, array=True)
+        obj._restore(d, "C_total")
+        for name in ("C_omega", "S_omega"):
+            obj._restore(d, name, array=True, dtype=obj._real_dtype)
 
         return obj
 
@@ -437,10 +895,10 @@ class Photoluminescence(MSONable):
         """
         Reconstruct by replaying the full pipeline from primary inputs only.
 
-        Slower than :meth:`from_dict` because ``__post_init__`` recomputes
-        everything from scratch; useful when stored arrays may be stale.
+        Slower than :meth:`from_dict` because every derived property is
+        recomputed from scratch; useful when stored arrays may be stale.
         """
-        return cls(
+        obj = cls(
             frequencies=np.array(d["frequencies"]),
             eigenvectors=np.array(d["eigenvectors"]),
             masses=np.array(d["masses"]),
@@ -452,7 +910,172 @@ class Photoluminescence(MSONable):
             max_energy=d.get("max_energy", 5.0),
             sigma=d.get("sigma", 6e-3),
             temperature=d.get("temperature", 0.0),
+            st_method=d.get("st_method", "fft"),
+            weight_cutoff=d.get("weight_cutoff", 0.0),
+            auto_grid=d.get("auto_grid", False),
+            energy_window=d.get("energy_window"),
+            precision=d.get("precision", "double"),
+        )
+        obj.compute_properties()
+        return obj
+
+    def sweep(
+        self,
+        EZPL=None,
+        gamma=None,
+        sigma=None,
+        temperature=None,
+    ) -> LineshapeSweep:
+        """
+        Evaluate the lineshape for every combination of the given parameters.
+
+        The mode projection (``qks``, ``Sks``) of this instance is reused for
+        all rows.  S(ω) is built once per distinct ``sigma`` and C(ω, T) once
+        per distinct ``(sigma, temperature)`` pair; the resulting stacks are
+        then pushed through :func:`~defectpl.utils.calc_St`,
+        :func:`~defectpl.utils.calc_Gts` and
+        :func:`~defectpl.utils.calc_Spectrum_Intensity` as single batched FFTs
+        instead of one full pipeline per parameter set.
+
+        Parameters
+        ----------
+        EZPL : float or sequence of float, optional
+            ZPL energies in **eV**.  Defaults to ``self.EZPL``.
+        gamma : float or sequence of float, optional
+            ZPL broadenings in **meV**.  Defaults to ``self.gamma``.
+        sigma : float or sequence, optional
+            Gaussian broadenings in **eV**.  Each entry is a float or a
+            ``(sigma_low, sigma_high)`` pair, so a single variable-width
+            broadening must be wrapped in a list: ``sigma=[(4e-3, 8e-3)]``.
+            Defaults to ``self.sigma``.
+        temperature : float or sequence of float, optional
+            Temperatures in **Kelvin**.  Defaults to ``self.temperature``.
+
+        Returns
+        -------
+        LineshapeSweep
+            Rows ordered as ``itertools.product(EZPL, gamma, sigma,
+            temperature)``; ``intensity`` has shape ``(nparams, npoints)``.
+
+        Examples
+        --------
+        >>> res = pl.sweep(EZPL=[1.90, 1.945], gamma=[1.0, 2.0, 5.0])
+        >>> res.intensity.shape
+        (6, 5000)
+        """
+        ezpls = _sweep_values(self.EZPL if EZPL is None else EZPL)
+        gammas = _sweep_values(self.gamma if gamma is None else gamma)
+        sigmas = [
+            _sigma_key(s)
+            for s in ([self.sigma] if sigma is None else _sweep_values(sigma))
+        ]
+        temps = _sweep_values(self.temperature if temperature is None else temperature)
+        combos = list(itertools.product(ezpls, gammas, sigmas, temps))
+
+        # S(ω) → S(t) once per distinct broadening
+        sigma_keys = list(dict.fromkeys(sigmas))
+        Sks = self._working(self.Sks)
+        if self.st_method == "direct":
+            Sts_stack = np.stack(
+                [
+                    utils.calc_St_direct(
+                        self.frequencies, Sks, self.omega_range, s, self.weight_cutoff
+                    )
+                    for s in sigma_keys
+                ]
+            )
+        else:
+            S_stack = np.stack(
+                [
+                    utils.calc_S_omega(self.frequencies, Sks, self.omega_range, s)
+                    for s in sigma_keys
+                ]
+            )
+            Sts_stack = utils.calc_St(S_stack, backend=self._fft)
+
+        # C(ω, T) → C(t, T) once per distinct (broadening, temperature); all
+        # temperatures sharing a broadening come from one occupation matrix.
+        thermal_keys = list(dict.fromkeys((c[2], float(c[3])) for c in combos))
+        thermal_rows = {}
+        for s in dict.fromkeys(key[0] for key in thermal_keys):
+            T_s = np.array([T for key_s, T in thermal_keys if key_s == s])
+            nks = self._working(utils.calc_phonon_occupation(self.frequencies, T_s))
+            if self.st_method == "direct":
+                Cts = utils.calc_Ct_direct(
+                    self.frequencies, Sks, nks, self.omega_range, s, self.weight_cutoff
+                )
+            else:
+                Cts = utils.calc_Ct(
+                    utils.calc_C_omega(self.frequencies, Sks, nks, self.omega_range, s),
+                    backend=self._fft,
+                )
+            C_tot = utils.calc_C_total(nks, self.Sks)
+            for T, Ct_row, C_T in zip(T_s, Cts, C_tot):
+                thermal_rows[(s, float(T))] = (Ct_row, C_T)
+        Cts_stack = np.stack([thermal_rows[k][0] for k in thermal_keys])
+        C_totals = [thermal_rows[k][1] for k in thermal_keys]
+
+        sigma_idx = [sigma_keys.index(c[2]) for c in combos]
+        thermal_idx = [thermal_keys.index((c[2], float(c[3]))) for c in combos]
+        C_total = np.asarray(C_totals)[thermal_idx]
+        gamma_arr = np.array([c[1] for c in combos], dtype=float)
+        ezpl_arr = np.array([c[0] for c in combos], dtype=float)
+
+        Gts = utils.calc_Gts(
+            Sts_stack[sigma_idx],
+            self.HR_factor,
+            gamma_arr,
+            self.resolution,
+            Cts=Cts_stack[thermal_idx],
+            C_total=C_total,
         )
+        A_line, intensity = utils.calc_Spectrum_Intensity(
+            Gts,
+            ezpl_arr,
+            self.resolution,
+            energy_window=self.energy_window,
+            backend=self._fft,
+        )
+        return LineshapeSweep(
+            EZPL=ezpl_arr,
+            gamma=gamma_arr,
+            sigma=[c[2] for c in combos],
+            temperature=np.array([c[3] for c in combos], dtype=float),
+            C_total=C_total,
+            energies=self.energies,
+            A_line=A_line,
+            intensity=intensity,
+        )
+
+    def temperature_series(self, temperatures) -> LineshapeSweep:
+        """
+        Compute the PL lineshape at every temperature of a series in one pass.
+
+        Only the thermal branch depends on T.  The occupation matrix
+        :math:`\\bar{n}_k(T)` of shape ``(nT, nmodes)`` is built in one
+        vectorized call, every C(ω, T) is accumulated on the shared energy grid
+        from a single evaluation of the mode Gaussians, and all G(t, T) and
+        spectra come from stacked FFTs along the last axis.  S(ω) and S(t) are
+        computed once.
+
+        Parameters
+        ----------
+        temperatures : sequence of float
+            Lattice temperatures in **Kelvin**.
+
+        Returns
+        -------
+        LineshapeSweep
+            ``intensity`` has shape ``(nT, npoints)``; ``C_total`` holds
+            :math:`C(0, T)` for each temperature.
+
+        Examples
+        --------
+        >>> res = pl.temperature_series(np.linspace(0, 500, 100))
+        >>> res.intensity.shape, res.C_total.shape
+        ((100, 5000), (100,))
+        """
+        return self.sweep(temperature=list(np.atleast_1d(temperatures)))
 
     def generate_plots(
         self,
@@ -609,12 +1232,13 @@ class Photoluminescence(MSONable):
             out_dir=out_dir,
             iylim=iylim,
             fig_format=fig_format,
+            energies=self.energies,
         )
         print("All static visualization plots generated successfully.")
 
 
 @dataclass
-class Photoabsorption(MSONable):
+class Photoabsorption(_LineshapeEngine, MSONable):
     """
     Core engine for first-principles photoabsorption lineshape calculations.
 
@@ -642,6 +1266,10 @@ class Photoabsorption(MSONable):
         phonopy calculation).
     eigenvectors : numpy.ndarray, shape (nmodes, natoms, 3)
         Mass-normalised phonon displacement eigenvectors (real part only).
+        A :class:`numpy.memmap` (e.g. from
+        :meth:`~defectpl.core.structures.PhononData.load_npy`) is kept
+        mapped and streamed in blocks of modes by the projections, in its
+        stored dtype, so large supercells need not fit in memory.
     masses : numpy.ndarray, shape (natoms,)
         Atomic masses in atomic mass units (amu).
     EZPL : float
@@ -666,9 +1294,52 @@ class Photoabsorption(MSONable):
         Default 2.0 meV.
     temperature : float, optional
         Lattice temperature in **Kelvin**.  Pass 0 (default) for the T = 0 K limit.
+    st_method : {'fft', 'direct'}, optional
+        How S(t) and C(t, T) are obtained.  ``'fft'`` (default) broadens the
+        mode weights onto the energy grid and inverse-FFTs them.  ``'direct'``
+        evaluates the closed-form Gaussian-broadened sums on the time grid
+        (:func:`~defectpl.utils.calc_St_direct`), skipping S(ω), C(ω, T) and
+        the extra FFT; ``S_omega`` and ``C_omega`` are then only built if
+        accessed (e.g. by :meth:`generate_plots`).
+    weight_cutoff : float, optional
+        With ``st_method='direct'``, skip modes whose :math:`S_k` (or
+        :math:`\\bar{n}_k S_k` for C(t, T)) is at most ``weight_cutoff``
+        times the largest one, so a fine ``resolution`` stays cheap when
+        few modes couple.  Default 0.0 (keep every non-zero mode).
+    auto_grid : bool, optional
+        Round the number of grid points ``int(max_energy * resolution)`` up
+        to the next 5-smooth length (:func:`~defectpl.utils.next_fast_len`)
+        so that every FFT runs on a fast size.  The spacing ``1/resolution``
+        is kept and the energy axis is extended slightly past
+        ``max_energy``.  Default ``False``.
+    energy_window : (float, float), optional
+        ``(emin, emax)`` photon-energy window in **eV**.  When given, the
+        spectrum arrays hold only the grid points inside it (see
+        ``energies``), which keeps results and JSON files small.  Default
+        ``None`` (full grid).
+    precision : {'double', 'single'}, optional
+        Floating-point precision of the spectral pipeline.  ``'single'``
+        stores the eigenvectors as float32, runs the mode projection in
+        float32 and keeps S(ω), S(t), G(t) and the spectrum in
+        float32/complex64, halving their memory for high-throughput
+        screening; ``qks``, ``Sks`` and the HR factor stay float64.  See
+        Notes for the accuracy.  Default ``'double'``.
+    fft_backend : {'numpy', 'scipy', 'pyfftw'}, optional
+        FFT backend of this engine, including its :meth:`sweep` batches.
+        ``None`` (default) follows the global choice made with
+        :func:`defectpl.fft.set_fft_backend` at the time a spectrum is first
+        accessed (not at construction).  A runtime setting: it does not
+        change the results and is not serialised.
+    fft_workers : int, optional
+        Threads for the scipy and pyfftw backends.  ``None`` (default) uses
+        the global setting, or every core.
 
     Attributes
     ----------
+    All attributes below are lazy: each is computed on first access, cached,
+    and invalidated only when an input it depends on changes (see
+    :meth:`update`).
+
     natoms : int
         Number of atoms in the supercell.
     delR : float
@@ -706,6 +1377,9 @@ class Photoabsorption(MSONable):
         Fourier transform of S(ω) used in the generating function.
     Gts : numpy.ndarray
         Generating function G(t) = exp[S(t) − S] · exp(−γ|t|).
+    energies : numpy.ndarray
+        Photon energy axis of ``A_abs`` and ``absorption`` in **eV**
+        (restricted to ``energy_window`` when set).
     A_abs : numpy.ndarray
         Absorption spectral function.
     absorption : numpy.ndarray
@@ -722,6 +1396,9 @@ class Photoabsorption(MSONable):
     accurate lineshapes, particularly when the two geometries differ
     significantly.
 
+    ``precision='single'`` has the accuracy documented for
+    :class:`Photoluminescence`.
+
     References
     ----------
     Alkauskas, Buckley, Awschalom & Van de Walle,
@@ -757,100 +1434,32 @@ class Photoabsorption(MSONable):
     sigma: Union[float, Tuple[float, float]] = 6e-3
     gamma: float = 2.0
     temperature: float = 0.0
-
-    # Dependent calculated properties
-    natoms: int = field(init=False)
-    delR: float = field(init=False, default=None)
-    delQ: float = field(init=False, default=None)
-    qks: np.ndarray = field(init=False, default=None)
-    Sks: np.ndarray = field(init=False, default=None)
-    HR_factor: float = field(init=False, default=None)
-    DW_factor: float = field(init=False, default=None)
-    iprs: np.ndarray = field(init=False, default=None)
-    iprs_alkauskas: np.ndarray = field(init=False, default=None)
-    localization_ratio: np.ndarray = field(init=False, default=None)
-    nks: np.ndarray = field(init=False, default=None)
-    C_omega: np.ndarray = field(init=False, default=None)
-    Cts: np.ndarray = field(init=False, default=None)
-    C_total: float = field(init=False, default=0.0)
-    effective_phonon_freq: float = field(init=False, default=None)
-    omega_range: List[Union[float, int]] = field(init=False, default=None)
-    S_omega: np.ndarray = field(init=False, default=None)
-    Sts: np.ndarray = field(init=False, default=None)
-    Gts: np.ndarray = field(init=False, default=None)
-    A_abs: np.ndarray = field(init=False, default=None)
-    absorption: np.ndarray = field(init=False, default=None)
-
-    def __post_init__(self):
-        self.frequencies = np.asarray(self.frequencies)
-        self.eigenvectors = np.asarray(self.eigenvectors)
-        self.masses = np.asarray(self.masses)
-        if self.dR is not None:
-            self.dR = np.asarray(self.dR)
-        if self.dF is not None:
-            self.dF = np.asarray(self.dF)
-
-        self.natoms = len(self.masses)
-        self.omega_range = [
-            0.0,
-            self.max_energy,
-            int(self.max_energy * self.resolution),
-        ]
-        self.compute_properties()
-
-    def compute_properties(self):
-        """Run the full calculation pipeline and populate all derived attributes."""
-        self.delR = utils.calc_delR(self.dR) if self.dR is not None else 0.0
-        self.delQ = (
-            utils.calc_delQ(self.masses, self.dR) if self.dR is not None else 0.0
+    st_method: str = "fft"
+    weight_cutoff: float = 0.0
+    auto_grid: bool = False
+    energy_window: Optional[Tuple[float, float]] = None
+    precision: str = "double"
+    fft_backend: Optional[str] = None
+    fft_workers: Optional[int] = None
+
+    # Absorption spectrum (shared derived properties live on _LineshapeEngine)
+    @lazy_property("Gts", "EZPL", "resolution", "energy_window")
+    def _absorption_spectrum(self) -> Tuple[np.ndarray, np.ndarray]:
+        return utils.calc_Absorption_Intensity(
+            self.Gts,
+            self.EZPL,
+            self.resolution,
+            energy_window=self.energy_window,
+            backend=self._fft,
         )
 
-        if self.dF is not None and np.any(self.dF):
-            self.qks = utils.calc_qks_force_vectorized(
-                self.masses, self.dF, self.eigenvectors, self.frequencies
-            )
-        elif self.dR is not None and np.any(self.dR):
-            self.qks = utils.calc_qks_vectorized(
-                self.masses, self.dR, self.eigenvectors
-            )
-        else:
-            raise ValueError(
-                "Either dR or dF must be provided and non-zero to compute qks."
-            )
-
-        self.Sks = utils.calc_Sks(self.qks, self.frequencies)
-        self.HR_factor = float(np.sum(self.Sks))
-        self.DW_factor = float(np.exp(-self.HR_factor))
-
-        self.iprs = utils.calc_IPR(self.eigenvectors)
-        self.iprs_alkauskas = utils.calc_IPR_alkauskas(self.eigenvectors)
-        self.localization_ratio = self.natoms * self.iprs
+    @lazy_property("_absorption_spectrum")
+    def A_abs(self) -> np.ndarray:
+        return self._absorption_spectrum[0]
 
-        self.nks = utils.calc_phonon_occupation(self.frequencies, self.temperature)
-        self.C_omega = utils.calc_C_omega(
-            self.frequencies, self.Sks, self.nks, self.omega_range, self.sigma
-        )
-        self.Cts = utils.calc_Ct(self.C_omega)
-        self.C_total = utils.calc_C_total(self.nks, self.Sks)
-        self.effective_phonon_freq = utils.calc_effective_phonon_frequency(
-            self.frequencies, self.qks
-        )
-
-        self.S_omega = utils.calc_S_omega(
-            self.frequencies, self.Sks, self.omega_range, self.sigma
-        )
-        self.Sts = utils.calc_St(self.S_omega)
-        self.Gts = utils.calc_Gts(
-            self.Sts,
-            self.HR_factor,
-            self.gamma,
-            self.resolution,
-            Cts=self.Cts,
-            C_total=self.C_total,
-        )
-        self.A_abs, self.absorption = utils.calc_Absorption_Intensity(
-            self.Gts, self.EZPL, self.resolution
-        )
+    @lazy_property("_absorption_spectrum")
+    def absorption(self) -> np.ndarray:
+        return self._absorption_spectrum[1]
 
     def as_dict(self) -> dict:
         """
@@ -875,6 +1484,13 @@ class Photoabsorption(MSONable):
             "max_energy": self.max_energy,
             "sigma": list(self.sigma) if hasattr(self.sigma, "__len__") else self.sigma,
             "temperature": self.temperature,
+            "st_method": self.st_method,
+            "weight_cutoff": self.weight_cutoff,
+            "auto_grid": self.auto_grid,
+            "precision": self.precision,
+            "energy_window": (
+                list(self.energy_window) if self.energy_window is not None else None
+            ),
             # Safe Real-Valued Computed Properties
             "natoms": self.natoms,
             "delR": float(self.delR) if hasattr(self.delR, "__float__") else self.delR,
@@ -903,7 +1519,7 @@ class Photoabsorption(MSONable):
                 else None
             ),
             "nks": self.nks.tolist() if self.nks is not None else None,
-            "C_omega": self.C_omega.tolist() if self.C_omega is not None else None,
+            "C_omega": self.C_omega.tolist() if self.st_method == "fft" else None,
             "C_total": float(self.C_total),
             "effective_phonon_freq": (
                 float(self.effective_phonon_freq)
@@ -911,7 +1527,7 @@ class Photoabsorption(MSONable):
                 else None
             ),
             "omega_range": self.omega_range,
-            "S_omega": self.S_omega.tolist() if self.S_omega is not None else None,
+            "S_omega": self.S_omega.tolist() if self.st_method == "fft" else None,
             "absorption": (
                 self.absorption.tolist() if self.absorption is not None else None
             ),
@@ -928,14 +1544,15 @@ class Photoabsorption(MSONable):
         Deserialize from a dictionary produced by :meth:`as_dict`.
 
         Core inputs and real-valued computed properties are loaded directly;
-        complex arrays (``Sts``, ``Gts``) and the absorption spectrum are
-        recomputed on the fly from the stored S(ω).
+        complex arrays (``Sts``, ``Gts``) are recomputed from the stored S(ω)
+        on first access.
         """
         obj = cls.__new__(cls)
 
         # Load Core Inputs
+        obj.precision = d.get("precision", "double")
         obj.frequencies = np.array(d["frequencies"])
-        obj.eigenvectors = np.array(d["eigenvectors"])
+        obj.eigenvectors = obj._coerce_input("eigenvectors", d["eigenvectors"])
         obj.masses = np.array(d["masses"])
         obj.dR = np.array(d["dR"]) if d.get("dR") is not None else None
         obj.dF = np.array(d["dF"]) if d.get("dF") is not None else None
@@ -946,59 +1563,25 @@ class Photoabsorption(MSONable):
         _sigma = d.get("sigma", 6e-3)
         obj.sigma = tuple(_sigma) if isinstance(_sigma, list) else _sigma
         obj.temperature = d.get("temperature", 0.0)
-
-        # Load Stored Real-Valued Properties
-        obj.natoms = d.get("natoms", len(obj.masses))
-        obj.delR = d.get("delR")
-        obj.delQ = d.get("delQ")
-        obj.qks = np.array(d["qks"]) if d.get("qks") is not None else None
-        obj.Sks = np.array(d["Sks"]) if d.get("Sks") is not None else None
-        obj.HR_factor = d.get("HR_factor")
-        obj.DW_factor = d.get("DW_factor")
-        obj.iprs = np.array(d["iprs"]) if d.get("iprs") is not None else None
-        obj.iprs_alkauskas = (
-            np.array(d["iprs_alkauskas"])
-            if d.get("iprs_alkauskas") is not None
-            else None
-        )
-        obj.localization_ratio = (
-            np.array(d["localization_ratio"])
-            if d.get("localization_ratio") is not None
-            else None
-        )
-        obj.nks = np.array(d["nks"]) if d.get("nks") is not None else None
-        obj.C_omega = np.array(d["C_omega"]) if d.get("C_omega") is not None else None
-        obj.C_total = float(d.get("C_total", 0.0))
-        obj.effective_phonon_freq = d.get("effective_phonon_freq")
-        obj.omega_range = d.get(
-            "omega_range", [0.0, obj.max_energy, int(obj.max_energy * obj.resolution)]
-        )
-        obj.S_omega = np.array(d["S_omega"]) if d.get("S_omega") is not None else None
-        obj.absorption = (
-            np.array(d["absorption"]) if d.get("absorption") is not None else None
-        )
-
-        # Placeholders for complex/derived arrays (recomputed below)
-        obj.Sts = None
-        obj.Gts = None
-        obj.A_abs = None
-        obj.Cts = None
-
-        # Recompute complex-dependent pipeline from stored S_omega and C_omega
-        if obj.absorption is None:
-            obj.Cts = utils.calc_Ct(obj.C_omega) if obj.C_omega is not None else None
-            obj.Sts = utils.calc_St(obj.S_omega)
-            obj.Gts = utils.calc_Gts(
-                obj.Sts,
-                obj.HR_factor,
-                obj.gamma,
-                obj.resolution,
-                Cts=obj.Cts,
-                C_total=obj.C_total,
-            )
-            obj.A_abs, obj.absorption = utils.calc_Absorption_Intensity(
-                obj.Gts, obj.EZPL, obj.resolution
-            )
+        obj.st_method = d.get("st_method", "fft")
+        obj.weight_cutoff = d.get("weight_cutoff", 0.0)
+        obj.auto_grid = d.get("auto_grid", False)
+        obj.energy_window = obj._coerce_input("energy_window", d.get("energy_window"))
+
+        # Seed the lazy cache with the stored real-valued properties, in
+        # dependency order so that no restored value invalidates another
+        for name in ("natoms", "omega_range", "delR", "delQ"):
+            obj._restore(d, name)
+        for name in ("qks", "Sks"):
+            obj._restore(d, name, array=True)
+        for name in ("HR_factor", "DW_factor", "effective_phonon_freq"):
+            obj._restore(d, name)
+        for name in ("iprs", "iprs_alkauskas", "localization_ratio", "nks"):
+            obj._restore(d, name, array=True)
+        obj._restore(d, "C_total")
+        for name in ("C_omega", "S_omega"):
+            obj._restore(d, name, array=True, dtype=obj._real_dtype)
+        obj._restore(d, "absorption", array=True)
 
         return obj
 
@@ -1007,10 +1590,10 @@ class Photoabsorption(MSONable):
         """
         Reconstruct by replaying the full pipeline from primary inputs only.
 
-        Slower than :meth:`from_dict` because ``__post_init__`` recomputes
-        everything from scratch; useful when stored arrays may be stale.
+        Slower than :meth:`from_dict` because every derived property is
+        recomputed from scratch; useful when stored arrays may be stale.
         """
-        return cls(
+        obj = cls(
             frequencies=np.array(d["frequencies"]),
             eigenvectors=np.array(d["eigenvectors"]),
             masses=np.array(d["masses"]),
@@ -1022,7 +1605,14 @@ class Photoabsorption(MSONable):
             max_energy=d.get("max_energy", 5.0),
             sigma=d.get("sigma", 6e-3),
             temperature=d.get("temperature", 0.0),
+            st_method=d.get("st_method", "fft"),
+            weight_cutoff=d.get("weight_cutoff", 0.0),
+            auto_grid=d.get("auto_grid", False),
+            energy_window=d.get("energy_window"),
+            precision=d.get("precision", "double"),
         )
+        obj.compute_properties()
+        return obj
 
     def generate_plots(
         self,
@@ -1175,10 +1765,107 @@ class Photoabsorption(MSONable):
             plot=False,
             out_dir=out_dir,
             fig_format=fig_format,
+            energies=self.energies,
         )
         print("All static visualization plots generated successfully.")
 
 
+class PhotoluminescenceAbsorption(Photoluminescence):
+    """
+    Fused PL emission and absorption engine on one phonon set.
+
+    Takes exactly the inputs of :class:`Photoluminescence` and shares its
+    whole pipeline up to G(t).  Both spectra then come from the single FFT
+    of G(t) (:func:`~defectpl.utils.calc_Emission_Absorption_Intensity`):
+    the absorption generating function is :math:`G^*(t)`, whose transform
+    is the index-mirrored complex conjugate of the PL transform.  Compared
+    with a :class:`Photoluminescence` plus a :class:`Photoabsorption` built
+    from the same phonons, the projection, S(ω), S(t), G(t) and the FFT are
+    evaluated once instead of twice.
+
+    The absorption is the mirror image of the emission about the ZPL, which
+    is the right model when the ground- and excited-state phonons are
+    close (mirror-image checks, quick PL/absorption overlays).  Use
+    :class:`Photoabsorption` with excited-state phonons otherwise.
+
+    Attributes
+    ----------
+    All attributes of :class:`Photoluminescence`, plus:
+
+    A_abs : numpy.ndarray
+        Absorption spectral function on ``energies``.
+    absorption : numpy.ndarray
+        Absorption intensity :math:`\\alpha(\\hbar\\omega) \\propto \\omega\\, A_{abs}`.
+    stokes_shift : float
+        Stokes shift :math:`2 \\sum_k S_k \\hbar\\omega_k` in **eV**
+        (:func:`~defectpl.utils.calc_stokes_shift`).
+    peak_shift : float
+        Distance between the absorption and PL maxima in **eV**
+        (:func:`~defectpl.utils.calc_peak_shift`); 0 when the ZPL dominates.
+
+    Examples
+    --------
+    >>> both = PhotoluminescenceAbsorption(
+    ...     frequencies=freqs, eigenvectors=evecs, masses=masses,
+    ...     EZPL=1.945, dR=dR,
+    ... )
+    >>> both.intensity, both.absorption        # one FFT for both
+    >>> print(f"Stokes shift = {both.stokes_shift:.3f} eV")
+    """
+
+    @lazy_property("Gts", "EZPL", "resolution", "energy_window")
+    def _spectra(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return utils.calc_Emission_Absorption_Intensity(
+            self.Gts,
+            self.EZPL,
+            self.resolution,
+            energy_window=self.energy_window,
+            backend=self._fft,
+        )
+
+    @lazy_property("_spectra")
+    def _spectrum(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._spectra[:2]
+
+    @lazy_property("_spectra")
+    def A_abs(self) -> np.ndarray:
+        return self._spectra[2]
+
+    @lazy_property("_spectra")
+    def absorption(self) -> np.ndarray:
+        return self._spectra[3]
+
+    @lazy_property("frequencies", "Sks")
+    def stokes_shift(self) -> float:
+        return utils.calc_stokes_shift(self.frequencies, self.Sks)
+
+    @lazy_property("energies", "intensity", "absorption")
+    def peak_shift(self) -> float:
+        return utils.calc_peak_shift(self.energies, self.intensity, self.absorption)
+
+    @classmethod
+    def from_photoluminescence(
+        cls, pl: Photoluminescence
+    ) -> "PhotoluminescenceAbsorption":
+        """
+        Build the fused engine from an existing :class:`Photoluminescence`.
+
+        The inputs and every value already cached on *pl* (``qks``, ``Sks``,
+        ``Gts``, ...) are shared, so only the spectra are evaluated.
+        """
+        obj = cls.__new__(cls)
+        cache = {
+            name: value
+            for name, value in pl.__dict__.get("_lazy_cache", {}).items()
+            if name not in ("_spectrum", "A_line", "intensity")
+        }
+        for name, value in pl.__dict__.items():
+            if name != "_lazy_cache":
+                object.__setattr__(obj, name, value)
+        obj.__dict__["_lazy_cache"] = cache
+        return obj
+
+
 @dataclass
 class VibrationalSpectra1D(MSONable):
     r"""
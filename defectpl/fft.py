@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Pluggable FFT backends for the lineshape pipeline.
+
+Every transform of :func:`~defectpl.utils.calc_St`,
+:func:`~defectpl.utils.calc_Ct`, :func:`~defectpl.utils.calc_Spectrum_Intensity`,
+:func:`~defectpl.utils.calc_Absorption_Intensity` and
+:func:`~defectpl.utils.calc_Emission_Absorption_Intensity` goes through the
+backend selected here.  Three backends are available:
+
+``"numpy"``
+    :mod:`numpy.fft` (default, single-threaded, no extra dependency).
+``"scipy"``
+    :mod:`scipy.fft` with ``workers=`` threads; batched ``(nbatch, npoints)``
+    transforms are split across the threads.
+``"pyfftw"``
+    FFTW through pyFFTW, multi-threaded, with one FFTW plan cached per
+    array shape, dtype, axis and direction.
+
+A backend is chosen globally with :func:`set_fft_backend` (or temporarily
+with the :func:`fft_backend` context manager) and per engine through the
+``fft_backend`` / ``fft_workers`` fields of
+:class:`~defectpl.defectpl.Photoluminescence` and
+:class:`~defectpl.defectpl.Photoabsorption`.
+
+Example
+-------
+>>> from defectpl.fft import set_fft_backend
+>>> set_fft_backend("scipy", workers=8)       # all engines from now on
+>>> pl = Photoluminescence(..., fft_backend="numpy")   # this engine only
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import os
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+FFT_BACKENDS = ("numpy", "scipy", "pyfftw")
+
+# Process-wide default used when no backend is given explicitly
+_default: Dict[str, object] = {"name": "numpy", "workers": None}
+
+
+def _require_scipy_fft():
+    """Import :mod:`scipy.fft`, raising a clear error when scipy is missing."""
+    try:
+        import scipy.fft
+    except ImportError as exc:
+        raise ImportError(
+            "scipy is required for the 'scipy' FFT backend.  "
+            "Install with:  pip install scipy"
+        ) from exc
+    return scipy.fft
+
+
+def _require_pyfftw():
+    """Import :mod:`pyfftw`, raising a clear error when it is missing."""
+    try:
+        import pyfftw
+        import pyfftw.builders
+    except ImportError as exc:
+        raise ImportError(
+            "pyFFTW is required for the 'pyfftw' FFT backend.  "
+            "Install with:  pip install pyfftw"
+        ) from exc
+    return pyfftw
+
+
+class NumpyFFT:
+    """:mod:`numpy.fft` backend (``workers`` is ignored)."""
+
+    name = "numpy"
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
+
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return np.fft.fft(x, axis=axis)
+
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return np.fft.ifft(x, axis=axis)
+
+
+class ScipyFFT:
+    """:mod:`scipy.fft` backend; ``workers=None`` uses every CPU core."""
+
+    name = "scipy"
+
+    def __init__(self, workers: Optional[int] = None):
+        self._fft = _require_scipy_fft()
+        self.workers = -1 if workers is None else workers
+
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return self._fft.fft(x, axis=axis, workers=self.workers)
+
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return self._fft.ifft(x, axis=axis, workers=self.workers)
+
+
+class PyFFTWFFT:
+    """
+    pyFFTW backend with cached FFTW plans.
+
+    Plans are built once per ``(shape, dtype, axis, direction)`` with
+    ``FFTW_MEASURE`` and reused for every later transform of the same layout,
+    which is the common case in parameter sweeps and temperature series.
+    ``workers=None`` uses every CPU core.
+    """
+
+    name = "pyfftw"
+    max_plans = 32
+
+    def __init__(self, workers: Optional[int] = None):
+        self._pyfftw = _require_pyfftw()
+        self.workers = (os.cpu_count() or 1) if workers in (None, -1) else workers
+        self._plans: Dict[Tuple, object] = {}
+
+    def _transform(self, x: np.ndarray, axis: int, inverse: bool) -> np.ndarray:
+        x = np.asarray(x)
+        if not np.iscomplexobj(x):
+            x = x.astype(np.result_type(x.dtype, np.complex64))
+        key = (x.shape, x.dtype.str, axis % x.ndim, inverse)
+        plan = self._plans.get(key)
+        if plan is None:
+            if len(self._plans) >= self.max_plans:
+                self._plans.pop(next(iter(self._plans)))
+            builder = (
+                self._pyfftw.builders.ifft if inverse else self._pyfftw.builders.fft
+            )
+            plan = builder(
+                self._pyfftw.empty_aligned(x.shape, dtype=x.dtype),
+                axis=axis,
+                threads=self.workers,
+                planner_effort="FFTW_MEASURE",
+            )
+            self._plans[key] = plan
+        # The plan owns its output buffer; copy so results are independent
+        return plan(x).copy()
+
+    def fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return self._transform(x, axis, inverse=False)
+
+    def ifft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        return self._transform(x, axis, inverse=True)
+
+
+_CLASSES = {"numpy": NumpyFFT, "scipy": ScipyFFT, "pyfftw": PyFFTWFFT}
+# One instance per (name, workers) so pyFFTW plans survive between calls
+_instances: Dict[Tuple[str, Optional[int]], object] = {}
+
+Backend = Union[NumpyFFT, ScipyFFT, PyFFTWFFT]
+
+
+def validate_fft_backend(name: Optional[str]) -> None:
+    """Raise :class:`ValueError` unless *name* is ``None`` or a known backend."""
+    if name is not None and name not in FFT_BACKENDS:
+        raise ValueError(
+            f"fft_backend must be one of {', '.join(FFT_BACKENDS)} (or None), "
+            f"got {name!r}."
+        )
+
+
+def get_fft_backend(
+    backend: Union[str, Backend, None] = None, workers: Optional[int] = None
+) -> Backend:
+    """
+    Resolve a backend specification to a backend object.
+
+    Parameters
+    ----------
+    backend : str, backend object or None, optional
+        ``"numpy"``, ``"scipy"``, ``"pyfftw"``, an object returned by this
+        function (passed through), or ``None`` for the global default set by
+        :func:`set_fft_backend`.
+    workers : int, optional
+        Number of threads.  ``None`` uses the global setting when *backend*
+        is ``None`` and every core otherwise (numpy ignores it).
+
+    Returns
+    -------
+    NumpyFFT, ScipyFFT or PyFFTWFFT
+        Object with ``fft(x, axis=-1)`` and ``ifft(x, axis=-1)`` methods.
+
+    Raises
+    ------
+    ValueError
+        If *backend* is not a known name.
+    ImportError
+        If the optional package behind the backend is not installed.
+    """
+    if backend is not None and not isinstance(backend, str):
+        return backend
+    if backend is None:
+        backend = _default["name"]
+        if workers is None:
+            workers = _default["workers"]
+    validate_fft_backend(backend)
+    key = (backend, workers)
+    if key not in _instances:
+        _instances[key] = _CLASSES[backend](workers)
+    return _instances[key]
+
+
+def set_fft_backend(name: str = "numpy", workers: Optional[int] = None) -> None:
+    """
+    Set the process-wide default FFT backend.
+
+    Parameters
+    ----------
+    name : {'numpy', 'scipy', 'pyfftw'}, optional
+        Backend used by every transform that does not name one explicitly.
+        Default ``'numpy'``.
+    workers : int, optional
+        Thread count for the scipy and pyfftw backends.  ``None`` (default)
+        uses every CPU core.
+
+    Raises
+    ------
+    ValueError
+        If *name* is not a known backend.
+    ImportError
+        If the optional package behind the backend is not installed.
+    """
+    validate_fft_backend(name)
+    get_fft_backend(name, workers)  # fail now rather than mid-calculation
+    _default["name"], _default["workers"] = name, workers
+
+
+@contextmanager
+def fft_backend(name: str, workers: Optional[int] = None) -> Iterator[Backend]:
+    """
+    Temporarily switch the default FFT backend inside a ``with`` block.
+
+    Examples
+    --------
+    >>> with fft_backend("scipy", workers=4):
+    ...     res = pl.sweep(gamma=[1.0, 2.0, 5.0])
+    """
+    previous = dict(_default)
+    set_fft_backend(name, workers)
+    try:
+        yield get_fft_backend()
+    finally:
+        _default.update(previous)
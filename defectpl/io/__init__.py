@@ -9,6 +9,7 @@ vasp      VASP reader implementation (requires pymatgen for most operations).
 qe        Quantum ESPRESSO stub (not yet implemented).
 abinit    ABINIT stub (not yet implemented).
 cp2k      CP2K stub (not yet implemented).
+compression  Streaming decompression of .gz/.bz2/.xz/.zst inputs (zopen).
 """
 
 from defectpl.io.base import ElectronicReader, PhononReader
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Transparent decompression for the defectpl file readers.
+
+Paths ending in ``.gz``, ``.bz2``, ``.xz`` or ``.zst`` are decompressed on
+the fly while they are read, so archived OUTCAR, PROCAR, EIGENVAL,
+band.yaml and FORCE_CONSTANTS files need no temporary copy on disk.  gzip,
+bzip2 and xz use the standard library; zstd needs the optional
+``zstandard`` package.
+
+Decompressed streams support forward ``seek`` (bytes are decompressed and
+discarded), so byte offsets recorded by an index stay usable.  A backward
+seek restarts decompression from the beginning of the file.
+"""
+
+from __future__ import annotations
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import IO, Optional, Union
+
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz", ".zst")
+
+
+def _require_zstandard():
+    """Import :mod:`zstandard`, raising a clear error when it is missing."""
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "zstandard is required to read .zst files.  "
+            "Install with:  pip install zstandard"
+        ) from exc
+    return zstandard
+
+
+class _ZstdReader(io.RawIOBase):
+    """Seekable raw stream over a zstd file (forward seeks decompress and discard)."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._raw = self._reader = None
+        self._open()
+
+    def _open(self) -> None:
+        zstandard = _require_zstandard()
+        with contextlib.ExitStack() as stack:
+            raw = stack.enter_context(open(self._path, "rb"))
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+            stack.pop_all()
+        self._raw, self._reader = raw, reader
+        self._pos = 0
+
+    def _close_streams(self) -> None:
+        try:
+            if self._reader is not None:
+                self._reader.close()
+        finally:
+            if self._raw is not None:
+                self._raw.close()
+            self._raw = self._reader = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self._reader.readinto(buffer)
+        self._pos += n
+        return n
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation(
+                "cannot seek relative to the end of a zstd file"
+            )
+        if offset < self._pos:
+            self._close_streams()
+            self._open()
+        while self._pos < offset:
+            chunk = self._reader.read(min(offset - self._pos, 1 << 20))
+            if not chunk:
+                break
+            self._pos += len(chunk)
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._close_streams()
+        super().close()
+
+
+def is_compressed(path: Union[str, Path]) -> bool:
+    """True if *path* has one of the :data:`COMPRESSED_SUFFIXES`."""
+    return Path(path).suffix.lower() in COMPRESSED_SUFFIXES
+
+
+def zopen(
+    path: Union[str, Path],
+    mode: str = "r",
+    encoding: Optional[str] = None,
+    errors: Optional[str] = None,
+) -> IO:
+    """
+    Open *path* for reading, decompressing it on the fly if compressed.
+
+    Parameters
+    ----------
+    path : str or Path
+        Plain or ``.gz`` / ``.bz2`` / ``.xz`` / ``.zst`` file.
+    mode : {"r", "rt", "rb"}
+        Text (default) or binary.
+    encoding, errors : str, optional
+        Passed to the text wrapper; ignored in binary mode.
+
+    Returns
+    -------
+    file object
+        Supports iteration, ``readline`` and ``seek``.
+
+    Raises
+    ------
+    ValueError
+        If *mode* is not a read mode.
+    """
+    if mode not in ("r", "rt", "rb"):
+        raise ValueError(f"zopen only reads files, got mode {mode!r}.")
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in COMPRESSED_SUFFIXES:
+        if mode == "rb":
+            return open(path, "rb")
+        return open(path, "r", encoding=encoding, errors=errors)
+    # The stack closes whatever is already open if a later wrapper raises;
+    # on success pop_all() hands ownership of the stream to the caller.
+    with contextlib.ExitStack() as stack:
+        if suffix == ".gz":
+            raw = stack.enter_context(gzip.open(path, "rb"))
+        elif suffix == ".bz2":
+            raw = stack.enter_context(bz2.open(path, "rb"))
+        elif suffix == ".xz":
+            raw = stack.enter_context(lzma.open(path, "rb"))
+        else:
+            raw = io.BufferedReader(stack.enter_context(_ZstdReader(path)))
+        stream = (
+            raw
+            if mode == "rb"
+            else io.TextIOWrapper(raw, encoding=encoding, errors=errors)
+        )
+        stack.pop_all()
+    return stream
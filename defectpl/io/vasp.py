@@ -14,7 +14,9 @@ Eigenvalue / electronic
 OUTCAR / trajectory
     check_outcar_convergence, get_nions, get_species_and_index_map,
     get_structures_and_forces, get_final_structure_and_forces_from_outcar,
-    get_first_structure_and_forces_from_outcar, OutcarParser
+    get_first_structure_and_forces_from_outcar, get_outcar_trajectory,
+    OutcarTrajectory, OutcarParser, OutcarIndex, index_outcar, scan_outcar,
+    OutcarExtractor, register_outcar_extractor, OUTCAR_EXTRACTORS
 
 PL workflow helpers
     calc_dF, prepare_dF_files, calc_dR, calc_delta_Q, get_q_from_structure,
@@ -29,17 +31,35 @@ VaspReader
 
 from __future__ import annotations
 
-from collections import deque
+import mmap
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 
+from defectpl.io.compression import is_compressed, zopen
 from defectpl.utils import calc_delQ
 
 if TYPE_CHECKING:
     from pymatgen.core import Structure
 
+    from defectpl.core.structures import EigenvalData, PhononData
+
 
 # =====================================================================
 # Kohn-Sham Eigenvalue & Electronic Parsing
@@ -52,6 +72,44 @@ def get_spin_multiplicity(homo_up_idx: int, homo_down_idx: int) -> float:
     return 2.0 * S + 1.0
 
 
+def _load_eigenval(filename: Union[str, Path]):
+    """
+    pymatgen ``Eigenval`` of *filename* with ``separate_spins=True``.
+
+    pymatgen opens plain, .gz, .bz2 and .xz files itself; .zst files are
+    parsed here from the decompressed stream into an equivalent object.
+    """
+    from pymatgen.electronic_structure.core import Spin
+    from pymatgen.io.vasp.outputs import Eigenval
+
+    if Path(filename).suffix.lower() != ".zst":
+        return Eigenval(filename, separate_spins=True)
+
+    with zopen(filename, "r", encoding="utf-8") as f:
+        ispin = int(f.readline().split()[-1])
+        for _ in range(4):
+            f.readline()
+        nelect, nkpt, nbands = (int(x) for x in f.readline().split())
+        rows = [line.split() for line in f if line.strip()]
+    # Each k-point block: "kx ky kz weight" then nbands band rows
+    blocks = [
+        rows[i : i + nbands + 1] for i in range(0, nkpt * (nbands + 1), nbands + 1)
+    ]
+    kpoints = np.array([block[0] for block in blocks], dtype=float)
+    bands = np.array([block[1:] for block in blocks], dtype=float)
+
+    eig = Eigenval.__new__(Eigenval)
+    eig.filename, eig.occu_tol, eig.separate_spins = filename, 1e-8, True
+    eig.ispin, eig.nelect, eig.nkpt, eig.nbands = ispin, nelect, nkpt, nbands
+    eig.kpoints = kpoints[:, :3].tolist()
+    eig.kpoints_weights = kpoints[:, 3].tolist()
+    if ispin == 2:
+        eig.eigenvalues = {Spin.up: bands[..., [1, 3]], Spin.down: bands[..., [2, 4]]}
+    else:
+        eig.eigenvalues = {Spin.up: bands[..., [1, 2]]}
+    return eig
+
+
 def read_eigenval_file(filename: Union[str, Path], k_idx: int = 0) -> Dict[str, Any]:
     """
     Parse a VASP EIGENVAL file and return spin-resolved eigenvalues at one k-point.
@@ -72,12 +130,11 @@ def read_eigenval_file(filename: Union[str, Path], k_idx: int = 0) -> Dict[str,
         If the calculation is not spin-polarised (ISPIN ≠ 2).
     """
     from pymatgen.electronic_structure.core import Spin
-    from pymatgen.io.vasp.outputs import Eigenval
 
     from defectpl.ks_analysis import get_homo_lumo_idx
 
     data: Dict[str, Any] = {}
-    eig = Eigenval(filename, separate_spins=True)
+    eig = _load_eigenval(filename)
     if eig.ispin != 2:
         raise ValueError("The calculation is not spin polarized.")
 
@@ -112,88 +169,416 @@ def read_eigenval_file(filename: Union[str, Path], k_idx: int = 0) -> Dict[str,
 # =====================================================================
 
 
-def check_outcar_convergence(outcar_path: Union[str, Path]) -> Dict[str, bool]:
+# Markers of the per-step lattice and POSITION/TOTAL-FORCE blocks.  The
+# lattice block is the marker line, 4 header lines and 3 lattice rows; the
+# force block is the header line, a dashed separator and NIONS rows.
+_OUTCAR_LATTICE = b"VOLUME and BASIS-vectors are now :"
+_OUTCAR_FORCES = b"TOTAL-FORCE"
+
+
+# Number of trailing lines searched for the end-of-run markers
+_OUTCAR_TAIL = 100
+# Characters of text handed to ``str.find`` per scanner refill: small at
+# first so header-only scans stop early, doubling up to the maximum
+_SCAN_CHUNK = (1 << 16, 1 << 24)
+
+
+def _last_lines(text: str, n: int) -> str:
+    """The last *n* lines of *text* (without splitting the rest)."""
+    pos = len(text) - 1  # ignore the final newline
+    for _ in range(n):
+        pos = text.rfind("\n", 0, pos)
+        if pos < 0:
+            return text
+    return text[pos + 1 :]
+
+
+def _parse_rows(lines: Sequence[AnyStr], ncols: int, path: Path) -> np.ndarray:
     """
-    Check electronic and structural convergence from a VASP OUTCAR file.
+    Parse the first *ncols* columns of a numeric OUTCAR block in one call.
 
-    Returns
-    -------
-    dict with keys ``structural_converged``, ``electronic_converged``,
-    ``finished_cleanly``.
+    The whole block goes through numpy's C text parser instead of a
+    ``float()`` per field, which dominates the cost of reading large
+    trajectories.
     """
-    outcar_path = Path(outcar_path)
-    if not outcar_path.is_file():
-        raise FileNotFoundError(f"OUTCAR file not found at {outcar_path}")
+    try:
+        return np.loadtxt(lines, usecols=range(ncols), ndmin=2, comments=None)
+    except ValueError as exc:
+        raise ValueError(f"Malformed OUTCAR block in {path}: {exc}") from None
 
-    results = {
-        "structural_converged": False,
-        "electronic_converged": True,
-        "finished_cleanly": False,
-    }
 
-    tail_lines: deque = deque(maxlen=100)
-    has_content = False
+class _OutcarLines:
+    """
+    Line iterator over large text chunks of an OUTCAR.
 
-    with open(outcar_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            has_content = True
-            tail_lines.append(line)
-            if "ELECTRONIC CONVERGENCE MINIMIZATION" in line and "not achieved" in line:
-                results["electronic_converged"] = False
+    The scanner searches the current chunk for trigger strings with
+    ``str.find``; block readers pull the lines after a trigger with
+    ``next()``.  The last :data:`_OUTCAR_TAIL` lines of the file are kept in
+    :attr:`tail` once the end is reached.
+    """
 
-    if not has_content:
-        return {k: False for k in results}
+    def __init__(self, f):
+        self._f = f
+        self._chunk = _SCAN_CHUNK[0]
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.generation = 0  # bumped on every refill
+        self._tail = ""
+
+    def refill(self) -> bool:
+        """Replace the consumed part of the buffer with the next chunk."""
+        if self.eof:
+            return False
+        data = self._f.read(self._chunk)
+        self._chunk = min(2 * self._chunk, _SCAN_CHUNK[1])
+        if data and not data.endswith("\n"):
+            data += self._f.readline()  # keep whole lines in the buffer
+        self._tail = _last_lines(self._tail + self.buf[: self.pos], _OUTCAR_TAIL)
+        self.buf, self.pos = self.buf[self.pos :] + data, 0
+        self.generation += 1
+        self.eof = not data
+        return bool(data)
+
+    @property
+    def tail(self) -> List[str]:
+        text = _last_lines(self._tail + self.buf[: self.pos], _OUTCAR_TAIL)
+        return text.splitlines(True)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if self.pos >= len(self.buf) and not self.refill():
+            raise StopIteration
+        end = self.buf.find("\n", self.pos) + 1 or len(self.buf)
+        line = self.buf[self.pos : end]
+        self.pos = end
+        return line
+
+    def block(self, n: int) -> str:
+        """The next *n* lines as a single string (one slice of the buffer)."""
+        while True:
+            # Numeric tables are fixed width: guess the end from the first row
+            end = self.pos + n * (self.buf.find("\n", self.pos) + 1 - self.pos)
+            if (
+                end > self.pos
+                and self.buf[end - 1 : end] == "\n"
+                and self.buf.count("\n", self.pos, end) == n
+            ):
+                text = self.buf[self.pos : end]
+                self.pos = end
+                return text
+            end = self.pos
+            for _ in range(n):
+                end = self.buf.find("\n", end) + 1
+                if not end:
+                    break
+            else:
+                text = self.buf[self.pos : end]
+                self.pos = end
+                return text
+            if not self.refill():
+                raise StopIteration
+
+
+class OutcarExtractor:
+    """
+    Base class of the extractors run by :func:`scan_outcar`.
 
-    for line in tail_lines:
-        if "reached required accuracy" in line:
-            results["structural_converged"] = True
-        tokens = line.split()
-        if len(tokens) >= 2 and ("User" in tokens[0] and "time" in tokens[1]):
-            results["finished_cleanly"] = True
-        elif "Total CPU time" in line:
-            results["finished_cleanly"] = True
+    Every line containing one of :attr:`triggers` is passed to
+    :meth:`feed` together with the line iterator, from which block readers
+    pull the lines that follow.  An extractor sets :attr:`done` once it has
+    everything it needs; the scan stops early when all requested
+    extractors are done.  :meth:`result` receives the last lines of the
+    file (empty if the scan stopped early).
 
-    return results
+    Register new extractors with :func:`register_outcar_extractor`.
+    """
 
+    triggers: Tuple[str, ...] = ()
 
-def get_nions(outcar_path: Union[str, Path]) -> int:
-    """Extract the NIONS count from a VASP OUTCAR file."""
-    outcar_path = Path(outcar_path)
-    if not outcar_path.is_file():
-        raise FileNotFoundError(f"OUTCAR file not found at {outcar_path}")
+    def __init__(self, path: Path):
+        self.path = path
+        self.done = False
 
-    with open(outcar_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if "NIONS =" in line:
-                return int(line.split("=")[-1])
+    def feed(self, line: str, lines: Iterator[str]) -> None:
+        raise NotImplementedError
 
-    raise ValueError(f"Could not find 'NIONS =' token within {outcar_path}")
+    def result(self, tail: List[str]) -> Any:
+        raise NotImplementedError
 
 
-def get_species_and_index_map(outcar_path: Union[str, Path]) -> List[str]:
+OUTCAR_EXTRACTORS: Dict[str, Type[OutcarExtractor]] = {}
+
+
+def register_outcar_extractor(name: str):
+    """Class decorator adding an :class:`OutcarExtractor` to :func:`scan_outcar`."""
+
+    def decorator(cls: Type[OutcarExtractor]) -> Type[OutcarExtractor]:
+        OUTCAR_EXTRACTORS[name] = cls
+        return cls
+
+    return decorator
+
+
+@register_outcar_extractor("nions")
+class _NionsExtractor(OutcarExtractor):
+    """``NIONS`` as an int (None if absent)."""
+
+    triggers = ("NIONS =",)
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.value: Optional[int] = None
+
+    def feed(self, line, lines):
+        self.value = int(line.split("=")[-1])
+        self.done = True
+
+    def result(self, tail):
+        return self.value
+
+
+@register_outcar_extractor("species")
+class _SpeciesExtractor(OutcarExtractor):
+    """``(POTCAR element list, ions per type)`` as written in the header."""
+
+    triggers = ("POTCAR:", "ions per type =")
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.types: List[str] = []
+        self.counts: List[int] = []
+
+    def feed(self, line, lines):
+        if "ions per type =" in line:
+            self.counts = [int(x) for x in line.split("=")[-1].split()]
+            self.done = True
+        elif "PAW" in line:
+            tokens = line.split()
+            if len(tokens) >= 3:
+                self.types.append(tokens[2].split("_")[0])
+
+    def result(self, tail):
+        return self.types, self.counts
+
+
+@register_outcar_extractor("trajectory")
+class _TrajectoryExtractor(OutcarExtractor):
+    """
+    Per-step ``lattices`` (nsteps, 3, 3), Cartesian ``positions`` and
+    ``forces`` (nsteps, NIONS, 3) in Å and eV/Å.
     """
-    Build a flat per-atom element list from OUTCAR POTCAR entries.
 
-    Handles multi-occurrence POTCAR definitions (e.g. N, C, N, C) by
-    aligning to the 'ions per type' array.
+    triggers = ("NIONS =", _OUTCAR_LATTICE.decode(), _OUTCAR_FORCES.decode())
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.natoms: Optional[int] = None
+        self.lattice: Optional[np.ndarray] = None
+        self.lattices: List[np.ndarray] = []
+        self.steps: List[np.ndarray] = []  # (NIONS, 6) position + force rows
+
+    def feed(self, line, lines):
+        if "NIONS =" in line:
+            self.natoms = int(line.split("=")[-1])
+        elif _OUTCAR_LATTICE.decode() in line:
+            for _ in range(4):
+                next(lines)
+            self.lattice = _parse_rows(lines.block(3).splitlines(), 3, self.path)
+        elif "POSITION" in line:
+            if self.lattice is None:
+                raise ValueError(
+                    f"Parsed a POSITION block before finding a lattice matrix "
+                    f"in {self.path}. The file layout might be corrupted."
+                )
+            if self.natoms is None:
+                raise ValueError(f"Could not find 'NIONS =' token within {self.path}")
+            next(lines)  # skip dashed separator
+            block = lines.block(self.natoms).splitlines()
+            self.lattices.append(self.lattice)
+            self.steps.append(_parse_rows(block, 6, self.path))
+
+    def result(self, tail):
+        if self.natoms is None:  # no NIONS, so no step was parsed either
+            empty = np.zeros((0, 0, 3))
+            return {
+                "lattices": np.zeros((0, 3, 3)),
+                "positions": empty,
+                "forces": empty,
+            }
+        steps = np.array(self.steps).reshape(-1, self.natoms, 6)
+        return {
+            "lattices": np.array(self.lattices).reshape(-1, 3, 3),
+            "positions": np.ascontiguousarray(steps[..., :3]),
+            "forces": np.ascontiguousarray(steps[..., 3:]),
+        }
+
+
+@register_outcar_extractor("convergence")
+class _ConvergenceExtractor(OutcarExtractor):
+    """Flags of :func:`check_outcar_convergence`."""
+
+    triggers = ("ELECTRONIC CONVERGENCE MINIMIZATION",)
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.electronic_converged = True
+
+    def feed(self, line, lines):
+        if "not achieved" in line:
+            self.electronic_converged = False
+
+    def result(self, tail):
+        results = {
+            "structural_converged": False,
+            "electronic_converged": self.electronic_converged,
+            "finished_cleanly": False,
+        }
+        if not tail:
+            return {k: False for k in results}
+        for line in tail:
+            if "reached required accuracy" in line:
+                results["structural_converged"] = True
+            tokens = line.split()
+            if len(tokens) >= 2 and ("User" in tokens[0] and "time" in tokens[1]):
+                results["finished_cleanly"] = True
+            elif "Total CPU time" in line:
+                results["finished_cleanly"] = True
+        return results
+
+
+# End-of-run resource summary: OUTCAR label -> key of the "timing" result
+_OUTCAR_TIMING = {
+    "Total CPU time used (sec)": "total_cpu_time",
+    "User time (sec)": "user_time",
+    "System time (sec)": "system_time",
+    "Elapsed time (sec)": "elapsed_time",
+    "Maximum memory used (kb)": "max_memory_kb",
+    "Average memory used (kb)": "average_memory_kb",
+}
+
+
+@register_outcar_extractor("timing")
+class _TimingExtractor(OutcarExtractor):
+    """End-of-run CPU/wall times in s and memory in kB (empty if unfinished)."""
+
+    triggers = ("(sec):", "used (kb):")
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.values: Dict[str, float] = {}
+
+    def feed(self, line, lines):
+        label, _, value = line.partition(":")
+        key = _OUTCAR_TIMING.get(label.strip())
+        if key is None:
+            return
+        try:
+            self.values[key] = float(value.split()[0])
+        except (IndexError, ValueError):  # e.g. "N/A" average memory
+            pass
+
+    def result(self, tail):
+        return dict(self.values)
+
+
+def scan_outcar(
+    outcar_path: Union[str, Path], extractors: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run several OUTCAR extractors in a single read of the file.
+
+    Trigger strings are located with ``str.find`` over large chunks of
+    text, so lines without a trigger are never split or inspected one by
+    one.  The scan stops as soon as every requested extractor is done, e.g.
+    after the header for ``["nions", "species"]``.
+
+    Parameters
+    ----------
+    outcar_path : str or Path
+        Plain or compressed OUTCAR.
+    extractors : sequence of str, optional
+        Names in :data:`OUTCAR_EXTRACTORS` (default: all of them).  Built-in:
+        ``nions``, ``species``, ``trajectory``, ``convergence``, ``timing``.
+
+    Returns
+    -------
+    dict
+        Result of each extractor under its name.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        For unknown extractor names or a truncated block.
     """
     outcar_path = Path(outcar_path)
     if not outcar_path.is_file():
         raise FileNotFoundError(f"OUTCAR file not found at {outcar_path}")
+    names = list(OUTCAR_EXTRACTORS) if extractors is None else list(extractors)
+    unknown = sorted(set(names) - set(OUTCAR_EXTRACTORS))
+    if unknown:
+        raise ValueError(
+            f"Unknown OUTCAR extractor(s) {unknown}; "
+            f"registered: {sorted(OUTCAR_EXTRACTORS)}"
+        )
+    active = {name: OUTCAR_EXTRACTORS[name](outcar_path) for name in names}
+    dispatch: Dict[str, List[OutcarExtractor]] = {}
+    for extractor in active.values():
+        for trigger in extractor.triggers:
+            dispatch.setdefault(trigger, []).append(extractor)
+
+    with zopen(outcar_path, "r", encoding="utf-8", errors="ignore") as f:
+        lines = _OutcarLines(f)
+        hits: Dict[str, int] = {}
+        generation = -1
+        try:
+            while dispatch:
+                if generation != lines.generation:
+                    generation, hits = lines.generation, {}
+                size = len(lines.buf)
+                for trigger in dispatch:
+                    # Cached hits stay valid until the reader moves past them
+                    if hits.get(trigger, -1) < lines.pos:
+                        pos = lines.buf.find(trigger, lines.pos)
+                        hits[trigger] = size if pos < 0 else pos
+                found = [(p, t) for t, p in hits.items() if p < size and t in dispatch]
+                if not found:
+                    lines.pos = len(lines.buf)
+                    if not lines.refill():
+                        break
+                    continue
+                pos, trigger = min(found)
+                start = lines.buf.rfind("\n", 0, pos) + 1
+                lines.pos = start
+                line = next(lines)
+                for extractor in dispatch[trigger]:
+                    if not extractor.done:
+                        extractor.feed(line, lines)
+                if all(extractor.done for extractor in active.values()):
+                    return {name: ex.result([]) for name, ex in active.items()}
+                for done in [
+                    t for t, exs in dispatch.items() if all(e.done for e in exs)
+                ]:
+                    del dispatch[done]
+            while lines.refill():  # only the tail is needed past the last trigger
+                lines.pos = len(lines.buf)
+            lines.pos = len(lines.buf)
+        except StopIteration:
+            raise ValueError(
+                f"Premature end of file encountered while parsing {outcar_path}"
+            )
+        tail = lines.tail
+    return {name: ex.result(tail) for name, ex in active.items()}
 
-    species_types: List[str] = []
-    ions_per_type: List[int] = []
-
-    with open(outcar_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if "POTCAR:" in line and "PAW" in line:
-                tokens = line.split()
-                if len(tokens) >= 3:
-                    species_types.append(tokens[2].split("_")[0])
-            if "ions per type =" in line:
-                ions_per_type = [int(x) for x in line.split("=")[-1].split()]
-                break
 
+def _expand_species(
+    species_types: List[str], ions_per_type: List[int], outcar_path: Path
+) -> List[str]:
+    """Per-atom element list from POTCAR elements and 'ions per type'."""
     if not species_types or not ions_per_type:
         raise ValueError(
             f"Could not fully parse species maps from {outcar_path}. "
@@ -214,6 +599,178 @@ def get_species_and_index_map(outcar_path: Union[str, Path]) -> List[str]:
     return species_map
 
 
+def check_outcar_convergence(outcar_path: Union[str, Path]) -> Dict[str, bool]:
+    """
+    Check electronic and structural convergence from a VASP OUTCAR file.
+
+    Returns
+    -------
+    dict with keys ``structural_converged``, ``electronic_converged``,
+    ``finished_cleanly``.
+    """
+    return scan_outcar(outcar_path, ["convergence"])["convergence"]
+
+
+def get_nions(outcar_path: Union[str, Path]) -> int:
+    """Extract the NIONS count from a VASP OUTCAR file."""
+    nions = scan_outcar(outcar_path, ["nions"])["nions"]
+    if nions is None:
+        raise ValueError(f"Could not find 'NIONS =' token within {outcar_path}")
+    return nions
+
+
+def get_species_and_index_map(outcar_path: Union[str, Path]) -> List[str]:
+    """
+    Build a flat per-atom element list from OUTCAR POTCAR entries.
+
+    Handles multi-occurrence POTCAR definitions (e.g. N, C, N, C) by
+    aligning to the 'ions per type' array.
+    """
+    outcar_path = Path(outcar_path)
+    types, counts = scan_outcar(outcar_path, ["species"])["species"]
+    return _expand_species(types, counts, outcar_path)
+
+
+@dataclass
+class OutcarTrajectory:
+    """
+    Ionic trajectory of an OUTCAR as contiguous arrays.
+
+    No pymatgen object is created until :meth:`structure` is called, so a
+    relaxation with thousands of steps costs three float arrays.
+
+    Attributes
+    ----------
+    positions : numpy.ndarray, shape (nsteps, natoms, 3)
+        Cartesian positions in Å.
+    forces : numpy.ndarray, shape (nsteps, natoms, 3)
+        Forces in eV/Å.
+    lattices : numpy.ndarray, shape (nsteps, 3, 3)
+        Lattice matrix in effect at every step, in Å.
+    species : numpy.ndarray, shape (natoms,)
+        Element symbol of every atom.
+    """
+
+    positions: np.ndarray
+    forces: np.ndarray
+    lattices: np.ndarray
+    species: np.ndarray
+
+    def __post_init__(self) -> None:
+        self.positions = np.ascontiguousarray(self.positions, dtype=float)
+        self.forces = np.ascontiguousarray(self.forces, dtype=float)
+        self.lattices = np.ascontiguousarray(self.lattices, dtype=float)
+        self.species = np.asarray(self.species, dtype=str)
+        nsteps, natoms = self.positions.shape[:2]
+        if self.positions.shape != (nsteps, natoms, 3):
+            raise ValueError(
+                f"positions must have shape (nsteps, natoms, 3), "
+                f"got {self.positions.shape}."
+            )
+        if self.forces.shape != self.positions.shape:
+            raise ValueError(
+                f"forces shape {self.forces.shape} does not match positions "
+                f"shape {self.positions.shape}."
+            )
+        if self.lattices.shape != (nsteps, 3, 3):
+            raise ValueError(
+                f"lattices must have shape ({nsteps}, 3, 3), got {self.lattices.shape}."
+            )
+        if self.species.shape != (natoms,):
+            raise ValueError(
+                f"Got {self.species.size} species for {natoms} atoms per step."
+            )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def nsteps(self) -> int:
+        return len(self.positions)
+
+    @property
+    def natoms(self) -> int:
+        return len(self.species)
+
+    def structure(self, step: int = -1) -> "Structure":
+        """pymatgen Structure of ionic *step* (negative values count from the end)."""
+        from pymatgen.core import Structure
+
+        return Structure(
+            lattice=self.lattices[step],
+            species=list(self.species),
+            coords=self.positions[step],
+            coords_are_cartesian=True,
+        )
+
+    def structures(self) -> List["Structure"]:
+        """Structures of every step (one pymatgen object each; prefer arrays)."""
+        return [self.structure(step) for step in range(self.nsteps)]
+
+    def to_npz(self, path: Union[str, Path], compressed: bool = False) -> Path:
+        """
+        Write the arrays to a ``.npz`` archive; reopen it with :meth:`from_npz`.
+
+        Parameters
+        ----------
+        path : str or Path
+            Output file (numpy appends ``.npz`` if missing).
+        compressed : bool
+            Use :func:`numpy.savez_compressed` instead of :func:`numpy.savez`.
+
+        Returns
+        -------
+        pathlib.Path
+            The file written.
+        """
+        path = Path(path)
+        if path.suffix != ".npz":
+            path = path.with_name(path.name + ".npz")
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            path,
+            positions=self.positions,
+            forces=self.forces,
+            lattices=self.lattices,
+            species=self.species,
+        )
+        return path
+
+    @classmethod
+    def from_npz(cls, path: Union[str, Path]) -> "OutcarTrajectory":
+        """Load a trajectory written by :meth:`to_npz`."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                positions=data["positions"],
+                forces=data["forces"],
+                lattices=data["lattices"],
+                species=data["species"],
+            )
+
+
+def get_outcar_trajectory(
+    outcar_path: Union[str, Path],
+    poscar_path: Optional[Union[str, Path]] = None,
+) -> OutcarTrajectory:
+    """
+    Read every ionic step of an OUTCAR into an :class:`OutcarTrajectory`.
+
+    Lattice matrices are updated per ionic step from the OUTCAR itself.
+    Species are read natively from POTCAR entries unless *poscar_path* is given.
+    NIONS, species and the trajectory are collected in one pass
+    (:func:`scan_outcar`).
+    """
+    outcar_path = Path(outcar_path)
+    scan = scan_outcar(outcar_path, ["nions", "species", "trajectory"])
+    if scan["nions"] is None:
+        raise ValueError(f"Could not find 'NIONS =' token within {outcar_path}")
+    if poscar_path:
+        species = _outcar_species(outcar_path, poscar_path)
+    else:
+        species = _expand_species(*scan["species"], outcar_path)
+    return OutcarTrajectory(species=species, **scan["trajectory"])
+
+
 def get_structures_and_forces(
     outcar_path: Union[str, Path],
     poscar_path: Optional[Union[str, Path]] = None,
@@ -221,8 +778,8 @@ def get_structures_and_forces(
     """
     Extract all ionic-step structures and forces from a VASP OUTCAR.
 
-    Lattice matrices are updated per ionic step from the OUTCAR itself.
-    Species are read natively from POTCAR entries unless *poscar_path* is given.
+    Builds one pymatgen Structure per step from :func:`get_outcar_trajectory`;
+    use that directly when only coordinates, forces or lattices are needed.
 
     Returns
     -------
@@ -230,74 +787,190 @@ def get_structures_and_forces(
         structures : list of pymatgen.core.Structure
         forces : list of numpy.ndarray, shape (NIONS, 3), in eV/Å
     """
-    from pymatgen.core import Structure
+    trajectory = get_outcar_trajectory(outcar_path, poscar_path)
+    return trajectory.structures(), list(trajectory.forces)
+
+
+def _outcar_species(
+    outcar_path: Path, poscar_path: Optional[Union[str, Path]] = None
+) -> list:
+    """Per-atom species from *poscar_path* if given, else from the OUTCAR POTCARs."""
+    if not poscar_path:
+        return get_species_and_index_map(outcar_path)
+
+    from pymatgen.io.vasp import Poscar
+
+    poscar_path = Path(poscar_path)
+    if not poscar_path.is_file():
+        raise FileNotFoundError(f"POSCAR reference file not found at {poscar_path}")
+    return Poscar.from_file(str(poscar_path)).structure.species
+
+
+@contextmanager
+def _map_outcar(outcar_path: Path):
+    """Memory-map an OUTCAR read-only; pages are only read when touched."""
+    if not outcar_path.is_file():
+        raise FileNotFoundError(f"OUTCAR file not found at {outcar_path}")
+    with open(outcar_path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"OUTCAR file {outcar_path} is empty") from None
+        try:
+            yield buf
+        finally:
+            buf.close()
+
+
+def _line_start(buf, pos: int) -> int:
+    return buf.rfind(b"\n", 0, pos) + 1
+
+
+def _is_force_header(buf, pos: int) -> bool:
+    """True if the TOTAL-FORCE hit at *pos* sits on a POSITION header line."""
+    end = buf.find(b"\n", pos)
+    return b"POSITION" in buf[_line_start(buf, pos) : end if end >= 0 else len(buf)]
+
+
+def _open_outcar(outcar_path: Path):
+    """Memory-map a plain OUTCAR; stream-decompress a compressed one."""
+    if is_compressed(outcar_path):
+        return zopen(outcar_path, "rb")
+    return _map_outcar(outcar_path)
 
+
+def _scan_outcar_stream(f, first_only: bool = False) -> Tuple[List[int], List[int]]:
+    """Lattice and step offsets from a line-by-line scan of a binary stream."""
+    lattices, steps = [], []
+    pos = 0
+    for line in f:
+        if _OUTCAR_LATTICE in line:
+            lattices.append(pos)
+        elif _OUTCAR_FORCES in line and b"POSITION" in line:
+            steps.append(pos)
+            if first_only:
+                break
+        pos += len(line)
+    return lattices, steps
+
+
+def _check_lattice_first(lattices: List[int], steps: List[int], path: Path) -> None:
+    if steps and (not lattices or steps[0] < lattices[0]):
+        raise ValueError(
+            f"Parsed a POSITION block before finding a lattice matrix "
+            f"in {path}. The file layout might be corrupted."
+        )
+
+
+def _outcar_rows(f, offset: int, skip: int, nrows: int, ncols: int, path: Path):
+    """Parse *nrows* x *ncols* floats after skipping *skip* lines from *offset*."""
+    f.seek(offset)
+    for _ in range(skip):
+        f.readline()
+    lines = [f.readline() for _ in range(nrows)]
+    if not lines[-1]:
+        raise ValueError(f"Premature end of file encountered while parsing {path}")
+    return _parse_rows(lines, ncols, path)
+
+
+@dataclass(frozen=True)
+class OutcarIndex:
+    """
+    Byte offsets of the ionic steps in an OUTCAR.
+
+    Attributes
+    ----------
+    lattice_offsets : numpy.ndarray
+        Offsets of every ``VOLUME and BASIS-vectors are now :`` line.
+    step_offsets : numpy.ndarray
+        Offsets of every ``POSITION ... TOTAL-FORCE`` header line.
+    """
+
+    lattice_offsets: np.ndarray
+    step_offsets: np.ndarray
+
+    @property
+    def nsteps(self) -> int:
+        return len(self.step_offsets)
+
+    def lattice_offset(self, step: int) -> int:
+        """Offset of the lattice block in effect at ionic *step*."""
+        i = np.searchsorted(self.lattice_offsets, self.step_offsets[step]) - 1
+        return int(self.lattice_offsets[i])
+
+
+def index_outcar(outcar_path: Union[str, Path]) -> OutcarIndex:
+    """
+    Record the byte offsets of every lattice and POSITION/TOTAL-FORCE block.
+
+    One memory-mapped substring scan; nothing is parsed, so indexing a
+    relaxation with hundreds of 500-atom steps costs about as much as
+    reading the file once.  Compressed files are scanned line by line as
+    they are decompressed, and the offsets refer to the decompressed text.
+
+    Raises
+    ------
+    ValueError
+        If the file is empty, or a POSITION block precedes every lattice.
+    """
     outcar_path = Path(outcar_path)
-    natoms = get_nions(outcar_path)
+    if is_compressed(outcar_path):
+        with zopen(outcar_path, "rb") as f:
+            lattices, steps = _scan_outcar_stream(f)
+        _check_lattice_first(lattices, steps, outcar_path)
+        return OutcarIndex(
+            np.asarray(lattices, dtype=np.int64), np.asarray(steps, dtype=np.int64)
+        )
 
-    if poscar_path:
-        from pymatgen.io.vasp import Poscar
+    with _map_outcar(outcar_path) as buf:
+        lattices, steps = [], []
+        pos = buf.find(_OUTCAR_LATTICE)
+        while pos >= 0:
+            lattices.append(_line_start(buf, pos))
+            pos = buf.find(_OUTCAR_LATTICE, pos + 1)
+        pos = buf.find(_OUTCAR_FORCES)
+        while pos >= 0:
+            if _is_force_header(buf, pos):
+                steps.append(_line_start(buf, pos))
+            pos = buf.find(_OUTCAR_FORCES, pos + 1)
+
+    _check_lattice_first(lattices, steps, outcar_path)
+    return OutcarIndex(
+        np.asarray(lattices, dtype=np.int64), np.asarray(steps, dtype=np.int64)
+    )
 
-        poscar_path = Path(poscar_path)
-        if not poscar_path.is_file():
-            raise FileNotFoundError(f"POSCAR reference file not found at {poscar_path}")
-        species = Poscar.from_file(str(poscar_path)).structure.species
-    else:
-        species = get_species_and_index_map(outcar_path)
-
-    current_lattice = None
-    structures: List[Structure] = []
-    forces: List[np.ndarray] = []
-
-    with open(outcar_path, "r", encoding="utf-8", errors="ignore") as f:
-        iterator = iter(f)
-        for line in iterator:
-            try:
-                if "VOLUME and BASIS-vectors are now :" in line:
-                    for _ in range(4):
-                        next(iterator)
-                    lattice_matrix = []
-                    for _ in range(3):
-                        lattice_matrix.append(
-                            [float(x) for x in next(iterator).split()[:3]]
-                        )
-                    current_lattice = np.array(lattice_matrix)
-
-                if "POSITION" in line and "TOTAL-FORCE" in line:
-                    if current_lattice is None:
-                        raise ValueError(
-                            f"Parsed a POSITION block before finding a lattice matrix "
-                            f"in {outcar_path}. The file layout might be corrupted."
-                        )
-
-                    next(iterator)  # skip dashed separator
-                    coords = np.zeros((natoms, 3))
-                    step_forces = np.zeros((natoms, 3))
-
-                    for i in range(natoms):
-                        data = next(iterator).split()
-                        coords[i] = [float(data[0]), float(data[1]), float(data[2])]
-                        step_forces[i] = [
-                            float(data[3]),
-                            float(data[4]),
-                            float(data[5]),
-                        ]
-
-                    struct = Structure(
-                        lattice=current_lattice,
-                        species=species,
-                        coords=coords,
-                        coords_are_cartesian=True,
-                    )
-                    structures.append(struct)
-                    forces.append(step_forces)
-
-            except StopIteration:
-                raise ValueError(
-                    f"Premature end of file encountered while parsing {outcar_path}"
-                )
 
-    return structures, forces
+def _locate_outcar_step(path: Path, last: bool) -> Tuple[int, int]:
+    """
+    (lattice offset, step offset) of the first or last ionic step.
+
+    In a plain file the last step is found by scanning backwards from EOF,
+    so only the tail of the file is paged in.  A compressed file has to be
+    decompressed up to the wanted step.
+    """
+    if is_compressed(path):
+        with zopen(path, "rb") as f:
+            lattices, steps = _scan_outcar_stream(f, first_only=not last)
+        if not steps:
+            raise ValueError(f"No POSITION/TOTAL-FORCE block found in {path}")
+        _check_lattice_first(lattices, steps[-1:], path)
+        return max(p for p in lattices if p < steps[-1]), steps[-1]
+
+    with _map_outcar(path) as buf:
+        find = buf.rfind if last else buf.find
+        pos = find(_OUTCAR_FORCES)
+        while pos >= 0 and not _is_force_header(buf, pos):
+            pos = (
+                buf.rfind(_OUTCAR_FORCES, 0, pos)
+                if last
+                else find(_OUTCAR_FORCES, pos + 1)
+            )
+        if pos < 0:
+            raise ValueError(f"No POSITION/TOTAL-FORCE block found in {path}")
+        step = _line_start(buf, pos)
+        lattice = buf.rfind(_OUTCAR_LATTICE, 0, step)
+        _check_lattice_first([lattice] if lattice >= 0 else [], [step], path)
+        return _line_start(buf, lattice), step
 
 
 def get_final_structure_and_forces_from_outcar(
@@ -305,8 +978,7 @@ def get_final_structure_and_forces_from_outcar(
     poscar_path: Optional[Union[str, Path]] = None,
 ) -> Tuple["Structure", np.ndarray]:
     """Return only the last structure and forces from an OUTCAR."""
-    structures, forces = get_structures_and_forces(outcar_path, poscar_path=poscar_path)
-    return structures[-1], forces[-1]
+    return OutcarParser(outcar_path).get_final_structure_and_forces(poscar_path)
 
 
 def get_first_structure_and_forces_from_outcar(
@@ -314,14 +986,23 @@ def get_first_structure_and_forces_from_outcar(
     poscar_path: Optional[Union[str, Path]] = None,
 ) -> Tuple["Structure", np.ndarray]:
     """Return only the first structure and forces from an OUTCAR."""
-    structures, forces = get_structures_and_forces(outcar_path, poscar_path=poscar_path)
-    return structures[0], forces[0]
+    return OutcarParser(outcar_path).get_first_structure_and_forces(poscar_path)
 
 
 class OutcarParser:
     """
     Lightweight VASP OUTCAR parser (no pymatgen import at construction time).
 
+    Single steps are read by seeking to their byte offsets: the first and
+    last step directly, any other step through :attr:`index`, which is
+    built on first use.
+
+    Everything else (the whole trajectory, convergence flags and timing)
+    comes from one :func:`scan_outcar` pass, run on first access to any of
+    the cached properties below and shared by all of them.  ``natoms`` and
+    the species come from that pass if it already ran, otherwise from a
+    scan that stops after the header; nothing is read at construction.
+
     Parameters
     ----------
     filename : str or Path
@@ -330,25 +1011,192 @@ class OutcarParser:
 
     def __init__(self, filename: Union[str, Path]):
         self.filename_path = Path(filename).resolve()
-        self.natoms = self.get_natoms()
+        self._index: Optional[OutcarIndex] = None
+        self._poscar_species: Dict[Path, list] = {}
+
+    @cached_property
+    def header(self) -> Dict[str, Any]:
+        """``nions`` and ``species`` results of :func:`scan_outcar`."""
+        if "scan" in self.__dict__:
+            return self.scan
+        return scan_outcar(self.filename_path, ["nions", "species"])
+
+    @cached_property
+    def natoms(self) -> int:
+        nions = self.header["nions"]
+        if nions is None:
+            raise ValueError(
+                f"Could not find 'NIONS =' token within {self.filename_path}"
+            )
+        return nions
 
     def get_natoms(self) -> int:
-        self.natoms = get_nions(self.filename_path)
         return self.natoms
 
+    @property
+    def index(self) -> OutcarIndex:
+        """Byte-offset index of the ionic steps (see :func:`index_outcar`)."""
+        if self._index is None:
+            self._index = index_outcar(self.filename_path)
+        return self._index
+
+    @property
+    def nsteps(self) -> int:
+        if "scan" in self.__dict__:
+            return len(self.forces)
+        return self.index.nsteps
+
+    @cached_property
+    def scan(self) -> Dict[str, Any]:
+        """Results of every registered extractor from a single read of the file."""
+        return scan_outcar(self.filename_path)
+
+    @cached_property
+    def species(self) -> List[str]:
+        """Per-atom element symbols from the POTCAR entries."""
+        return _expand_species(*self.header["species"], self.filename_path)
+
+    @cached_property
+    def ions_per_type(self) -> List[int]:
+        return list(self.header["species"][1])
+
+    def _scanned_trajectory(self) -> Dict[str, np.ndarray]:
+        if self.scan["nions"] is None:
+            raise ValueError(
+                f"Could not find 'NIONS =' token within {self.filename_path}"
+            )
+        return self.scan["trajectory"]
+
+    @cached_property
+    def lattices(self) -> np.ndarray:
+        """Lattice matrices of every ionic step, shape (nsteps, 3, 3) in Å."""
+        return self._scanned_trajectory()["lattices"]
+
+    @cached_property
+    def positions(self) -> np.ndarray:
+        """Cartesian positions of every ionic step, shape (nsteps, natoms, 3) in Å."""
+        return self._scanned_trajectory()["positions"]
+
+    @cached_property
+    def forces(self) -> np.ndarray:
+        """Forces of every ionic step, shape (nsteps, natoms, 3) in eV/Å."""
+        return self._scanned_trajectory()["forces"]
+
+    @cached_property
+    def trajectory(self) -> OutcarTrajectory:
+        """Every ionic step as an :class:`OutcarTrajectory` (POTCAR species)."""
+        return self.get_trajectory()
+
+    def get_trajectory(
+        self, poscar_path: Optional[Union[str, Path]] = None
+    ) -> OutcarTrajectory:
+        """Every ionic step, with species from *poscar_path* if given."""
+        if not poscar_path and "trajectory" in self.__dict__:
+            return self.trajectory
+        return OutcarTrajectory(
+            self.positions, self.forces, self.lattices, self._species(poscar_path)
+        )
+
+    def _species(self, poscar_path) -> list:
+        """Per-atom species from *poscar_path* if given (read once per file)."""
+        if not poscar_path:
+            return self.species
+        key = Path(poscar_path).resolve()
+        if key not in self._poscar_species:
+            self._poscar_species[key] = _outcar_species(self.filename_path, poscar_path)
+        return self._poscar_species[key]
+
+    @cached_property
+    def convergence(self) -> Dict[str, bool]:
+        """Flags of :func:`check_outcar_convergence`."""
+        return self.scan["convergence"]
+
+    @cached_property
+    def timing(self) -> Dict[str, float]:
+        """CPU/wall times (s) and memory (kB) from the end-of-run summary."""
+        return self.scan["timing"]
+
+    def _step_from_scan(self, step: int, poscar_path) -> Tuple["Structure", np.ndarray]:
+        if not self.lattices.shape[0]:
+            raise ValueError(
+                f"No POSITION/TOTAL-FORCE block found in {self.filename_path}"
+            )
+        trajectory = self.get_trajectory(poscar_path)
+        return trajectory.structure(step), trajectory.forces[step]
+
+    def _read_step(
+        self, lattice: int, step: int, poscar_path
+    ) -> Tuple["Structure", np.ndarray]:
+        path, natoms = self.filename_path, self.natoms
+        # lattice < step, so a decompressing stream only ever seeks forward
+        with _open_outcar(path) as f:
+            matrix = _outcar_rows(f, lattice, 5, 3, 3, path)
+            rows = _outcar_rows(f, step, 2, natoms, 6, path)
+        single = OutcarTrajectory(
+            positions=rows[None, :, :3],
+            forces=rows[None, :, 3:],
+            lattices=matrix[None],
+            species=self._species(poscar_path),
+        )
+        return single.structure(0), single.forces[0]
+
+    def get_step(
+        self, step: int, poscar_path: Optional[Union[str, Path]] = None
+    ) -> Tuple["Structure", np.ndarray]:
+        """
+        Structure and forces of ionic *step* (negative values count from the end).
+
+        Raises
+        ------
+        IndexError
+            If *step* is out of range.
+        """
+        nsteps = self.nsteps
+        if not -nsteps <= step < nsteps:
+            raise IndexError(
+                f"Ionic step {step} out of range for {nsteps} steps "
+                f"in {self.filename_path}"
+            )
+        if "scan" in self.__dict__:
+            return self._step_from_scan(step, poscar_path)
+        index = self.index
+        return self._read_step(
+            index.lattice_offset(step), int(index.step_offsets[step]), poscar_path
+        )
+
+    def _get_end_step(self, last: bool, poscar_path) -> Tuple["Structure", np.ndarray]:
+        # A compressed file has to be decompressed to its end anyway
+        if "scan" in self.__dict__ or (last and is_compressed(self.filename_path)):
+            return self._step_from_scan(-1 if last else 0, poscar_path)
+        if self._index is not None:
+            if self._index.nsteps == 0:
+                raise ValueError(
+                    f"No POSITION/TOTAL-FORCE block found in {self.filename_path}"
+                )
+            return self.get_step(-1 if last else 0, poscar_path)
+        lattice, step = _locate_outcar_step(self.filename_path, last)
+        return self._read_step(lattice, step, poscar_path)
+
     def get_structures_and_forces(
         self, poscar_path: Optional[Union[str, Path]] = None
     ) -> Tuple[List["Structure"], List[np.ndarray]]:
-        return get_structures_and_forces(self.filename_path, poscar_path=poscar_path)
+        trajectory = self.get_trajectory(poscar_path)
+        return trajectory.structures(), list(trajectory.forces)
+
+    def get_first_structure_and_forces(
+        self, poscar_path: Optional[Union[str, Path]] = None
+    ) -> Tuple["Structure", np.ndarray]:
+        """First ionic step, found by a forward scan that stops at the first hit."""
+        return self._get_end_step(False, poscar_path)
 
     def get_final_structure_and_forces(
         self, poscar_path: Optional[Union[str, Path]] = None
     ) -> Tuple["Structure", np.ndarray]:
-        structures, forces = self.get_structures_and_forces(poscar_path=poscar_path)
-        return structures[-1], forces[-1]
+        """Last ionic step, found by scanning backwards from EOF (plain files)."""
+        return self._get_end_step(True, poscar_path)
 
     def check_convergence(self) -> Dict[str, bool]:
-        return check_outcar_convergence(self.filename_path)
+        return dict(self.convergence)
 
 
 # =====================================================================
@@ -650,6 +1498,45 @@ def run_pl_calc_vasp_force_mode(
         raise RuntimeError(f"Calculation pipeline failure encountered: {exc}")
 
 
+# Per-process state of the compare-yaml workers, set once by the pool
+# initializer so dR is pickled once per worker rather than once per file.
+_COMPARISON_STATE: Dict[str, Any] = {}
+
+
+def _init_comparison_worker(
+    dR: np.ndarray, engine_kwargs: Dict[str, Any], fft: Tuple[str, Optional[int]]
+) -> None:
+    from defectpl.fft import set_fft_backend
+
+    set_fft_backend(*fft)  # spawned workers do not inherit the CLI setting
+    _COMPARISON_STATE["dR"] = dR
+    _COMPARISON_STATE["engine_kwargs"] = engine_kwargs
+
+
+def _comparison_intensity(
+    band_yaml: Union[str, Path], state: Optional[Dict[str, Any]] = None
+) -> np.ndarray:
+    """Parse one band.yaml and return only its PL intensity (cheap to pickle).
+
+    Pool workers read ``dR`` and the engine kwargs from the state set by
+    :func:`_init_comparison_worker`; the serial path passes *state* directly.
+    """
+    from defectpl.defectpl import Photoluminescence
+    from defectpl.phonon import read_band_yaml
+
+    if state is None:
+        state = _COMPARISON_STATE
+    freqs, evecs, masses = read_band_yaml(band_yaml)
+    pl_run = Photoluminescence(
+        frequencies=freqs,
+        eigenvectors=evecs,
+        masses=masses,
+        dR=state["dR"],
+        **state["engine_kwargs"],
+    )
+    return pl_run.intensity
+
+
 def run_dynamic_yaml_comparison(
     band_yaml_files: List[Union[str, Path]],
     gs_structure: "Structure",
@@ -660,40 +1547,53 @@ def run_dynamic_yaml_comparison(
     xmin: float,
     xmax: float,
     file_name: str,
+    jobs: int = 1,
 ) -> Path:
-    """Build and plot comparative PL intensities for multiple band.yaml files."""
+    """
+    Build and plot comparative PL intensities for multiple band.yaml files.
+
+    ``dR`` is computed once and handed to every worker.  With ``jobs > 1``
+    the band.yaml files are parsed and their spectra computed in a process
+    pool; only the intensity arrays travel back, in input order.
+    ``jobs <= 0`` uses every CPU core.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
     import matplotlib.pyplot as plt
 
-    from defectpl.defectpl import Photoluminescence
-    from defectpl.phonon import read_band_yaml
+    from defectpl.fft import get_fft_backend
 
     dR = calc_dR(gs_structure, es_structure)
-    all_pl_runs = []
-
-    for b_yaml in band_yaml_files:
-        freqs, evecs, masses = read_band_yaml(b_yaml)
-        pl_run = Photoluminescence(
-            frequencies=freqs,
-            eigenvectors=evecs,
-            masses=masses,
-            dR=dR,
-            EZPL=ezpl,
-            gamma=gamma,
-            max_energy=5.0,
-            sigma=6e-3,
-        )
-        all_pl_runs.append(pl_run)
+    engine_kwargs = dict(
+        EZPL=ezpl, gamma=gamma, max_energy=5.0, sigma=6e-3, resolution=1000
+    )
+    fft = get_fft_backend()
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(band_yaml_files))
+
+    if jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_comparison_worker,
+            initargs=(dR, engine_kwargs, (fft.name, fft.workers)),
+        ) as pool:
+            intensities = list(pool.map(_comparison_intensity, band_yaml_files))
+    else:
+        state = {"dR": dR, "engine_kwargs": engine_kwargs}
+        intensities = [_comparison_intensity(f, state) for f in band_yaml_files]
 
     plt.figure(figsize=(4, 4))
-    for pl_run in all_pl_runs:
-        plt.plot(pl_run.intensity.__abs__(), "k", lw=1.2)
+    for intensity in intensities:
+        plt.plot(np.abs(intensity), "k", lw=1.2)
 
     plt.ylabel(r"$I(\hbar\omega)$")
     plt.xlabel(r"Photon energy (eV)")
     plt.xlim(xmin, xmax)
 
     x_values, _ = plt.xticks()
-    resolution = all_pl_runs[0].resolution if all_pl_runs else 1.0
+    resolution = engine_kwargs["resolution"]
     labels = [float(x) / resolution for x in x_values]
     plt.xticks(x_values, labels)
 
@@ -746,7 +1646,8 @@ class VaspReader:
 
     # ---- PhononReader ---------------------------------------------------
 
-    def read_band_yaml(self, path: str) -> "PhononData":  # noqa: F821
+    def read_band_yaml(self, path: str) -> "PhononData":
+        """Γ-point phonons from a phonopy band.yaml or ``*.hdf5`` output."""
         from defectpl.core.structures import PhononData
         from defectpl.phonon import read_band_yaml as _read
 
@@ -776,7 +1677,7 @@ class VaspReader:
 
     # ---- ElectronicReader -----------------------------------------------
 
-    def read_eigenvalues(self, path: str, k_idx: int = 0) -> "EigenvalData":  # noqa: F821
+    def read_eigenvalues(self, path: str, k_idx: int = 0) -> "EigenvalData":
         from defectpl.core.structures import EigenvalData
 
         data = read_eigenval_file(path, k_idx=k_idx)
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+Diagonalization-free electron–phonon spectral function S(ω) by Lanczos.
+
+S(ω) needs only the spectral measure of the mass-weighted dynamical matrix
+D projected onto one vector — ``√m·ΔR`` in displacement mode,
+``ΔF/√m`` in force mode:
+
+.. math::
+
+    \\mu(\\lambda) = \\sum_k |\\langle e_k | v \\rangle|^2 \\, \\delta(\\lambda - \\omega_k^2)
+
+``n`` Lanczos steps seeded with *v* give the Gauss quadrature of this
+measure: ``n`` nodes θ\\ :sub:`j` (Ritz values) with weights
+``‖v‖² |s_{0j}|²`` that reproduce every moment up to degree ``2n − 1``.
+Each node is an *effective mode* of energy ``ħ√θ_j`` whose
+configuration coordinate follows from its weight, so the usual pipeline
+(:func:`~defectpl.utils.calc_Sks`, :func:`~defectpl.utils.calc_S_omega`,
+:func:`~defectpl.utils.calc_St`, :func:`~defectpl.utils.calc_Gts`,
+:func:`~defectpl.utils.calc_Spectrum_Intensity`) runs on them unchanged.
+The cost is ``O(nnz × niter)`` sparse matrix–vector products instead of the
+``O(N³)`` diagonalisation, and memory is a few vectors of length 3N, which
+makes supercells of 10⁴ atoms and more tractable.
+
+The sparse dynamical matrix is built by :func:`sparse_dynamical_matrix`
+from full force constants, keeping only atom pairs within a distance
+cutoff.  scipy is required (imported lazily).
+
+Example
+-------
+>>> from defectpl import utils
+>>> from defectpl.lanczos import lanczos_modes, sparse_dynamical_matrix
+>>> dyn = sparse_dynamical_matrix(structure, "FORCE_CONSTANTS", cutoff=8.0)
+>>> freqs, Sks = lanczos_modes(dyn, masses, dR=dR, niter=300)
+>>> S_omega = utils.calc_S_omega(freqs, Sks, [0.0, 5.0, 5000], sigma=6e-3)
+>>> Gts = utils.calc_Gts(utils.calc_St(S_omega), Sks.sum(), gamma=2.0, resolution=1000)
+>>> A, I = utils.calc_Spectrum_Intensity(Gts, EZPL=1.95, resolution=1000)
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+import defectpl.utils as utils
+from defectpl.constants import AMU2KG, ANG2M, EV2J, HBAR_EVS
+from defectpl.io.compression import zopen
+
+# Eigenvalue of the dynamical matrix in eV/(Å² amu) -> (ω in rad/s)²
+_EIGVAL2OMEGA_SQ = EV2J / (ANG2M**2 * AMU2KG)
+# Effective modes below this energy (eV) are treated as acoustic
+_ACOUSTIC_EV = 1e-5
+
+
+def _require_scipy():
+    """Import :mod:`scipy.sparse` and :mod:`scipy.linalg`, with a clear error."""
+    try:
+        import scipy.linalg
+        import scipy.sparse
+    except ImportError as exc:
+        raise ImportError(
+            "scipy is required for the Lanczos spectral function.  "
+            "Install with:  pip install scipy"
+        ) from exc
+    return scipy
+
+
+def _iter_force_constants(
+    path: Union[str, Path], chunk: int = 65536
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Stream a text FORCE_CONSTANTS file as ``(i, j, blocks)`` chunks.
+
+    ``i`` and ``j`` are zero-based atom indices and ``blocks`` the matching
+    (nblocks, 3, 3) matrices, so files far larger than memory can be
+    filtered block by block.
+    """
+    with zopen(path) as f:
+        header = f.readline().split()
+        if len(header) > 1 and header[0] != header[1]:
+            raise ValueError(
+                f"{path}: compact force constants are not supported; write "
+                "full force constants with phonopy (--full-fc)."
+            )
+        while True:
+            lines = list(islice(f, 4 * chunk))
+            if not lines:
+                return
+            values = np.array(" ".join(lines).split(), dtype=float).reshape(-1, 11)
+            idx = values[:, :2].astype(int) - 1
+            yield idx[:, 0], idx[:, 1], values[:, 2:].reshape(-1, 3, 3)
+
+
+def _sparse_blocks(
+    force_constants, natoms: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a (3N, 3N) sparse force-constant matrix into ``(i, j, blocks)``."""
+    if force_constants.shape != (3 * natoms, 3 * natoms):
+        raise ValueError(
+            f"Sparse force constants of shape {force_constants.shape} do not "
+            f"match a structure of {natoms} atoms."
+        )
+    coo = force_constants.tocoo()
+    pair, inverse = np.unique(
+        (coo.row // 3) * natoms + coo.col // 3, return_inverse=True
+    )
+    blocks = np.zeros((len(pair), 3, 3))
+    np.add.at(blocks, (inverse, coo.row % 3, coo.col % 3), coo.data)
+    return pair // natoms, pair % natoms, blocks
+
+
+def _pair_distances(structure: Any, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Minimum-image distances (Å) between the atom pairs ``(i, j)``."""
+    frac = np.asarray(structure.frac_coords)
+    d = frac[j] - frac[i]
+    d -= np.rint(d)
+    return np.linalg.norm(d @ np.asarray(structure.lattice.matrix), axis=1)
+
+
+def sparse_dynamical_matrix(
+    structure: Any,
+    force_constants: Union[str, Path, np.ndarray],
+    cutoff: Optional[float] = None,
+    masses: Optional[np.ndarray] = None,
+    enforce_asr: Optional[bool] = None,
+):
+    """
+    Sparse mass-weighted Γ dynamical matrix of a supercell.
+
+    Parameters
+    ----------
+    structure : str, pathlib.Path or pymatgen Structure
+        Supercell the force constants belong to; provides the masses and,
+        with *cutoff*, the interatomic distances (minimum image).
+    force_constants : str, pathlib.Path, numpy.ndarray or sparse matrix
+        Full (natoms, natoms, 3, 3) force constants in eV/Å², a
+        (3 natoms, 3 natoms) scipy sparse matrix (e.g. from
+        :func:`~defectpl.phonon.embed_force_constants`), or a text
+        FORCE_CONSTANTS file, which is streamed so that only the pairs kept
+        by *cutoff* are ever held in memory.
+    cutoff : float, optional
+        Drop atom pairs farther apart than this (Å).  Default ``None``
+        keeps every non-zero block.
+    masses : numpy.ndarray, optional
+        Atomic masses in amu overriding those of the species.
+    enforce_asr : bool, optional
+        Reset each on-site block to ``Φ_ii = −Σ_{j≠i} Φ_ij`` so the
+        acoustic sum rule still holds after truncation (the three
+        translations stay exact zero modes).  Default: only when a
+        *cutoff* is given, so that without one the matrix equals
+        :func:`~defectpl.phonon.gamma_dynamical_matrix` exactly.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Symmetric (3 natoms, 3 natoms) matrix in eV/(Å² amu), the sparse
+        counterpart of :func:`~defectpl.phonon.gamma_dynamical_matrix`.
+
+    Raises
+    ------
+    ValueError
+        If the force constants do not match the structure, or are compact.
+    """
+    scipy = _require_scipy()
+    if enforce_asr is None:
+        enforce_asr = cutoff is not None
+    if isinstance(structure, (str, Path)):
+        from pymatgen.core import Structure
+
+        structure = Structure.from_file(str(structure))
+    natoms = len(structure)
+    if masses is None:
+        masses = [site.specie.atomic_mass for site in structure]
+    masses = np.asarray(masses, dtype=float)
+
+    if isinstance(force_constants, (str, Path)):
+        chunks = _iter_force_constants(force_constants)
+    elif scipy.sparse.issparse(force_constants):
+        chunks = iter([_sparse_blocks(force_constants, natoms)])
+    else:
+        fc = np.asarray(force_constants, dtype=float)
+        if fc.shape != (natoms, natoms, 3, 3):
+            raise ValueError(
+                f"Force constants of shape {fc.shape} do not match a structure "
+                f"of {natoms} atoms."
+            )
+        i, j = np.nonzero(np.any(fc != 0.0, axis=(2, 3)))
+        chunks = iter([(i, j, fc[i, j])])
+
+    rows: List[np.ndarray] = [np.zeros(0, dtype=int)]
+    cols: List[np.ndarray] = [np.zeros(0, dtype=int)]
+    blocks: List[np.ndarray] = [np.zeros((0, 3, 3))]
+    for i, j, fc_ij in chunks:
+        if i.size and max(i.max(), j.max()) >= natoms:
+            raise ValueError(
+                f"Force constants reference atom {max(i.max(), j.max()) + 1} "
+                f"of a structure with {natoms} atoms."
+            )
+        keep = np.any(fc_ij != 0.0, axis=(1, 2))
+        if cutoff is not None:
+            keep &= _pair_distances(structure, i, j) <= cutoff
+        if enforce_asr:
+            keep &= i != j
+        rows.append(i[keep])
+        cols.append(j[keep])
+        blocks.append(fc_ij[keep])
+    i, j = np.concatenate(rows), np.concatenate(cols)
+    fc_ij = np.concatenate(blocks)
+
+    if enforce_asr:
+        onsite = np.zeros((natoms, 3, 3))
+        np.add.at(onsite, i, fc_ij)
+        i = np.concatenate([i, np.arange(natoms)])
+        j = np.concatenate([j, np.arange(natoms)])
+        fc_ij = np.concatenate([fc_ij, -onsite])
+
+    # Expand every 3 x 3 block into its nine matrix entries
+    a, b = np.meshgrid(np.arange(3), np.arange(3), indexing="ij")
+    r = (3 * i[:, None, None] + a).ravel()
+    c = (3 * j[:, None, None] + b).ravel()
+    inv_sqrt_m = np.repeat(1.0 / np.sqrt(masses), 3)
+    values = fc_ij.ravel() * inv_sqrt_m[r] * inv_sqrt_m[c]
+    dyn = scipy.sparse.coo_matrix((values, (r, c)), shape=(3 * natoms,) * 2).tocsr()
+    return 0.5 * (dyn + dyn.T)
+
+
+def lanczos_tridiagonal(
+    operator, v0: np.ndarray, niter: int = 300, tol: float = 1e-12
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lanczos recursion of a symmetric operator seeded with *v0*.
+
+    Parameters
+    ----------
+    operator : array, sparse matrix or scipy LinearOperator
+        Symmetric operator supporting ``operator @ x``.
+    v0 : numpy.ndarray
+        Seed vector (not necessarily normalised).
+    niter : int, default 300
+        Maximum number of steps.
+    tol : float, default 1e-12
+        Stop early when ``β_k`` falls below ``tol × |α_0|`` (invariant
+        subspace found: the quadrature is then exact).
+
+    Returns
+    -------
+    alpha, beta : numpy.ndarray
+        Diagonal (length n) and off-diagonal (length n − 1) of the
+        tridiagonal Lanczos matrix.
+
+    Notes
+    -----
+    No reorthogonalisation is done, so memory stays at three vectors.  Loss
+    of orthogonality produces duplicated ("ghost") Ritz values, but the
+    quadrature weights split between copies and moments of the measure are
+    unaffected.
+    """
+    v = np.asarray(v0, dtype=float).ravel()
+    norm = np.linalg.norm(v)
+    if norm == 0.0:
+        raise ValueError("The Lanczos seed vector is zero.")
+    v = v / norm
+    v_prev = np.zeros_like(v)
+    beta_prev = 0.0
+    alpha: List[float] = []
+    beta: List[float] = []
+    for _ in range(min(int(niter), len(v))):
+        w = operator @ v - beta_prev * v_prev
+        a = float(w @ v)
+        w -= a * v
+        alpha.append(a)
+        b = float(np.linalg.norm(w))
+        if b <= tol * max(abs(alpha[0]), 1.0):
+            break
+        beta.append(b)
+        v_prev, v, beta_prev = v, w / b, b
+    return np.array(alpha), np.array(beta[: len(alpha) - 1])
+
+
+def lanczos_spectral_measure(
+    operator, v0: np.ndarray, niter: int = 300
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gauss quadrature of the spectral measure of *operator* projected on *v0*.
+
+    Returns
+    -------
+    nodes, weights : numpy.ndarray
+        Ritz values θ\\ :sub:`j` and weights ``‖v0‖² |s_{0j}|²`` with
+        ``Σ_j w_j f(θ_j) ≈ Σ_k |⟨e_k|v0⟩|² f(λ_k)``.
+    """
+    scipy = _require_scipy()
+    alpha, beta = lanczos_tridiagonal(operator, v0, niter)
+    nodes, vecs = scipy.linalg.eigh_tridiagonal(alpha, beta)
+    weights = float(np.dot(np.ravel(v0), np.ravel(v0))) * vecs[0] ** 2
+    return nodes, weights
+
+
+def lanczos_modes(
+    dynamical_matrix,
+    masses: np.ndarray,
+    dR: Optional[np.ndarray] = None,
+    dF: Optional[np.ndarray] = None,
+    niter: int = 300,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Effective phonon modes ``(ω_j, S_j)`` of a defect from a Lanczos run.
+
+    The seed is ``√m·dR`` (displacement mode) or ``dF/√m`` (force mode; a
+    non-zero *dF* wins, as in the lineshape engines).  Each Gauss node is
+    turned into a mode of energy ``ħ√θ_j`` with configuration coordinate
+    ``q_j = √w_j`` (displacement) or ``√w_j / ω_j²`` (force), and
+    :func:`~defectpl.utils.calc_Sks` gives its partial Huang–Rhys factor.
+
+    Parameters
+    ----------
+    dynamical_matrix : array, sparse matrix or LinearOperator
+        Mass-weighted dynamical matrix in eV/(Å² amu), shape (3N, 3N), e.g.
+        from :func:`sparse_dynamical_matrix`.
+    masses : numpy.ndarray
+        Atomic masses in amu, shape (N,).
+    dR : numpy.ndarray, optional
+        Displacements in Å, shape (N, 3).
+    dF : numpy.ndarray, optional
+        Force differences in eV/Å, shape (N, 3).
+    niter : int, default 300
+        Lanczos steps.  The resulting S(ω) is converged once the spacing of
+        the nodes is well below the broadening σ; a few hundred steps are
+        typically enough.
+
+    Returns
+    -------
+    frequencies : numpy.ndarray
+        Effective mode energies in eV, shape (n,).
+    Sks : numpy.ndarray
+        Partial Huang–Rhys factors, shape (n,); ``Sks.sum()`` is the HR
+        factor.
+
+    Raises
+    ------
+    ValueError
+        If neither *dR* nor *dF* is given and non-zero.
+    """
+    sqrt_m = np.sqrt(np.asarray(masses, dtype=float))[:, np.newaxis]
+    force_mode = dF is not None and np.any(dF)
+    if force_mode:
+        seed = np.asarray(dF, dtype=float) / sqrt_m
+    elif dR is not None and np.any(dR):
+        seed = np.asarray(dR, dtype=float) * sqrt_m
+    else:
+        raise ValueError("Either dR or dF must be provided and non-zero.")
+
+    nodes, weights = lanczos_spectral_measure(dynamical_matrix, seed, niter)
+    omega = np.sqrt(np.clip(nodes, 0.0, None) * _EIGVAL2OMEGA_SQ)  # rad/s
+    frequencies = HBAR_EVS * omega
+    proj = np.sqrt(weights)
+    if force_mode:
+        acoustic = frequencies < _ACOUSTIC_EV
+        omega_sq = np.where(acoustic, np.inf, omega**2)
+        qks = proj / omega_sq * ((EV2J / ANG2M) / np.sqrt(AMU2KG))
+    else:
+        qks = proj * ANG2M * np.sqrt(AMU2KG)
+    return frequencies, utils.calc_Sks(qks, frequencies)
+
+
+def calc_S_omega_lanczos(
+    dynamical_matrix,
+    masses: np.ndarray,
+    omega_range: List[float],
+    sigma: Union[float, Tuple[float, float]] = 6e-3,
+    dR: Optional[np.ndarray] = None,
+    dF: Optional[np.ndarray] = None,
+    niter: int = 300,
+) -> np.ndarray:
+    """
+    S(ω) on the energy grid without diagonalising the dynamical matrix.
+
+    :func:`lanczos_modes` followed by :func:`~defectpl.utils.calc_S_omega`;
+    the result is a drop-in replacement for the S(ω) of the lineshape
+    engines and feeds :func:`~defectpl.utils.calc_St` directly.
+
+    Parameters
+    ----------
+    dynamical_matrix, masses, dR, dF, niter
+        See :func:`lanczos_modes`.
+    omega_range : list of float
+        Energy grid ``[start, stop, npoints]`` in eV.
+    sigma : float or (float, float), default 6e-3
+        Gaussian broadening in eV (see :func:`~defectpl.utils.calc_S_omega`).
+
+    Returns
+    -------
+    numpy.ndarray
+        S(ω) in eV\\ :sup:`-1`, shape (npoints,).
+    """
+    frequencies, Sks = lanczos_modes(dynamical_matrix, masses, dR, dF, niter)
+    return utils.calc_S_omega(frequencies, Sks, omega_range, sigma)
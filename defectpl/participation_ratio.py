@@ -65,6 +65,8 @@ from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from defectpl.io.compression import zopen
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -103,7 +105,7 @@ def _parse_procar_native(procar_path: Path) -> dict:
     if not procar_path.exists():
         raise FileNotFoundError(f"PROCAR not found: {procar_path}")
 
-    with open(procar_path, "r", encoding="utf-8", errors="ignore") as fh:
+    with zopen(procar_path, "r", encoding="utf-8", errors="ignore") as fh:
         lines = fh.readlines()
 
     # ── header ──────────────────────────────────────────────────────────────
@@ -319,12 +321,16 @@ def read_procar(procar_path: str | Path, use_pymatgen: bool = True) -> dict:
                 "site_proj": site_proj,
                 "eigenvalues": getattr(p, "eigenvalues", None),
                 "occupancies": getattr(p, "occupancies", None),
-                "kpoints": np.array(p.kpoints)
-                if getattr(p, "kpoints", None) is not None
-                else None,
-                "weights": np.array(p.weights)
-                if getattr(p, "weights", None) is not None
-                else None,
+                "kpoints": (
+                    np.array(p.kpoints)
+                    if getattr(p, "kpoints", None) is not None
+                    else None
+                ),
+                "weights": (
+                    np.array(p.weights)
+                    if getattr(p, "weights", None) is not None
+                    else None
+                ),
             }
         except Exception as exc:
             logger.warning(
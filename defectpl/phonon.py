@@ -6,15 +6,20 @@ using Phonopy and VASP outputs. All calculations convert frequency data to eV.
 Author: Shibu Meher
 """
 
+import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 import yaml
 
 from monty.json import MSONable
 
 # Import energy rescaling metric conversion factors from constants
-from defectpl.constants import THZ2EV
+from defectpl.cache import cached_arrays
+from defectpl.constants import AMU2KG, ANG2M, EV2J, HBAR_EVS, THZ2EV
+from defectpl.core.structures import NPY_FILES, NPY_META, PhononData
+from defectpl.io.compression import zopen
 
 
 # phonopy is a declared dependency but may not be present in all environments.
@@ -33,6 +38,18 @@ def _require_phonopy(fn_name: str = "") -> None:
         raise ImportError(msg) from exc
 
 
+def _require_h5py():
+    """Import :mod:`h5py`, raising a clear error when it is missing."""
+    try:
+        import h5py
+    except ImportError as exc:
+        raise ImportError(
+            "h5py is required to read phonopy HDF5 files.  "
+            "Install with:  pip install h5py"
+        ) from exc
+    return h5py
+
+
 class GammaPhononData(MSONable):
     """
     An MSONable data container storing processed Gamma-point phonon properties.
@@ -94,6 +111,23 @@ class GammaPhononData(MSONable):
             meta_info=d.get("meta_info", {}),
         )
 
+    def to_phonon_data(self) -> PhononData:
+        """
+        Convert to an array-backed :class:`~defectpl.core.structures.PhononData`.
+
+        The nested lists are converted once; call
+        :meth:`~defectpl.core.structures.PhononData.save_npy` on the result
+        to keep large supercells memory-mappable on disk.
+        """
+        return PhononData(
+            frequencies=self.frequencies,
+            eigenvectors=self.eigenvectors,
+            masses=self.masses,
+            natoms=self.natoms,
+            nmodes=self.nmodes,
+            meta=dict(self.meta_info),
+        )
+
 
 def create_force_constants_from_vasprun(
     vasprun_filename: Union[str, Path], is_hdf5: bool = False, log_level: int = 1
@@ -233,20 +267,885 @@ def calculate_gamma_phonon_to_band_yaml(
     phonon.write_yaml_band_structure(filename=str(output_filename))
 
 
+# Eigenvalue of the dynamical matrix in eV/(Å² amu) -> (ω in rad/s)²
+_EIGVAL2OMEGA_SQ = EV2J / (ANG2M**2 * AMU2KG)
+
+
+def read_force_constants(path: Union[str, Path]) -> np.ndarray:
+    """
+    Read a phonopy FORCE_CONSTANTS (text) or force_constants.hdf5 file.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        File to read; a ``.hdf5``/``.h5`` suffix selects the HDF5 reader
+        (requires h5py).
+
+    Returns
+    -------
+    numpy.ndarray
+        Force constants Φ of shape (natoms, natoms, 3, 3) in eV/Å².
+
+    Raises
+    ------
+    ValueError
+        If the file holds phonopy's compact ``(n_primitive, natoms, 3, 3)``
+        form, which needs the symmetry mapping phonopy keeps, or is
+        malformed.
+    """
+    path = Path(path)
+    if path.suffix in (".hdf5", ".h5"):
+        h5py = _require_h5py()
+        with h5py.File(path, "r") as f:
+            fc = np.array(f["force_constants"], dtype=float)
+    else:
+        with zopen(path) as f:
+            header = f.readline().split()
+            tokens = f.read().split()
+        if not header:
+            raise ValueError(f"{path}: empty FORCE_CONSTANTS file.")
+        n1 = int(header[0])
+        n2 = int(header[1]) if len(header) > 1 else n1
+        # Every block is "i j" followed by a 3 x 3 matrix: 11 tokens
+        if len(tokens) != n1 * n2 * 11:
+            raise ValueError(
+                f"{path}: expected {n1 * n2} blocks of 'i j' + 3x3 values, "
+                f"found {len(tokens)} values."
+            )
+        blocks = np.array(tokens, dtype=float).reshape(n1 * n2, 11)
+        idx = blocks[:, :2].astype(int) - 1
+        # Compact files list only the primitive atoms as rows
+        rows = np.unique(idx[:, 0], return_inverse=True)[1]
+        fc = np.zeros((n1, n2, 3, 3))
+        fc[rows, idx[:, 1]] = blocks[:, 2:].reshape(-1, 3, 3)
+    if fc.ndim != 4 or fc.shape[2:] != (3, 3):
+        raise ValueError(f"{path}: force constants have shape {fc.shape}.")
+    if fc.shape[0] != fc.shape[1]:
+        raise ValueError(
+            f"{path}: compact force constants ({fc.shape[0]} x {fc.shape[1]} atoms) "
+            "are not supported; write full force constants with phonopy "
+            "(FULL_FORCE_CONSTANTS = .TRUE. / --full-fc)."
+        )
+    return fc
+
+
+def gamma_dynamical_matrix(
+    force_constants: np.ndarray, masses: np.ndarray
+) -> np.ndarray:
+    """
+    Mass-weighted dynamical matrix of a supercell at Γ.
+
+    ``D[3i+a, 3j+b] = Φ[i, j, a, b] / sqrt(m_i m_j)``, symmetrised as
+    ``(D + Dᵀ) / 2`` to remove numerical asymmetry of the force constants.
+
+    Parameters
+    ----------
+    force_constants : numpy.ndarray
+        Shape (natoms, natoms, 3, 3), eV/Å².
+    masses : numpy.ndarray
+        Shape (natoms,), amu.
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape (3 natoms, 3 natoms), eV/(Å² amu).
+    """
+    natoms = len(masses)
+    inv_sqrt_m = np.repeat(1.0 / np.sqrt(np.asarray(masses, dtype=float)), 3)
+    dyn = np.asarray(force_constants, dtype=float).transpose(0, 2, 1, 3)
+    dyn = dyn.reshape(3 * natoms, 3 * natoms) * np.outer(inv_sqrt_m, inv_sqrt_m)
+    return 0.5 * (dyn + dyn.T)
+
+
+def _energy_to_eigval(energy: float) -> float:
+    """Phonon energy (eV) -> dynamical-matrix eigenvalue (eV/(Å² amu))."""
+    return (energy / HBAR_EVS) ** 2 / _EIGVAL2OMEGA_SQ
+
+
+def _load_force_constants(force_constants) -> Tuple[np.ndarray, str]:
+    """Return ``(force constants as (N, N, 3, 3), source label)`` for any input."""
+    if isinstance(force_constants, (str, Path)):
+        return read_force_constants(force_constants), str(force_constants)
+    if hasattr(force_constants, "toarray"):
+        # (3N, 3N) scipy sparse matrix, e.g. from embed_force_constants
+        dense = force_constants.toarray()
+        n = len(dense) // 3
+        return dense.reshape(n, 3, n, 3).transpose(0, 2, 1, 3), "sparse"
+    return np.asarray(force_constants, dtype=float), "array"
+
+
+def structure_masses(structure: Union[str, Path, Any]) -> np.ndarray:
+    """Atomic masses (amu) of a structure file or pymatgen Structure."""
+    if isinstance(structure, (str, Path)):
+        from pymatgen.core import Structure
+
+        structure = Structure.from_file(str(structure))
+    return np.array([site.specie.atomic_mass for site in structure], dtype=float)
+
+
+def eigen_to_phonon_data(
+    eigvals: np.ndarray,
+    eigvecs: np.ndarray,
+    masses: np.ndarray,
+    meta: Optional[Dict[str, Any]] = None,
+) -> PhononData:
+    """
+    Wrap eigenpairs of a Γ dynamical matrix as :class:`PhononData`.
+
+    Parameters
+    ----------
+    eigvals : numpy.ndarray
+        Eigenvalues in eV/(Å² amu), shape (nmodes,).
+    eigvecs : numpy.ndarray
+        Eigenvectors as columns, shape (3 natoms, nmodes).
+    masses : numpy.ndarray
+        Atomic masses in amu, shape (natoms,).
+    meta : dict, optional
+        Metadata stored on the result.
+
+    Returns
+    -------
+    PhononData
+        Frequencies in eV (imaginary modes clamped to 0) and eigenvectors
+        of shape (nmodes, natoms, 3).
+    """
+    frequencies = HBAR_EVS * np.sqrt(np.clip(eigvals, 0.0, None) * _EIGVAL2OMEGA_SQ)
+    eigenvectors = np.ascontiguousarray(eigvecs.T).reshape(-1, len(masses), 3)
+    return PhononData(
+        frequencies=frequencies,
+        eigenvectors=eigenvectors,
+        masses=masses,
+        natoms=len(masses),
+        nmodes=len(frequencies),
+        meta=meta or {},
+    )
+
+
+def calculate_gamma_phonons(
+    structure: Union[str, Path, Any] = "POSCAR",
+    force_constants: Union[str, Path, np.ndarray] = "FORCE_CONSTANTS",
+    frequency_range: Optional[Tuple[float, float]] = None,
+    masses: Optional[np.ndarray] = None,
+    defect_center: Optional[Sequence[float]] = None,
+    dR: Optional[np.ndarray] = None,
+    dF: Optional[np.ndarray] = None,
+    irreps: Optional[Sequence[str]] = None,
+    symprec: float = 0.01,
+) -> PhononData:
+    """
+    Γ-point phonons of a supercell straight from its force constants.
+
+    Builds the mass-weighted dynamical matrix in NumPy and diagonalises it
+    with LAPACK ``eigh``, returning the same arrays as
+    :func:`calculate_gamma_phonon_to_band_yaml` followed by
+    :func:`read_band_yaml`, without writing or parsing a band.yaml.
+
+    Parameters
+    ----------
+    structure : str, pathlib.Path or pymatgen Structure, default "POSCAR"
+        Supercell the force constants belong to (POSCAR/SPOSCAR or any
+        format pymatgen reads).  Only the species are used, for the masses.
+    force_constants : str, pathlib.Path, numpy.ndarray or sparse matrix, default "FORCE_CONSTANTS"
+        FORCE_CONSTANTS / force_constants.hdf5 file (see
+        :func:`read_force_constants`), a (natoms, natoms, 3, 3) array in
+        eV/Å², or the (3 natoms, 3 natoms) sparse matrix of
+        :func:`embed_force_constants` (densified; for very large supercells
+        use :mod:`defectpl.lanczos` instead).
+    frequency_range : (float, float), optional
+        ``(emin, emax)`` in eV.  Only the modes in this range are computed,
+        with the subset eigensolver of :func:`scipy.linalg.eigh` when scipy
+        is available.  A lower bound ≤ 0 also keeps acoustic and imaginary
+        modes.  Default ``None`` (all 3 natoms modes).
+    masses : numpy.ndarray, optional
+        Atomic masses in amu overriding those of the species (e.g. for
+        isotopes).
+    defect_center : sequence of 3 float, optional
+        Fractional coordinates of the defect.  Switches on the
+        symmetry-adapted solver: the dynamical matrix is block-diagonalised
+        by the irreps of the defect point group (see
+        :mod:`defectpl.symmetry`) and only the blocks selected by *irreps*,
+        or else those *dR* / *dF* overlap, are diagonalised.  Every mode is
+        labelled with its irrep in ``meta["irreps"]``.
+    dR, dF : numpy.ndarray, optional
+        Displacement (Å) or force difference (eV/Å), shape (natoms, 3), used
+        with *defect_center* to pick the blocks with nonzero S_k.
+    irreps : sequence of str, optional
+        Irrep labels to diagonalise (e.g. ``["A1", "E"]`` for Jahn–Teller
+        analysis).  Default: the blocks *dR* / *dF* overlap, or all blocks.
+    symprec : float, default 0.01
+        Symmetry tolerance in Å for the defect point group.
+
+    Returns
+    -------
+    PhononData
+        Frequencies in eV (imaginary modes clamped to 0, as in
+        :func:`read_band_yaml`), eigenvectors of shape (nmodes, natoms, 3)
+        and masses in amu.  With *defect_center*, ``meta`` also holds
+        ``point_group`` and the per-mode ``irreps``.
+
+    Raises
+    ------
+    ValueError
+        If the structure and force constants disagree in the atom count,
+        *frequency_range* is not ``(emin, emax)`` with ``emin < emax``, or
+        *irreps* names an irrep the defect does not have.
+
+    Notes
+    -----
+    Masses come from pymatgen's element table, which can differ from
+    phonopy's in the last digits; pass *masses* to reproduce a phonopy run
+    exactly.
+
+    A ``dR`` between two states of the same symmetry only overlaps the
+    totally symmetric irrep, so for NV⁻ (C3v, 215 atoms) the solver
+    diagonalises one 125 × 125 block instead of the 645 × 645 matrix.  The
+    symmetry-adapted modes are exact for force constants with the full
+    defect symmetry; for the usual numerical noise the blocks act as a
+    symmetrisation.
+    """
+    force_constants, source = _load_force_constants(force_constants)
+    if masses is None:
+        masses = structure_masses(structure)
+    masses = np.asarray(masses, dtype=float)
+    if force_constants.shape != (len(masses), len(masses), 3, 3):
+        raise ValueError(
+            f"Force constants of shape {force_constants.shape} do not match a "
+            f"structure of {len(masses)} atoms."
+        )
+
+    dyn = gamma_dynamical_matrix(force_constants, masses)
+    meta = {"source_file": source, "frequency_range": frequency_range}
+    if frequency_range is not None:
+        emin, emax = (float(e) for e in frequency_range)
+        if not emin < emax:
+            raise ValueError(
+                f"frequency_range must be (emin, emax) with emin < emax, "
+                f"got {frequency_range!r}."
+            )
+        lower = -np.inf if emin <= 0.0 else _energy_to_eigval(emin)
+        upper = _energy_to_eigval(emax) if emax > 0.0 else 0.0
+
+    if defect_center is not None:
+        eigvals, eigvecs, labels, point_group = _symmetry_adapted_eigh(
+            structure, dyn, masses, defect_center, dR, dF, irreps, symprec
+        )
+        if frequency_range is not None:
+            keep = (eigvals > lower) & (eigvals <= upper)
+            eigvals, eigvecs, labels = eigvals[keep], eigvecs[:, keep], labels[keep]
+        meta.update(point_group=point_group, irreps=labels.tolist())
+    elif frequency_range is None:
+        eigvals, eigvecs = np.linalg.eigh(dyn)
+    else:
+        try:
+            import scipy.linalg
+        except ImportError:
+            eigvals, eigvecs = np.linalg.eigh(dyn)
+            keep = (eigvals > lower) & (eigvals <= upper)
+            eigvals, eigvecs = eigvals[keep], eigvecs[:, keep]
+        else:
+            eigvals, eigvecs = scipy.linalg.eigh(
+                dyn, subset_by_value=(lower, upper), driver="evr"
+            )
+
+    return eigen_to_phonon_data(eigvals, eigvecs, masses, meta=meta)
+
+
+# Blocks holding less than this fraction of |dR|² (or |dF|²) are skipped
+_BLOCK_WEIGHT_TOL = 1e-6
+
+
+def _symmetry_adapted_eigh(
+    structure, dyn, masses, defect_center, dR, dF, irreps, symprec
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, str]:
+    """Eigenpairs of the irrep blocks of *dyn* that are asked for or coupled."""
+    from defectpl.symmetry import defect_symmetry, symmetry_blocks
+
+    if isinstance(structure, (str, Path)):
+        from pymatgen.core import Structure
+
+        structure = Structure.from_file(str(structure))
+    sym = defect_symmetry(structure, defect_center, symprec=symprec)
+    blocks = symmetry_blocks(sym)
+    if irreps is not None:
+        known = {b.label for b in blocks}
+        unknown = set(irreps) - known
+        if unknown:
+            raise ValueError(
+                f"Irreps {sorted(unknown)} do not occur for point group "
+                f"{sym.point_group}; available: {sorted(known)}."
+            )
+        blocks = [b for b in blocks if b.label in set(irreps)]
+    elif dR is not None or dF is not None:
+        sqrt_m = np.sqrt(masses)[:, None]
+        coupling = (sqrt_m * dR if dR is not None else dF / sqrt_m).ravel()
+        total = float(coupling @ coupling)
+        blocks = [b for b in blocks if b.weight(coupling) > _BLOCK_WEIGHT_TOL * total]
+
+    eigvals, eigvecs, labels = [], [], []
+    for block in blocks:
+        # Partners give the same block; their mean symmetrises numerical noise
+        sub = sum(B.T @ (B.T @ dyn).T for B in block.bases) / len(block.bases)
+        w, Q = np.linalg.eigh(0.5 * (sub + sub.T))
+        for B in block.bases:
+            eigvals.append(w)
+            eigvecs.append(B @ Q)
+            labels += [block.label] * len(w)
+    eigvals = np.concatenate(eigvals) if eigvals else np.empty(0)
+    eigvecs = np.hstack(eigvecs) if eigvecs else np.empty((len(dyn), 0))
+    order = np.argsort(eigvals, kind="stable")
+    return eigvals[order], eigvecs[:, order], np.array(labels)[order], sym.point_group
+
+
+def _half_width(lattice: np.ndarray) -> float:
+    """Radius of the largest sphere inside the cell (half its smallest width)."""
+    volume = abs(np.linalg.det(lattice))
+    areas = [np.linalg.norm(np.cross(lattice[i - 2], lattice[i - 1])) for i in range(3)]
+    return 0.5 * volume / max(areas)
+
+
+def _wrap(frac: np.ndarray) -> np.ndarray:
+    """Fractional coordinates wrapped into [0, 1) (as cKDTree's boxsize needs)."""
+    frac = np.mod(frac, 1.0)
+    frac[frac >= 1.0] = 0.0
+    return frac
+
+
+@dataclass
+class EmbeddedSupercell:
+    """
+    Large defect supercell assembled by :func:`embed_force_constants`.
+
+    Attributes
+    ----------
+    structure : pymatgen Structure
+        The large supercell: bulk atoms followed by the atoms of the defect
+        region, which are taken from the defect supercell.
+    force_constants : scipy.sparse.csr_matrix
+        Force constants as a (3 natoms, 3 natoms) sparse matrix in eV/Å²,
+        with ``Φ[3i+a, 3j+b] = Φ_ij,ab``.
+    defect_indices : numpy.ndarray
+        Indices (in *structure*) of the atoms of the defect region.
+    cutoff : float
+        Pair cutoff used for the bulk force constants, Å.
+    """
+
+    structure: Any
+    force_constants: Any
+    defect_indices: np.ndarray
+    cutoff: float
+
+    @property
+    def masses(self) -> np.ndarray:
+        """Atomic masses in amu."""
+        return np.array([site.specie.atomic_mass for site in self.structure])
+
+    def dynamical_matrix(self):
+        """Sparse mass-weighted dynamical matrix (see :mod:`defectpl.lanczos`)."""
+        from defectpl.lanczos import sparse_dynamical_matrix
+
+        return sparse_dynamical_matrix(
+            self.structure, self.force_constants, enforce_asr=False
+        )
+
+
+def embed_force_constants(
+    bulk_structure: Any,
+    bulk_force_constants: Union[str, Path, np.ndarray],
+    defect_structure: Any,
+    defect_force_constants: Union[str, Path, np.ndarray],
+    scaling: Union[int, Sequence[int], np.ndarray],
+    defect_center: Sequence[float],
+    radius: Optional[float] = None,
+    cutoff: Optional[float] = None,
+) -> EmbeddedSupercell:
+    """
+    Force constants of a large defect supercell from a defect and a bulk calculation.
+
+    The embedding scheme of Alkauskas *et al.* (Razinkovas *et al.*,
+    *Phys. Rev. B* **104**, 045303, 2021): the large cell is the bulk
+    supercell repeated *scaling* times, with every atom within *radius* of
+    the defect replaced by the atoms of the defect supercell.  A pair of
+    atoms both inside that region takes its force-constant block from the
+    defect calculation; every other pair within *cutoff* takes the block of
+    the equivalent pair of the bulk supercell, and more distant pairs are
+    zero.  The on-site blocks are then set by the acoustic sum rule
+    ``Φ_ii = −Σ_{j≠i} Φ_ij``.
+
+    Neighbour pairs come from a KD-tree over the atoms and their periodic
+    images, bulk pairs are matched with a periodic KD-tree over the bulk
+    supercell, and blocks are gathered with index arrays, so a 10⁴-atom
+    matrix builds in seconds.
+
+    Parameters
+    ----------
+    bulk_structure, defect_structure : str, pathlib.Path or pymatgen Structure
+        Bulk and defect supercells of the phonon calculations; they must
+        share the same lattice.
+    bulk_force_constants, defect_force_constants : str, pathlib.Path or numpy.ndarray
+        Their full force constants (file or (N, N, 3, 3) array in eV/Å²).
+    scaling : int, sequence of 3 int or 3 x 3 int array
+        Repetitions of the bulk supercell making up the large cell.
+    defect_center : sequence of 3 float
+        Fractional coordinates of the defect in the defect supercell; the
+        defect sits at the same Cartesian position in the large cell.
+    radius : float, optional
+        Radius of the defect region, Å.  Must be below half the smallest
+        width of the defect supercell.  Default: a quarter of that width.
+    cutoff : float, optional
+        Bulk pair cutoff, Å.  At most half the smallest width of the bulk
+        supercell (the default), so that every pair has a unique image.
+
+    Returns
+    -------
+    EmbeddedSupercell
+        Structure, sparse force constants and defect-region indices; pass
+        ``result.force_constants`` to :func:`calculate_gamma_phonons` or
+        ``result.dynamical_matrix()`` to :mod:`defectpl.lanczos`.
+
+    Raises
+    ------
+    ValueError
+        If the lattices differ, *radius* or *cutoff* is too large, or the
+        force constants do not match their structures.
+    """
+    from pymatgen.core import Structure
+    from scipy.spatial import cKDTree
+    import scipy.sparse
+
+    structures = []
+    for struct in (bulk_structure, defect_structure):
+        if isinstance(struct, (str, Path)):
+            struct = Structure.from_file(str(struct))
+        structures.append(struct)
+    bulk_structure, defect_structure = structures
+    fc_bulk, fc_def = (
+        read_force_constants(fc) if isinstance(fc, (str, Path)) else np.asarray(fc)
+        for fc in (bulk_force_constants, defect_force_constants)
+    )
+    for name, struct, fc in (
+        ("bulk", bulk_structure, fc_bulk),
+        ("defect", defect_structure, fc_def),
+    ):
+        if fc.shape != (len(struct), len(struct), 3, 3):
+            raise ValueError(
+                f"{name} force constants of shape {fc.shape} do not match a "
+                f"structure of {len(struct)} atoms."
+            )
+
+    lat_b = np.asarray(bulk_structure.lattice.matrix)
+    if not np.allclose(lat_b, defect_structure.lattice.matrix, atol=1e-3):
+        raise ValueError("The bulk and defect supercells must share one lattice.")
+    scaling = np.asarray(scaling, dtype=int)
+    if scaling.ndim < 2:
+        scaling = np.diag(np.broadcast_to(scaling, 3))
+    lat_l = scaling @ lat_b
+
+    half_b = _half_width(lat_b)
+    if radius is None:
+        radius = 0.5 * half_b
+    elif radius >= half_b:
+        raise ValueError(
+            f"radius={radius} Å must be below half the defect-cell width ({half_b:.3f} Å)."
+        )
+    max_cutoff = min(half_b, _half_width(lat_l))
+    if cutoff is None:
+        cutoff = max_cutoff
+    elif cutoff > max_cutoff:
+        raise ValueError(
+            f"cutoff={cutoff} Å exceeds half the smallest cell width ({max_cutoff:.3f} Å)."
+        )
+
+    # Bulk atoms of the large cell: every bulk atom in every repetition
+    n = int(np.abs(scaling).sum())
+    grid = np.mgrid[-n : n + 1, -n : n + 1, -n : n + 1].reshape(3, -1).T
+    frac = grid @ np.linalg.inv(scaling)
+    lattice_points = grid[np.all((frac > -1e-8) & (frac < 1 - 1e-8), axis=1)]
+    frac_b = np.asarray(bulk_structure.frac_coords)
+    cart_bulk = (lattice_points[:, None, :] + frac_b[None]).reshape(-1, 3) @ lat_b
+    bulk_site = np.tile(np.arange(len(frac_b)), len(lattice_points))
+    species_bulk = np.tile(
+        np.array(bulk_structure.species, dtype=object), len(lattice_points)
+    )
+
+    # Swap the atoms around the defect for those of the defect supercell
+    center = np.asarray(defect_center, dtype=float) @ lat_b
+    inv_l = np.linalg.inv(lat_l)
+    d = (cart_bulk - center) @ inv_l
+    d = (d - np.rint(d)) @ lat_l
+    keep = np.linalg.norm(d, axis=1) > radius
+    d = np.asarray(defect_structure.frac_coords) - np.asarray(
+        defect_center, dtype=float
+    )
+    d = (d - np.rint(d)) @ lat_b
+    region = np.flatnonzero(np.linalg.norm(d, axis=1) <= radius)
+
+    cart = np.concatenate([cart_bulk[keep], center + d[region]])
+    species = list(species_bulk[keep]) + [defect_structure.species[k] for k in region]
+    natoms = len(cart)
+    defect_indices = np.arange(keep.sum(), natoms)
+    defect_site = np.full(natoms, -1)
+    defect_site[defect_indices] = region
+
+    # Bulk site of every atom: exact for bulk atoms, nearest for the region
+    site = np.empty(natoms, dtype=int)
+    site[: keep.sum()] = bulk_site[keep]
+    bulk_tree = cKDTree(_wrap(frac_b), boxsize=1.0)
+    inv_b = np.linalg.inv(lat_b)
+    site[defect_indices] = bulk_tree.query(_wrap(cart[defect_indices] @ inv_b))[1]
+
+    # All pairs within the cutoff: KD-tree over the 27 neighbouring images
+    shifts = (
+        np.array(
+            [[x, y, z] for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)]
+        )
+        @ lat_l
+    )
+    images = (cart[None, :, :] + shifts[:, None, :]).reshape(-1, 3)
+    pairs = cKDTree(cart).sparse_distance_matrix(
+        cKDTree(images), cutoff, output_type="ndarray"
+    )
+    i = pairs["i"].astype(int)
+    j = pairs["j"].astype(int) % natoms
+    vec = images[pairs["j"]] - cart[i]
+    offsite = i != j
+    i, j, vec = i[offsite], j[offsite], vec[offsite]
+
+    # Bulk blocks: the bulk pair (site_i, partner at site_i + r_ij)
+    partner_frac = (frac_b[site[i]] @ lat_b + vec) @ inv_b
+    jb = bulk_tree.query(_wrap(partner_frac))[1]
+    blocks = fc_bulk[site[i], jb]
+    # Defect blocks for pairs inside the region
+    both = (defect_site[i] >= 0) & (defect_site[j] >= 0)
+    blocks[both] = fc_def[defect_site[i[both]], defect_site[j[both]]]
+
+    onsite = np.zeros((natoms, 3, 3))
+    np.add.at(onsite, i, blocks)
+    i = np.concatenate([i, np.arange(natoms)])
+    j = np.concatenate([j, np.arange(natoms)])
+    blocks = np.concatenate([blocks, -onsite])
+
+    a, b = np.meshgrid(np.arange(3), np.arange(3), indexing="ij")
+    rows = (3 * i[:, None, None] + a).ravel()
+    cols = (3 * j[:, None, None] + b).ravel()
+    fc = scipy.sparse.coo_matrix(
+        (blocks.ravel(), (rows, cols)), shape=(3 * natoms, 3 * natoms)
+    ).tocsr()
+    structure = Structure(lat_l, species, cart, coords_are_cartesian=True)
+    return EmbeddedSupercell(
+        structure=structure,
+        force_constants=fc,
+        defect_indices=defect_indices,
+        cutoff=float(cutoff),
+    )
+
+
+class _BandYamlLayoutError(ValueError):
+    """The streaming band.yaml reader met a layout it does not handle."""
+
+
+# "[", "]" and "," of YAML flow sequences become separators for str.split()
+_FLOW_SEPARATORS = str.maketrans("[],", "   ")
+
+
+def _flow_floats(lines: List[str]) -> List[float]:
+    """Return the numbers on band.yaml lines (comments and list markers dropped)."""
+    text = "".join(line.split("#", 1)[0] for line in lines)
+    return [
+        float(tok) for tok in text.translate(_FLOW_SEPARATORS).split() if tok != "-"
+    ]
+
+
+def _key_value(line: str) -> Tuple[str, str]:
+    """Split ``"  key: value  # comment"`` into ``("key", "value")``."""
+    key, _, value = line.split("#", 1)[0].partition(":")
+    return key.strip().lstrip("- ").strip(), value.strip()
+
+
+def _read_band_yaml_stream(
+    band_yaml_path: Union[str, Path], q_idx: int = 0, allocate=np.empty
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Line-oriented band.yaml reader for the block layout written by phonopy.
+
+    Reads the file once, stops after the ``q_idx`` block, and writes the
+    frequencies and eigenvector real parts straight into preallocated
+    arrays; the eigenvector array is created by ``allocate(shape)``, which
+    may return a memory-mapped file.  Raises :class:`_BandYamlLayoutError` when the file does not
+    follow the expected layout, so the caller can fall back to a full YAML
+    load.
+    """
+    natom = None
+    masses: List[float] = []
+    frequencies = eigenvectors = None
+    section = None  # current top-level key
+    q_count = -1  # index of the q-point block being read
+    mode = -1
+    evec_lines: List[str] = []
+    in_evec = False
+
+    def _store_eigenvector():
+        if mode < 0 or not in_evec:
+            return
+        values = _flow_floats(evec_lines)
+        if len(values) != 6 * natom:
+            raise _BandYamlLayoutError(f"mode {mode + 1}: malformed eigenvector")
+        eigenvectors[mode] = np.reshape(values[0::2], (natom, 3))
+
+    with zopen(band_yaml_path) as f:
+        for line in f:
+            # Hot path: the natom * 3 component lines of every eigenvector
+            if in_evec and line.startswith("      "):
+                evec_lines.append(line)
+                continue
+            if line[0] == " " and q_count != q_idx and section == "phonon":
+                continue  # inside a q-point block that was not requested
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            if line[0] not in " -":  # top-level key
+                key, value = _key_value(line)
+                section = key
+                if key == "natom":
+                    natom = int(value)
+                continue
+
+            if section == "points":
+                key, value = _key_value(line)
+                if key == "mass":
+                    masses.append(float(value))
+                continue
+            if section != "phonon":
+                continue
+
+            if line.startswith("- "):  # new q-point
+                if q_count == q_idx:
+                    break
+                q_count += 1
+                if q_count == q_idx:
+                    if natom is None:
+                        raise _BandYamlLayoutError("'natom' precedes no phonon block")
+                    frequencies = np.empty(3 * natom)
+                    eigenvectors = allocate((3 * natom, natom, 3))
+                continue
+
+            indent = len(line) - len(line.lstrip(" "))
+            if indent == 2 and line.lstrip(" ").startswith("- "):  # new mode
+                _store_eigenvector()
+                mode += 1
+                in_evec, evec_lines = False, []
+                if mode >= 3 * natom:
+                    raise _BandYamlLayoutError("more than 3 * natom modes")
+                if ":" in line.split("#", 1)[0]:
+                    raise _BandYamlLayoutError("inline mode mapping")
+                continue
+            if mode < 0:
+                continue
+            if indent == 4 and not line.lstrip(" ").startswith("-"):
+                _store_eigenvector()
+                key, value = _key_value(line)
+                in_evec, evec_lines = key == "eigenvector", []
+                if key == "frequency":
+                    frequencies[mode] = float(value)
+                elif in_evec and value:
+                    raise _BandYamlLayoutError("inline eigenvector")
+                continue
+            if indent <= 2:  # q-point key after the band list
+                _store_eigenvector()
+                in_evec = False
+            elif in_evec:
+                evec_lines.append(line)
+        _store_eigenvector()
+
+    if q_count < 0:
+        raise _BandYamlLayoutError("no block-style 'phonon:' list found")
+    if frequencies is None:
+        raise IndexError(f"band.yaml has no q-point with index {q_idx}")
+    if mode + 1 != 3 * natom or len(masses) != natom:
+        raise _BandYamlLayoutError("mode or atom count does not match 'natom'")
+    return frequencies, eigenvectors, np.asarray(masses, dtype=float)
+
+
+def _read_band_yaml_full(
+    band_yaml_path: Union[str, Path], q_idx: int = 0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Load the whole band.yaml with PyYAML (libyaml's C loader when available)."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with zopen(band_yaml_path) as f:
+        band = yaml.load(f, Loader=loader)
+
+    n_atoms = band["natom"]
+    modes = band["phonon"][q_idx]["band"]
+    frequencies = np.array([mode["frequency"] for mode in modes], dtype=float)
+    eigenvectors = np.array(
+        [mode["eigenvector"] for mode in modes], dtype=complex
+    ).real[..., 0]
+    masses = np.asarray(
+        [band["points"][i]["mass"] for i in range(n_atoms)], dtype=float
+    )
+    return frequencies, np.array(eigenvectors, dtype=float), masses
+
+
+HDF5_SUFFIXES = (".hdf5", ".h5")
+# Cells of phonopy.yaml / phonopy_disp.yaml searched for masses, in order
+_PHONOPY_YAML_CELLS = ("supercell", "unit_cell", "primitive_cell")
+
+
+def _masses_from_phonopy_yaml(directory: Path, natoms: int) -> Optional[np.ndarray]:
+    """Masses of the first *natoms*-atom cell in a sibling phonopy.yaml."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    for name in ("phonopy.yaml", "phonopy_disp.yaml"):
+        path = directory / name
+        if not path.is_file():
+            continue
+        with open(path, "r") as f:
+            data = yaml.load(f, Loader=loader)
+        for cell in _PHONOPY_YAML_CELLS:
+            points = (data.get(cell) or {}).get("points", [])
+            if len(points) == natoms and all("mass" in p for p in points):
+                return np.array([p["mass"] for p in points], dtype=float)
+    return None
+
+
+def _read_real_hyperslab(dataset, start: Tuple[int, ...], shape: Tuple[int, ...]):
+    """
+    Read the block of *shape* trailing axes at leading index *start*.
+
+    For complex datasets (an HDF5 compound of real and imaginary members)
+    only the real member is transferred, so the imaginary half is never
+    read or allocated.
+    """
+    h5py = _require_h5py()
+    start = tuple(int(i) for i in start) + (0,) * len(shape)
+    count = (1,) * (dataset.ndim - len(shape)) + tuple(shape)
+    out = np.empty(count, dtype=np.float64)
+    file_type = dataset.id.get_type()
+    if file_type.get_class() != h5py.h5t.COMPOUND:
+        dataset.read_direct(out, tuple(slice(a, a + n) for a, n in zip(start, count)))
+        return out
+    mem_type = h5py.h5t.create(h5py.h5t.COMPOUND, 8)
+    mem_type.insert(file_type.get_member_name(0), 0, h5py.h5t.NATIVE_DOUBLE)
+    file_space = dataset.id.get_space()
+    file_space.select_hyperslab(start, count)
+    mem_space = h5py.h5s.create_simple(count)
+    dataset.id.read(mem_space, file_space, out, mtype=mem_type)
+    return out
+
+
+def read_band_hdf5(
+    path: Union[str, Path],
+    q_idx: int = 0,
+    masses: Optional[np.ndarray] = None,
+    structure: Union[str, Path, Any, None] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read one q-point of a phonopy ``band.hdf5``, ``mesh.hdf5`` or
+    ``qpoints.hdf5``.
+
+    Only the ``q_idx`` hyperslab of the ``frequency`` and ``eigenvector``
+    datasets is read, and of the complex eigenvectors only the real part,
+    straight into NumPy arrays (a 500-atom Γ point takes a few tens of
+    milliseconds).  q-points are counted over all path segments in the
+    order phonopy writes them.
+
+    Phonopy does not store masses in these files.  They are taken from
+    *masses*, else from the ``phonopy.yaml`` / ``phonopy_disp.yaml`` next
+    to *path* (the first cell with the right number of atoms), else from the
+    standard atomic masses of *structure*.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Phonopy HDF5 file.
+    q_idx : int, default 0
+        q-point to read (0 is Γ for a Γ-only or Γ-first calculation).
+    masses : numpy.ndarray, optional
+        Masses in amu.
+    structure : str, pathlib.Path or pymatgen Structure, optional
+        Structure whose atomic masses are used when there is no phonopy.yaml.
+
+    Returns
+    -------
+    frequencies : numpy.ndarray
+        Mode energies in eV (negative frequencies set to 0), shape (3N,).
+    eigenvectors : numpy.ndarray
+        Real eigenvectors, shape (3N, N, 3).
+    masses : numpy.ndarray
+        Masses in amu, shape (N,).
+
+    Raises
+    ------
+    ValueError
+        If the file lacks the phonopy datasets, *q_idx* is out of range, or
+        no masses can be found.
+    """
+    h5py = _require_h5py()
+    path = Path(path)
+    with h5py.File(path, "r") as f:
+        if "frequency" not in f or "eigenvector" not in f:
+            raise ValueError(
+                f"{path} has no 'frequency'/'eigenvector' datasets; write it with "
+                "phonopy's --hdf5 and --eigvecs options."
+            )
+        freq_ds, evec_ds = f["frequency"], f["eigenvector"]
+        q_shape = freq_ds.shape[:-1]
+        nbands = freq_ds.shape[-1]
+        nq = int(np.prod(q_shape))
+        if not 0 <= q_idx < nq:
+            raise ValueError(f"q_idx {q_idx} is out of range for {nq} q-points.")
+        q = np.unravel_index(q_idx, q_shape)
+        frequencies = _read_real_hyperslab(freq_ds, q, (nbands,)).reshape(nbands)
+        # Columns of phonopy's eigenvector matrix are the modes
+        vectors = _read_real_hyperslab(evec_ds, q, (nbands, nbands))
+        vectors = vectors.reshape(nbands, nbands)
+
+    natoms = nbands // 3
+    if masses is None:
+        masses = _masses_from_phonopy_yaml(path.parent, natoms)
+    if masses is None and structure is not None:
+        masses = structure_masses(structure)
+    if masses is None:
+        raise ValueError(
+            f"{path.name} stores no masses and no matching phonopy.yaml was "
+            "found next to it; pass masses= or structure=."
+        )
+    masses = np.asarray(masses, dtype=float)
+    if masses.shape != (natoms,):
+        raise ValueError(f"Expected {natoms} masses, got shape {masses.shape}.")
+
+    frequencies[frequencies < 0.0] = 0.0
+    frequencies *= THZ2EV
+    eigenvectors = np.ascontiguousarray(vectors.T).reshape(nbands, natoms, 3)
+    return frequencies, eigenvectors, masses
+
+
 def read_band_yaml(
     band_yaml_path: Union[str, Path],
     q_idx: int = 0,
+    use_cache: bool = True,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Parses a Phonopy band.yaml summary output file to extract Gamma-point
     phonon frequencies, displacement eigenvectors, and atomic masses.
 
+    The file is streamed line by line and only the ``q_idx`` block is
+    parsed, straight into preallocated arrays, so memory stays at the size
+    of the result even for supercells with hundreds of atoms.  Files that
+    do not follow phonopy's block layout are loaded with PyYAML instead
+    (libyaml's ``CSafeLoader`` when available); both routes give identical
+    arrays.
+
+    The result is kept in the on-disk cache of :mod:`defectpl.cache`, keyed
+    by the file content and *q_idx*, so reading the same file again only
+    costs a hash of the file and an ``np.load``.
+
     Parameters
     ----------
     band_yaml_path : str or pathlib.Path
         The filename tracking location of the processed Phonopy yaml payload.
     q_idx : int, default 0
         The absolute entry loop lookup selection index focusing on a specific q-point.
+    use_cache : bool, default True
+        Look the result up in (and add it to) the on-disk cache.  The cache
+        can also be switched off globally with ``DEFECTPL_CACHE=0``.
 
     Returns
     -------
@@ -256,35 +1155,89 @@ def read_band_yaml(
         Real displacement eigenvectors of shape (nmodes, natoms, 3).
     masses : numpy.ndarray
         Array containing mass metrics for each ion matching index layout configurations.
+
+    Notes
+    -----
+    Paths ending in ``.hdf5`` or ``.h5`` are read with :func:`read_band_hdf5`
+    (masses from the neighbouring ``phonopy.yaml``) and bypass the cache.
     """
-    with open(str(band_yaml_path), "r") as f:
-        band = yaml.safe_load(f)
+    if Path(band_yaml_path).suffix.lower() in HDF5_SUFFIXES:
+        return read_band_hdf5(band_yaml_path, q_idx)
+    if use_cache:
+        return cached_arrays(
+            band_yaml_path,
+            "band_yaml",
+            ("frequencies", "eigenvectors", "masses"),
+            lambda: read_band_yaml(band_yaml_path, q_idx, use_cache=False),
+            q_idx=q_idx,
+        )
 
-    n_atoms = band["natom"]
-    nmodes = len(band["phonon"][q_idx]["band"])
+    try:
+        gfrequencies, eigenvectors, masses = _read_band_yaml_stream(
+            band_yaml_path, q_idx
+        )
+    except _BandYamlLayoutError:
+        gfrequencies, eigenvectors, masses = _read_band_yaml_full(band_yaml_path, q_idx)
 
-    # 1. Parse frequencies and safely bound acoustic/imaginary noise to 0.0
-    gfrequencies = np.array(
-        [band["phonon"][q_idx]["band"][i]["frequency"] for i in range(nmodes)],
-        dtype=float,
-    )
+    # Safely bound acoustic/imaginary noise to 0.0 and convert THz -> eV
     gfrequencies[gfrequencies < 0.0] = 0.0
-    gfrequencies *= THZ2EV  # Convert THz -> eV
+    gfrequencies *= THZ2EV
 
-    # 2. Parse eigenvectors (shape from yaml is often (nmodes, natoms, 3, 2))
-    geigenvecs = np.array(
-        [band["phonon"][q_idx]["band"][i]["eigenvector"] for i in range(nmodes)],
-        dtype=complex,
-    )
-    # Strip complex phase: (nmodes, natoms, 3, 2) -> (nmodes, natoms, 3)
-    eigenvectors = np.array(geigenvecs[..., 0].real, dtype=float)
+    return gfrequencies, eigenvectors, masses
 
-    # 3. Gather masses
-    masses = np.asarray(
-        [band["points"][i]["mass"] for i in range(n_atoms)], dtype=float
-    )
 
-    return gfrequencies, eigenvectors, masses
+def band_yaml_to_npy(
+    band_yaml_path: Union[str, Path],
+    directory: Union[str, Path],
+    q_idx: int = 0,
+) -> PhononData:
+    """
+    Convert a band.yaml to the memory-mappable ``.npy`` layout of
+    :meth:`PhononData.save_npy <defectpl.core.structures.PhononData.save_npy>`.
+
+    The eigenvectors are streamed from the file straight into a
+    memory-mapped ``eigenvectors.npy``, so not even the conversion holds the
+    ``(3N, N, 3)`` tensor in memory.  Files that are not in phonopy's block
+    layout are loaded with PyYAML and then written out.
+
+    Parameters
+    ----------
+    band_yaml_path : str or pathlib.Path
+        Phonopy band.yaml to convert.
+    directory : str or pathlib.Path
+        Output directory (created if needed).
+    q_idx : int, default 0
+        Index of the q-point block to convert.
+
+    Returns
+    -------
+    PhononData
+        The converted data, reopened with the eigenvectors memory-mapped.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    evec_path = directory / NPY_FILES["eigenvectors"]
+
+    def _allocate(shape):
+        return np.lib.format.open_memmap(evec_path, mode="w+", dtype=float, shape=shape)
+
+    try:
+        frequencies, eigenvectors, masses = _read_band_yaml_stream(
+            band_yaml_path, q_idx, allocate=_allocate
+        )
+        eigenvectors.flush()
+        del eigenvectors
+    except _BandYamlLayoutError:
+        frequencies, eigenvectors, masses = _read_band_yaml_full(band_yaml_path, q_idx)
+        np.save(evec_path, eigenvectors)
+
+    frequencies[frequencies < 0.0] = 0.0
+    frequencies *= THZ2EV
+    np.save(directory / NPY_FILES["frequencies"], frequencies)
+    np.save(directory / NPY_FILES["masses"], masses)
+    meta = {"source_file": str(band_yaml_path), "q_idx": q_idx}
+    (directory / NPY_META).write_text(json.dumps(meta))
+    return PhononData.load_npy(directory)
 
 
 def extract_gamma_phonon_data(band_yaml_path: Union[str, Path]) -> GammaPhononData:
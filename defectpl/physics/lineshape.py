@@ -9,12 +9,14 @@ backward-compatibility (patches in tests still target ``defectpl.defectpl.*``).
 
 from defectpl.defectpl import (
     ConfigurationCoordinateDiagram,
+    LineshapeSweep,
     Photoluminescence,
     VibrationalSpectra1D,
 )
 
 __all__ = [
     "ConfigurationCoordinateDiagram",
+    "LineshapeSweep",
     "Photoluminescence",
     "VibrationalSpectra1D",
 ]
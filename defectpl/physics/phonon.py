@@ -8,18 +8,28 @@ under the new ``physics`` namespace.
 
 from defectpl.phonon import (
     GammaPhononData,
+    band_yaml_to_npy,
     calculate_gamma_phonon_to_band_yaml,
+    calculate_gamma_phonons,
     calculate_phonon_symmetries,
     create_force_constants_from_vasprun,
     extract_gamma_phonon_data,
+    gamma_dynamical_matrix,
+    read_band_hdf5,
     read_band_yaml,
+    read_force_constants,
 )
 
 __all__ = [
     "GammaPhononData",
+    "band_yaml_to_npy",
     "calculate_gamma_phonon_to_band_yaml",
+    "calculate_gamma_phonons",
     "calculate_phonon_symmetries",
     "create_force_constants_from_vasprun",
     "extract_gamma_phonon_data",
+    "gamma_dynamical_matrix",
+    "read_band_hdf5",
     "read_band_yaml",
+    "read_force_constants",
 ]
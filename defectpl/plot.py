@@ -14,7 +14,6 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from monty.serialization import loadfn
 
-
 # Load custom publication style with a robust procedural fallback layout
 style_file = Path(__file__).parent / "defectpl.mplstyle"
 if style_file.exists():
@@ -627,6 +626,7 @@ class Plotter:
         iylim: Optional[Tuple[float, float]] = None,
         fig_format: str = "pdf",
         figsize: Tuple[float, float] = (3.3, 2.5),
+        energies: Optional[np.ndarray] = None,
     ):
         """
         Line plot of the normalised PL intensity spectrum vs photon energy (eV).
@@ -646,10 +646,15 @@ class Plotter:
             ``(y_min, y_max)`` for the intensity axis.
         plot, out_dir, file_name, fig_format, figsize
             See :meth:`plot_penergy_vs_pmode`.
+        energies : numpy.ndarray, optional
+            Photon energy of each point of *I* in eV, e.g. the ``energies``
+            attribute of a windowed engine.  Default ``arange(len(I)) / resolution``.
         """
         fig, ax = plt.subplots(figsize=figsize)
 
-        x_energy_ev = np.arange(len(I)) / float(resolution)
+        x_energy_ev = (
+            np.arange(len(I)) / float(resolution) if energies is None else energies
+        )
         I_abs = np.abs(I)
         I_norm = I_abs / np.max(I_abs) if np.max(I_abs) > 0 else I_abs
 
@@ -757,6 +762,7 @@ class Plotter:
         iylim: Optional[Tuple[float, float]] = None,
         fig_format: str = "pdf",
         figsize: Tuple[float, float] = (3.3, 2.5),
+        energies: Optional[np.ndarray] = None,
     ):
         """
         Line plot of the normalised absorption spectrum vs photon energy (eV).
@@ -780,10 +786,17 @@ class Plotter:
             ``(y_min, y_max)`` for the intensity axis.
         plot, out_dir, file_name, fig_format, figsize
             See :meth:`plot_penergy_vs_pmode`.
+        energies : numpy.ndarray, optional
+            Photon energy of each point of *absorption* in eV.  Default
+            ``arange(len(absorption)) / resolution``.
         """
         fig, ax = plt.subplots(figsize=figsize)
 
-        x_energy_ev = np.arange(len(absorption)) / float(resolution)
+        x_energy_ev = (
+            np.arange(len(absorption)) / float(resolution)
+            if energies is None
+            else energies
+        )
         I_abs = np.abs(absorption)
         I_norm = I_abs / np.max(I_abs) if np.max(I_abs) > 0 else I_abs
 
@@ -810,6 +823,8 @@ class Plotter:
         file_name: str = "pl_absorption_vs_penergy",
         fig_format: str = "pdf",
         figsize: Tuple[float, float] = (3.3, 2.5),
+        energies: Optional[np.ndarray] = None,
+        abs_energies: Optional[np.ndarray] = None,
     ):
         """
         Overlay of normalised PL (solid) and absorption (dashed) spectra.
@@ -831,10 +846,19 @@ class Plotter:
             ``(x_min, x_max)`` for the photon energy axis in eV.
         plot, out_dir, file_name, fig_format, figsize
             See :meth:`plot_penergy_vs_pmode`.
+        energies, abs_energies : numpy.ndarray, optional
+            Photon energy axes of *intensity* and *absorption* in eV (they may
+            differ for windowed engines).  Default ``arange(n) / resolution``;
+            *abs_energies* defaults to *energies*.
         """
         fig, ax = plt.subplots(figsize=figsize)
 
-        x_ev = np.arange(len(intensity)) / float(resolution)
+        x_ev = (
+            np.arange(len(intensity)) / float(resolution)
+            if energies is None
+            else energies
+        )
+        x_abs = x_ev if abs_energies is None else abs_energies
 
         I_pl = np.abs(intensity)
         I_pl = I_pl / np.max(I_pl) if np.max(I_pl) > 0 else I_pl
@@ -844,7 +868,7 @@ class Plotter:
 
         colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
         ax.plot(x_ev, I_pl, color=colors[0], label="PL")
-        ax.plot(x_ev, I_abs, color=colors[1], linestyle="--", label="Absorption")
+        ax.plot(x_abs, I_abs, color=colors[1], linestyle="--", label="Absorption")
 
         ax.set_ylabel("Intensity (arb. u.)")
         ax.set_xlabel("Photon Energy (eV)")
@@ -886,7 +910,7 @@ def plot_interactive_intensity(filename: Union[str, Path]):
 
     I_abs = np.abs(pl.intensity)
     I_norm = I_abs / np.max(I_abs) if np.max(I_abs) > 0 else I_abs
-    x_energy = np.arange(len(I_norm)) / float(pl.resolution)
+    x_energy = pl.energies
 
     fig = go.Figure()
     fig.add_trace(
@@ -1032,8 +1056,7 @@ def comparepl(
                 f"File index {i} does not contain a valid Photoluminescence object."
             )
 
-        resolution = float(pl.resolution)
-        x_energy = np.arange(len(pl.intensity)) / resolution
+        x_energy = pl.energies
         I_abs = np.abs(pl.intensity)
         I_norm = I_abs / np.max(I_abs) if np.max(I_abs) > 0 else I_abs
 
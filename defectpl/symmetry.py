@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""
+Point-group symmetry of a defect supercell and symmetry-adapted phonon blocks.
+
+The Γ dynamical matrix of a defect supercell commutes with the operations of
+the defect's site-symmetry group, so in a symmetry-adapted basis it is block
+diagonal, one block per irreducible representation (irrep), and a ``d``
+dimensional irrep contributes ``d`` identical blocks.  A displacement or
+force pattern that shares the symmetry of the defect (every ``dR`` between
+two states of the same symmetry) only overlaps the totally symmetric block,
+so the modes with ``S_k > 0`` come from diagonalising that block alone.
+
+:func:`defect_symmetry` finds the operations (via spglib) that leave the
+defect centre fixed, and :func:`symmetry_blocks` decomposes the 3N
+displacement space into irreps orbit by orbit, without character tables, and
+labels them with Mulliken symbols derived from their characters.
+:func:`~defectpl.phonon.calculate_gamma_phonons` uses both when given a
+``defect_center``.
+
+Example
+-------
+>>> from defectpl.symmetry import defect_symmetry, symmetry_blocks
+>>> sym = defect_symmetry("POSCAR", defect_center=n_site)  # 215-atom NV⁻
+>>> sym.point_group
+'3m'
+>>> [(b.label, b.dimension, b.multiplicity) for b in symmetry_blocks(sym)]
+[('A1', 1, 125), ('A2', 1, 90), ('E', 2, 215)]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+
+_LETTERS = {1: "A", 2: "E", 3: "T", 4: "G", 5: "H"}
+# Relative eigenvalue gap below which a subspace counts as irreducible; well
+# above the noise of rotations from slightly distorted cells
+_SPLIT_TOL = 1e-4
+
+
+@dataclass
+class DefectSymmetry:
+    """
+    Site-symmetry operations of a defect in its supercell.
+
+    Operation ``g`` moves atom ``i`` to atom ``permutations[g, i]`` and
+    rotates its displacement by ``rotations[g]``.
+
+    Parameters
+    ----------
+    rotations : numpy.ndarray, shape (nops, 3, 3)
+        Cartesian rotation matrices.
+    permutations : numpy.ndarray, shape (nops, natoms)
+        Atom permutation of each operation.
+    point_group : str
+        Hermann–Mauguin symbol reported by spglib (e.g. ``"3m"``).
+    classes : list of numpy.ndarray
+        Operation indices of each conjugacy class; class 0 is the identity.
+    """
+
+    rotations: np.ndarray
+    permutations: np.ndarray
+    point_group: str
+    classes: List[np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.rotations)
+
+    @property
+    def natoms(self) -> int:
+        return self.permutations.shape[1]
+
+    def apply(self, g: int, vectors: np.ndarray) -> np.ndarray:
+        """Image of per-atom *vectors* (natoms, 3) under operation *g*."""
+        out = np.empty_like(vectors)
+        out[self.permutations[g]] = vectors @ self.rotations[g].T
+        return out
+
+    def symmetrize(self, vectors: np.ndarray) -> np.ndarray:
+        """Project per-atom *vectors* (natoms, 3) onto the totally symmetric part."""
+        return sum(self.apply(g, vectors) for g in range(len(self))) / len(self)
+
+
+@dataclass
+class IrrepBlock:
+    """
+    Symmetry-adapted basis of one irrep of a :class:`DefectSymmetry`.
+
+    Parameters
+    ----------
+    label : str
+        Mulliken symbol (``"A1"``, ``"E"``, ``"T2g"``, …).
+    dimension : int
+        Dimension of the (real) irrep.
+    multiplicity : int
+        Number of times it occurs in the 3N displacement space.
+    characters : numpy.ndarray, shape (nclasses,)
+        Character of each conjugacy class.
+    bases : list of scipy.sparse.csc_matrix
+        Orthonormal columns spanning the irrep, shape (3 natoms, multiplicity)
+        each; every column lives on one orbit of atoms.  For irreps that stay irreducible over the complex numbers
+        there is one matrix per partner function and all of them give the
+        same block of the dynamical matrix; otherwise (pairs of complex
+        conjugate irreps) there is a single matrix of ``dimension ×
+        multiplicity`` columns.
+    """
+
+    label: str
+    dimension: int
+    multiplicity: int
+    characters: np.ndarray
+    bases: List[np.ndarray]
+
+    @property
+    def size(self) -> int:
+        """Number of modes of this irrep (``dimension × multiplicity``)."""
+        return self.dimension * self.multiplicity
+
+    def weight(self, vector: np.ndarray) -> float:
+        """Squared norm of the projection of a flat 3N *vector* on this irrep."""
+        return float(sum(np.sum((B.T @ vector) ** 2) for B in self.bases))
+
+
+def defect_symmetry(
+    structure: Union[str, Path, Any],
+    defect_center: Sequence[float],
+    symprec: float = 0.01,
+) -> DefectSymmetry:
+    """
+    Operations of *structure* that map the defect centre onto itself.
+
+    Parameters
+    ----------
+    structure : str, pathlib.Path or pymatgen Structure
+        Defect supercell.
+    defect_center : sequence of 3 float
+        Fractional coordinates of the defect centre (an atom or a vacancy).
+    symprec : float, default 0.01
+        Distance tolerance in Å for spglib and for matching atoms.
+
+    Returns
+    -------
+    DefectSymmetry
+
+    Raises
+    ------
+    ValueError
+        If an operation does not map the atoms onto each other within
+        *symprec* (inconsistent tolerance).
+    """
+    import spglib
+    from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+    from scipy.spatial import cKDTree
+
+    if isinstance(structure, (str, Path)):
+        from pymatgen.core import Structure
+
+        structure = Structure.from_file(str(structure))
+    lattice = structure.lattice.matrix
+    frac = np.mod(structure.frac_coords, 1.0)
+    numbers = np.array([site.specie.Z for site in structure])
+    center = np.asarray(defect_center, dtype=float)
+    tree = cKDTree(frac, boxsize=1.0 + 1e-12)
+
+    def _cart_norm(d):
+        d = d - np.rint(d)
+        return np.linalg.norm(d @ lattice, axis=-1)
+
+    frac_rotations, rotations, permutations = [], [], []
+    ops = SpacegroupAnalyzer(structure, symprec=symprec).get_symmetry_operations()
+    for op in ops:
+        R, t = op.rotation_matrix, op.translation_vector
+        if _cart_norm(R @ center + t - center) > symprec:
+            continue
+        images = np.mod(frac @ R.T + t, 1.0) % 1.0
+        _, perm = tree.query(images)
+        if np.any(_cart_norm(images - frac[perm]) > symprec) or np.any(
+            numbers[perm] != numbers
+        ):
+            raise ValueError(
+                "A symmetry operation does not map the atoms onto each other "
+                f"within symprec={symprec} Å; adjust symprec."
+            )
+        frac_rotations.append(np.rint(R).astype(int))
+        # Nearest orthogonal matrix: slightly distorted cells give rotations
+        # that are orthogonal only to ~symprec
+        U, _, Vt = np.linalg.svd(lattice.T @ R @ np.linalg.inv(lattice.T))
+        rotations.append(U @ Vt)
+        permutations.append(perm)
+
+    rotations = np.array(rotations)
+    point_group = spglib.get_pointgroup(np.array(frac_rotations))[0].strip()
+    return DefectSymmetry(
+        rotations=rotations,
+        permutations=np.array(permutations),
+        point_group=point_group,
+        classes=_conjugacy_classes(rotations),
+    )
+
+
+def _conjugacy_classes(rotations: np.ndarray) -> List[np.ndarray]:
+    """Conjugacy classes of a group of rotation matrices (identity first)."""
+    n = len(rotations)
+    flat = rotations.reshape(n, 9)
+
+    def index(m):
+        return int(np.argmin(np.abs(flat - m.reshape(9)).sum(axis=1)))
+
+    assigned = np.full(n, -1)
+    identity = index(np.eye(3))
+    order = [identity] + [g for g in range(n) if g != identity]
+    classes = []
+    for h in order:
+        if assigned[h] >= 0:
+            continue
+        members = sorted({index(r @ rotations[h] @ r.T) for r in rotations})
+        assigned[members] = len(classes)
+        classes.append(np.array(members))
+    return classes
+
+
+def _orbits(permutations: np.ndarray) -> List[np.ndarray]:
+    """Atom orbits under the permutations."""
+    seen = np.zeros(permutations.shape[1], dtype=bool)
+    orbits = []
+    for i in range(permutations.shape[1]):
+        if not seen[i]:
+            orbit = np.unique(permutations[:, i])
+            seen[orbit] = True
+            orbits.append(orbit)
+    return orbits
+
+
+def _orbit_representation(sym: DefectSymmetry, orbit: np.ndarray) -> np.ndarray:
+    """Matrices (nops, 3s, 3s) of the displacement representation on an orbit."""
+    local = {atom: k for k, atom in enumerate(orbit)}
+    s = len(orbit)
+    gammas = np.zeros((len(sym), 3 * s, 3 * s))
+    for g in range(len(sym)):
+        for k, atom in enumerate(orbit):
+            j = local[sym.permutations[g, atom]]
+            gammas[g, 3 * j : 3 * j + 3, 3 * k : 3 * k + 3] = sym.rotations[g]
+    return gammas
+
+
+def _irreducible_subspaces(
+    gammas: np.ndarray, W: np.ndarray, rng: np.random.Generator
+) -> List[np.ndarray]:
+    """
+    Split the invariant subspace spanned by *W* into irreducible ones.
+
+    A random symmetric matrix averaged over the group commutes with the
+    representation; on an irreducible subspace it is a multiple of the
+    identity, otherwise its eigenspaces are smaller invariant subspaces.
+    """
+    rho = np.einsum("ai,gab,bj->gij", W, gammas, W)
+    X = rng.normal(size=(W.shape[1],) * 2)
+    H = np.einsum("gij,jk,glk->il", rho, X + X.T, rho)
+    w, V = np.linalg.eigh(0.5 * (H + H.T))
+    tol = _SPLIT_TOL * max(np.abs(w).max(), 1.0)
+    if w[-1] - w[0] <= tol:
+        return [W]
+    splits = np.flatnonzero(np.diff(w) > tol) + 1
+    out = []
+    for idx in np.split(np.arange(len(w)), splits):
+        out += _irreducible_subspaces(gammas, W @ V[:, idx], rng)
+    return out
+
+
+def symmetry_blocks(sym: DefectSymmetry, seed: int = 0) -> List[IrrepBlock]:
+    """
+    Decompose the 3N displacement space into symmetry-adapted irrep blocks.
+
+    The decomposition runs orbit by orbit (an orbit spans at most
+    ``3 × nops`` coordinates), so its cost is linear in the number of atoms.
+    For real irreps the copies are rotated onto common partner functions,
+    so each irrep needs only one ``multiplicity × multiplicity`` block of
+    the dynamical matrix.
+
+    Parameters
+    ----------
+    sym : DefectSymmetry
+        Operations from :func:`defect_symmetry`.
+    seed : int, default 0
+        Seed of the random matrices used to split subspaces.
+
+    Returns
+    -------
+    list of IrrepBlock
+        Ordered as the irreps are first met; totally symmetric first.
+    """
+    from scipy.sparse import csc_matrix
+
+    rng = np.random.default_rng(seed)
+    natoms, nops = sym.natoms, len(sym)
+    found: Dict[tuple, list] = {}
+    for orbit in _orbits(sym.permutations):
+        gammas = _orbit_representation(sym, orbit)
+        cols = (3 * orbit[:, None] + np.arange(3)).ravel()
+        for W in _irreducible_subspaces(gammas, np.eye(3 * len(orbit)), rng):
+            chi = np.einsum("ai,gab,bi->g", W, gammas, W)
+            key = tuple(np.round(chi, 3) + 0.0)
+            found.setdefault(key, []).append((cols, gammas, W))
+
+    e = sym.classes[0][0]  # identity: its character is the dimension
+    identity_key = tuple(np.ones(nops))
+    keys = sorted(found, key=lambda k: (k != identity_key, k[e]))
+    class_reps = np.array([c[0] for c in sym.classes])
+    blocks = []
+    for key in keys:
+        copies = found[key]
+        chi = np.array(key)
+        d = round(chi[e])
+        real_type = abs(np.dot(chi, chi) / nops - 1.0) < 1e-2
+        m = len(copies)
+        if real_type:
+            _, gammas0, W0 = copies[0]
+            rho0 = np.einsum("ai,gab,bj->gij", W0, gammas0, W0)
+            parts = [([], [], []) for _ in range(d)]
+            for j, (cols, gammas, W) in enumerate(copies):
+                rho = np.einsum("ai,gab,bj->gij", W, gammas, W)
+                A = rng.normal(size=(d, d))
+                T = np.einsum("gij,jk,glk->il", rho, A, rho0)
+                T /= np.sqrt(np.trace(T.T @ T) / d)
+                aligned = W @ T
+                for k in range(d):
+                    parts[k][0].append(cols)
+                    parts[k][1].append(np.full(len(cols), j))
+                    parts[k][2].append(aligned[:, k])
+            shape = (3 * natoms, m)
+        else:
+            parts = [([], [], [])]
+            for j, (cols, _, W) in enumerate(copies):
+                parts[0][0].append(np.repeat(cols, d))
+                parts[0][1].append(np.tile(np.arange(j * d, (j + 1) * d), len(cols)))
+                parts[0][2].append(W.ravel())
+            shape = (3 * natoms, d * m)
+        bases = [
+            csc_matrix(
+                (np.concatenate(v), (np.concatenate(r), np.concatenate(c))),
+                shape=shape,
+            )
+            for r, c, v in parts
+        ]
+        blocks.append(
+            IrrepBlock(
+                label="",
+                dimension=d,
+                multiplicity=m,
+                characters=chi[class_reps],
+                bases=bases,
+            )
+        )
+    _assign_labels(sym, blocks)
+    return blocks
+
+
+# ---------------------------------------------------------------------------
+# Mulliken labels
+# ---------------------------------------------------------------------------
+
+
+def _op_order(R: np.ndarray) -> int:
+    M = np.eye(3)
+    for n in range(1, 25):
+        M = M @ R
+        if np.allclose(M, np.eye(3), atol=1e-6):
+            return n
+    return 0
+
+
+def _axis(R: np.ndarray) -> np.ndarray:
+    """Unit axis of the proper part of *R* (normal of a mirror plane)."""
+    P = R * np.sign(np.linalg.det(R))
+    w, V = np.linalg.eig(P)
+    v = np.real(V[:, np.argmin(np.abs(w - 1.0))])
+    return v / np.linalg.norm(v)
+
+
+def _parallel(a: np.ndarray, b: np.ndarray) -> bool:
+    return abs(abs(np.dot(a, b)) - 1.0) < 1e-4
+
+
+def _assign_labels(sym: DefectSymmetry, blocks: List[IrrepBlock]) -> None:
+    """
+    Give each block a Mulliken symbol derived from its characters.
+
+    A/B (1D) follows the character of the principal rotation (S_2n when it
+    outranks the proper rotations, as in D2d), g/u the inversion, '/''
+    a horizontal mirror, and the numeric subscript the C2' axes or vertical
+    mirrors (for cubic groups the C2'/σd class); E irreps are numbered by
+    decreasing character of the principal rotation.  Conventions for the
+    numbered subscripts of some groups (e.g. B1/B2 in C2v) depend on the
+    choice of axes; the characters are kept on each block.
+    """
+    reps = [c[0] for c in sym.classes]
+    R = sym.rotations
+    det = np.array([np.linalg.det(R[g]) for g in reps])
+    order = np.array([_op_order(R[g]) for g in reps])
+    axes = [_axis(R[g]) for g in reps]
+    is_inv = np.array([np.allclose(R[g], -np.eye(3)) for g in reps])
+    is_mirror = (det < 0) & (order == 2) & ~is_inv
+
+    # Principal operation: the highest-order rotation with a unique axis;
+    # S_4n outranks the proper rotations (D2d, S4), proper ones win ties
+    proper = np.flatnonzero((det > 0) & (order > 1))
+    ranked = np.concatenate([proper, np.flatnonzero((det < 0) & (order % 4 == 0))])
+    principal = None
+    if ranked.size:
+        top = order[ranked].max()
+        cands = sorted((c for c in ranked if order[c] == top), key=lambda c: -det[c])
+        members = np.concatenate([sym.classes[c] for c in cands])
+        if all(_parallel(_axis(R[g]), axes[cands[0]]) for g in members):
+            principal = cands[0]
+    n_c3 = sum(len(sym.classes[c]) for c in proper if order[c] == 3)
+    cubic = principal is None and n_c3 >= 8
+
+    sigma_h = None
+    secondary = None
+    if principal is not None:
+        paxis = axes[principal]
+        for c in np.flatnonzero(is_mirror):
+            if _parallel(axes[c], paxis):
+                sigma_h = c
+        perp_c2 = [
+            c for c in proper if order[c] == 2 and abs(np.dot(axes[c], paxis)) < 1e-4
+        ]
+        sigma_v = [
+            c for c in np.flatnonzero(is_mirror) if abs(np.dot(axes[c], paxis)) < 1e-4
+        ]
+        secondary = (perp_c2 or sigma_v or [None])[0]
+    elif not proper.size and is_mirror.any():
+        sigma_h = int(np.flatnonzero(is_mirror)[0])  # Cs
+    elif cubic:
+        main_axes = [axes[c] for c in range(len(reps)) if order[c] == 4]
+        off = [
+            c
+            for c in range(len(reps))
+            if order[c] == 2
+            and not is_inv[c]
+            and not any(_parallel(axes[c], a) for a in main_axes)
+        ]
+        off_proper = [c for c in off if det[c] > 0]
+        if main_axes:
+            secondary = (off_proper or off or [None])[0]
+    inversion = np.flatnonzero(is_inv)
+    inversion = inversion[0] if inversion.size else None
+    # Groups with several C2 axes and nothing of higher order (D2, D2h)
+    c2_classes = [c for c in proper if order[c] == 2] if principal is None else []
+
+    for block in blocks:
+        chi = block.characters
+        d = block.dimension
+        letter = _LETTERS.get(d, f"Γ{d}")
+        sub = ""
+        if d == 1:
+            if principal is not None and chi[principal] < 0:
+                letter = "B"
+            if c2_classes and not cubic:
+                plus = [k for k, c in enumerate(c2_classes) if chi[c] > 0]
+                if len(plus) < len(c2_classes):
+                    letter = "B"
+                    sub = str(plus[0] + 1) if plus else ""
+            if secondary is not None and not (c2_classes and not cubic):
+                sub = "1" if chi[secondary] > 0 else "2"
+        elif d == 3 and secondary is not None:
+            sub = "2" if chi[secondary] > 0 else "1"
+        if inversion is not None:
+            sub += "g" if chi[inversion] > 0 else "u"
+        elif sigma_h is not None:
+            sub += "'" if chi[sigma_h] > 0 else "''"
+        block.label = letter + sub
+
+    # Number several E irreps with the same suffix by the principal character
+    groups: Dict[str, list] = {}
+    for block in blocks:
+        groups.setdefault(block.label, []).append(block)
+    for label, same in groups.items():
+        if len(same) < 2:
+            continue
+        if principal is not None and label.startswith("E"):
+            same = sorted(same, key=lambda b: -b.characters[principal])
+        for k, block in enumerate(same, start=1):
+            block.label = label[0] + str(k) + label[1:]
@@ -25,42 +25,6 @@ def clean_existing_output_directories(base_out_path: Path):
     base_out_path.mkdir(parents=True, exist_ok=True)
 
 
-def prepare_and_unzip_data(
-    source_gz_path: Path, base_out_path: Path, suffix: str = ""
-) -> Path:
-    """Creates a 'data' directory inside base_out_path, copies the source .gz file
-    into it, unzips it with an optional suffix to avoid naming conflicts,
-    and returns the Path to the unzipped file.
-    """
-    target_data_dir = base_out_path / "data"
-    target_data_dir.mkdir(parents=True, exist_ok=True)
-
-    # Clean the suffix of any slashes (e.g., 'dfpt/hse06' -> 'dfpt_hse06')
-    # to prevent unintended nested directory creation or FileNotFoundError
-    safe_suffix = suffix.replace("/", "_") if suffix else ""
-
-    copied_gz_name = (
-        f"{source_gz_path.stem}_{safe_suffix}.gz"
-        if safe_suffix
-        else source_gz_path.name
-    )
-    unzipped_name = (
-        f"{source_gz_path.stem}_{safe_suffix}" if safe_suffix else source_gz_path.stem
-    )
-
-    copied_gz_path = target_data_dir / copied_gz_name
-    unzipped_path = target_data_dir / unzipped_name
-
-    shutil.copy(source_gz_path, copied_gz_path)
-
-    with gzip.open(copied_gz_path, "rb") as f_in:
-        with open(unzipped_path, "wb") as f_out:
-            shutil.copyfileobj(f_in, f_out)
-
-    copied_gz_path.unlink()
-    return unzipped_path
-
-
 def execute_pipeline(
     pipeline_name: str,
     out_path: Path,
@@ -133,123 +97,81 @@ def run_pl_analysis(
     gamma: float = 2.0,
     fig_format: str = "svg",
 ):
-    """Orchestrates data unzipping and pipeline executions with configurable
-    internal system subdirectories. Handles automatic cleanup.
+    """Runs the PL pipelines straight from the gzip-compressed reference data;
+    defectpl decompresses the files while reading them.
     """
-    extracted_files = []
     system_base_path = data_path / system_dir
+    band_yaml_path = system_base_path / dfpt_dir / "band.yaml.gz"
+    outcar_gs_path = system_base_path / gs_dir / "OUTCAR.gz"
+    outcar_abs_path = system_base_path / abs_dir / "OUTCAR.gz"
+    outcar_ems_path = system_base_path / ems_dir / "OUTCAR.gz"
+    outcar_zpl_path = system_base_path / zpl_dir / "OUTCAR.gz"
+    contcar_gs_path = system_base_path / gs_dir / "CONTCAR.gz"
+    contcar_zpl_path = system_base_path / zpl_dir / "CONTCAR.gz"
 
-    try:
-        print(
-            f"\n========================================================================\n"
-            f"Preparing and extracting data files for system configuration: {system_dir}\n"
-            f"========================================================================"
-        )
-
-        # 1. Unzip the core files needed across all pipelines
-        band_yaml_path = prepare_and_unzip_data(
-            system_base_path / dfpt_dir / "band.yaml.gz",
-            out_path,
-            suffix=dfpt_dir,
-        )
-        extracted_files.append(band_yaml_path)
-
-        outcar_gs_path = prepare_and_unzip_data(
-            system_base_path / gs_dir / "OUTCAR.gz", out_path, suffix=gs_dir
-        )
-        extracted_files.append(outcar_gs_path)
-
-        outcar_abs_path = prepare_and_unzip_data(
-            system_base_path / abs_dir / "OUTCAR.gz", out_path, suffix=abs_dir
-        )
-        extracted_files.append(outcar_abs_path)
-
-        contcar_gs_path = prepare_and_unzip_data(
-            system_base_path / gs_dir / "CONTCAR.gz", out_path, suffix=gs_dir
-        )
-        extracted_files.append(contcar_gs_path)
-
-        contcar_zpl_path = prepare_and_unzip_data(
-            system_base_path / zpl_dir / "CONTCAR.gz", out_path, suffix=zpl_dir
-        )
-        extracted_files.append(contcar_zpl_path)
-
-        # 2. Extract specific OUTCAR files for the zpl_ems_force_mode pipeline
-        outcar_ems_path = prepare_and_unzip_data(
-            system_base_path / ems_dir / "OUTCAR.gz", out_path, suffix=ems_dir
-        )
-        extracted_files.append(outcar_ems_path)
-
-        outcar_zpl_path = prepare_and_unzip_data(
-            system_base_path / zpl_dir / "OUTCAR.gz", out_path, suffix=zpl_dir
-        )
-        extracted_files.append(outcar_zpl_path)
-
-        # Parse global configuration parameters
-        print("Parsing phonon configuration parameters...")
-        frequencies, eigenvectors, masses = read_band_yaml(band_yaml_path)
-
-        # ==========================================
-        # Pipeline 1: abs_gs_force_mode
-        # ==========================================
-        print(f"Extracting vertical force differences ({gs_dir} vs {abs_dir})....")
-        dF_abs_gs = prepare_dF_files(str(outcar_gs_path), str(outcar_abs_path))
-        execute_pipeline(
-            pipeline_name="abs_gs_force_mode",
-            out_path=out_path,
-            frequencies=frequencies,
-            eigenvectors=eigenvectors,
-            masses=masses,
-            dF=dF_abs_gs,
-            ezpl=ezpl,
-            gamma=gamma,
-            fig_format=fig_format,
-        )
-
-        # ==========================================
-        # Pipeline 2: gs_zpl_disp_mode
-        # ==========================================
-        print(f"Parsing atomic structural profiles ({gs_dir} vs {zpl_dir})...")
-        struct_gs = Structure.from_file(str(contcar_gs_path))
-        struct_zpl = Structure.from_file(str(contcar_zpl_path))
-        dR = calc_dR(struct_gs, struct_zpl)
+    print(
+        f"\n========================================================================\n"
+        f"Running PL pipelines for system configuration: {system_dir}\n"
+        f"========================================================================"
+    )
 
-        execute_pipeline(
-            pipeline_name="gs_zpl_disp_mode",
-            out_path=out_path,
-            frequencies=frequencies,
-            eigenvectors=eigenvectors,
-            masses=masses,
-            dR=dR,
-            ezpl=ezpl,
-            gamma=gamma,
-            fig_format=fig_format,
-        )
+    # Parse global configuration parameters
+    print("Parsing phonon configuration parameters...")
+    frequencies, eigenvectors, masses = read_band_yaml(band_yaml_path)
+
+    # ==========================================
+    # Pipeline 1: abs_gs_force_mode
+    # ==========================================
+    print(f"Extracting vertical force differences ({gs_dir} vs {abs_dir})....")
+    dF_abs_gs = prepare_dF_files(str(outcar_gs_path), str(outcar_abs_path))
+    execute_pipeline(
+        pipeline_name="abs_gs_force_mode",
+        out_path=out_path,
+        frequencies=frequencies,
+        eigenvectors=eigenvectors,
+        masses=masses,
+        dF=dF_abs_gs,
+        ezpl=ezpl,
+        gamma=gamma,
+        fig_format=fig_format,
+    )
 
-        # ==========================================
-        # Pipeline 3: zpl_ems_force_mode
-        # ==========================================
-        print(f"Extracting vertical force differences ({ems_dir} vs {zpl_dir})...")
-        dF_zpl_ems = prepare_dF_files(str(outcar_ems_path), str(outcar_zpl_path))
-        execute_pipeline(
-            pipeline_name="zpl_ems_force_mode",
-            out_path=out_path,
-            frequencies=frequencies,
-            eigenvectors=eigenvectors,
-            masses=masses,
-            dF=dF_zpl_ems,
-            ezpl=ezpl,
-            gamma=gamma,
-            fig_format=fig_format,
-        )
+    # ==========================================
+    # Pipeline 2: gs_zpl_disp_mode
+    # ==========================================
+    print(f"Parsing atomic structural profiles ({gs_dir} vs {zpl_dir})...")
+    struct_gs = Structure.from_file(str(contcar_gs_path))
+    struct_zpl = Structure.from_file(str(contcar_zpl_path))
+    dR = calc_dR(struct_gs, struct_zpl)
+
+    execute_pipeline(
+        pipeline_name="gs_zpl_disp_mode",
+        out_path=out_path,
+        frequencies=frequencies,
+        eigenvectors=eigenvectors,
+        masses=masses,
+        dR=dR,
+        ezpl=ezpl,
+        gamma=gamma,
+        fig_format=fig_format,
+    )
 
-    finally:
-        print("\n--- Initiating post-calculation cleanup ---")
-        for file_path in extracted_files:
-            if file_path.exists():
-                print(f"Removing temporary file: {file_path.name}")
-                file_path.unlink()
-        print("Cleanup completed successfully.")
+    # ==========================================
+    # Pipeline 3: zpl_ems_force_mode
+    # ==========================================
+    print(f"Extracting vertical force differences ({ems_dir} vs {zpl_dir})...")
+    dF_zpl_ems = prepare_dF_files(str(outcar_ems_path), str(outcar_zpl_path))
+    execute_pipeline(
+        pipeline_name="zpl_ems_force_mode",
+        out_path=out_path,
+        frequencies=frequencies,
+        eigenvectors=eigenvectors,
+        masses=masses,
+        dF=dF_zpl_ems,
+        ezpl=ezpl,
+        gamma=gamma,
+        fig_format=fig_format,
+    )
 
 
 # --- Execution Entry Point ---
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of OUTCAR position/force block parsing.
+
+Writes a synthetic OUTCAR (1000 atoms, 200 ionic steps by default) to a
+temporary directory and times the ``trajectory`` extractor of
+:func:`defectpl.io.vasp.scan_outcar`, which parses each
+``POSITION ... TOTAL-FORCE`` table as one block, against the same scan with
+the previous row-by-row ``float()`` parser.
+
+Usage::
+
+    python examples/benchmarks/outcar_parsing.py [--natoms 1000] [--nsteps 200]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from defectpl.io.vasp import (
+    OUTCAR_EXTRACTORS,
+    OutcarExtractor,
+    register_outcar_extractor,
+    scan_outcar,
+)
+
+SEPARATOR = " " + "-" * 83 + "\n"
+
+
+def write_outcar(path: Path, natoms: int, nsteps: int, seed: int = 0) -> Path:
+    """Write a minimal OUTCAR with *nsteps* relaxation steps of *natoms* atoms."""
+    rng = np.random.default_rng(seed)
+    a = 3.567 * np.cbrt(natoms / 8)
+    lattice = np.diag([a, a, a])
+    frac = rng.random((natoms, 3))
+    with open(path, "w") as f:
+        f.write(" POTCAR:   PAW_PBE C 08Apr2002\n")
+        f.write(f"   number of ions     NIONS = {natoms:6d}\n")
+        f.write(f"   ions per type = {natoms:14d}\n")
+        for _ in range(nsteps):
+            frac = (frac + rng.normal(scale=1e-3, size=frac.shape)) % 1.0
+            forces = rng.normal(scale=0.05, size=(natoms, 3))
+            f.write("\n VOLUME and BASIS-vectors are now :\n")
+            f.write(" " + "-" * 77 + "\n")
+            f.write("  energy-cutoff  :      520.00\n")
+            f.write(f"  volume of cell : {a**3:11.2f}\n")
+            f.write("      direct lattice vectors" + " " * 17)
+            f.write("reciprocal lattice vectors\n")
+            for row, rec in zip(lattice, np.linalg.inv(lattice).T):
+                f.write(" " + "".join(f"{x:13.9f}" for x in (*row, *rec)) + "\n")
+            f.write("\n POSITION" + " " * 39 + "TOTAL-FORCE (eV/Angst)\n")
+            f.write(SEPARATOR)
+            for r, F in zip(frac @ lattice, forces):
+                f.write(
+                    f"{r[0]:13.5f}{r[1]:13.5f}{r[2]:13.5f}   "
+                    f"{F[0]:14.6f}{F[1]:14.6f}{F[2]:14.6f}\n"
+                )
+            f.write(SEPARATOR)
+    return path
+
+
+class PerLineTrajectory(OutcarExtractor):
+    """Reference: the row-by-row ``float()`` parser used before block parsing."""
+
+    triggers = OUTCAR_EXTRACTORS["trajectory"].triggers
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.natoms = None
+        self.positions, self.forces = [], []
+
+    def feed(self, line, lines):
+        if "NIONS =" in line:
+            self.natoms = int(line.split("=")[-1])
+        elif "POSITION" in line:
+            next(lines)
+            coords = np.zeros((self.natoms, 3))
+            step_forces = np.zeros((self.natoms, 3))
+            for i in range(self.natoms):
+                data = next(lines).split()
+                coords[i] = [float(data[0]), float(data[1]), float(data[2])]
+                step_forces[i] = [float(data[3]), float(data[4]), float(data[5])]
+            self.positions.append(coords)
+            self.forces.append(step_forces)
+
+    def result(self, tail):
+        return {"positions": np.array(self.positions), "forces": np.array(self.forces)}
+
+
+def best_of(repeat, func, *args):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--natoms", type=int, default=1000)
+    parser.add_argument("--nsteps", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    register_outcar_extractor("trajectory_per_line")(PerLineTrajectory)
+    with tempfile.TemporaryDirectory() as tmp:
+        outcar = write_outcar(Path(tmp) / "OUTCAR", args.natoms, args.nsteps)
+        size = outcar.stat().st_size / 2**20
+        print(f"OUTCAR: {args.natoms} atoms x {args.nsteps} steps ({size:.1f} MiB)")
+
+        t_line, ref = best_of(args.repeat, scan_outcar, outcar, ["trajectory_per_line"])
+        t_block, new = best_of(args.repeat, scan_outcar, outcar, ["trajectory"])
+    ref, new = ref["trajectory_per_line"], new["trajectory"]
+    assert np.array_equal(ref["positions"], new["positions"])
+    assert np.array_equal(ref["forces"], new["forces"])
+
+    print(f"  per-line float() : {t_line:7.3f} s")
+    print(f"  block parsing    : {t_block:7.3f} s")
+    print(f"  speedup          : {t_line / t_block:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,19 @@ Pytest configuration: non-interactive matplotlib backend for CI.
 LaTeX fallback is handled in the source (plot.py and ks_analysis.py) by
 checking shutil.which("latex") after every style.use() call.  This fixture
 is a safety net that disables text.usetex before and after each test.
+
+The parsed-data cache (defectpl.cache) is pointed at a per-session temporary
+directory so that tests never read from or write to the user's cache.
 """
 
+import os
+import tempfile
+
 import matplotlib
 import pytest
 
 matplotlib.use("Agg")
+os.environ["DEFECTPL_CACHE_DIR"] = tempfile.mkdtemp(prefix="defectpl-cache-")
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the content-addressed phonon cache in cache.py.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from defectpl import cache
+from defectpl.cli import main
+from defectpl.constants import THZ2EV
+from defectpl.phonon import read_band_yaml
+
+BAND_YAML = (
+    "natom: 1\n"
+    "points:\n"
+    "- symbol: C\n"
+    "  mass: 12.011\n"
+    "phonon:\n"
+    "- q-position: [ 0.0, 0.0, 0.0 ]\n"
+    "  band:\n"
+    "  - # 1\n"
+    "    frequency: -0.01\n"
+    "    eigenvector:\n"
+    "    - [ [ 1.0, 0.0 ], [ 0.0, 0.0 ], [ 0.0, 0.0 ] ]\n"
+    "  - # 2\n"
+    "    frequency: 0.02\n"
+    "    eigenvector:\n"
+    "    - [ [ 0.0, 0.0 ], [ 1.0, 0.0 ], [ 0.0, 0.0 ] ]\n"
+    "  - # 3\n"
+    "    frequency: 0.03\n"
+    "    eigenvector:\n"
+    "    - [ [ 0.0, 0.0 ], [ 0.0, 0.0 ], [ 1.0, 0.0 ] ]\n"
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("DEFECTPL_CACHE_DIR", str(directory))
+    monkeypatch.delenv("DEFECTPL_CACHE", raising=False)
+    monkeypatch.delenv("DEFECTPL_CACHE_MAX_MB", raising=False)
+    return directory
+
+
+def test_read_band_yaml_is_served_from_cache(tmp_path, cache_dir, monkeypatch):
+    path = tmp_path / "band.yaml"
+    path.write_text(BAND_YAML)
+    first = read_band_yaml(path)
+    assert cache.cache_info()["entries"] == 1
+
+    # A copy under another name hits the same content-addressed entry
+    copy = tmp_path / "copy.yaml"
+    copy.write_text(BAND_YAML)
+    monkeypatch.setattr(
+        "defectpl.phonon._read_band_yaml_stream",
+        lambda *a: pytest.fail("cache miss"),
+    )
+    for got, ref in zip(read_band_yaml(copy), first):
+        assert got.dtype == ref.dtype and np.array_equal(got, ref)
+
+
+def test_changed_content_and_q_idx_get_new_entries(tmp_path, cache_dir):
+    path = tmp_path / "band.yaml"
+    path.write_text(BAND_YAML)
+    read_band_yaml(path)
+    path.write_text(BAND_YAML.replace("0.03", "0.04"))
+    freqs, _, _ = read_band_yaml(path)
+    assert freqs[2] == pytest.approx(0.04 * THZ2EV)
+    read_band_yaml(path, q_idx=0, use_cache=False)
+    assert cache.cache_info()["entries"] == 2
+
+
+def test_disabled_cache_writes_nothing(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setenv("DEFECTPL_CACHE", "0")
+    path = tmp_path / "band.yaml"
+    path.write_text(BAND_YAML)
+    read_band_yaml(path)
+    assert not cache_dir.exists()
+
+
+def test_lru_eviction_keeps_recent_entries(cache_dir):
+    data = np.zeros(1000)
+    for i, key in enumerate(("a", "b", "c")):
+        cache.store(key, x=data)
+        os.utime(cache_dir / f"{key}.npz", (i, i))
+    cache.load("a")  # most recently used now
+    assert cache.evict(max_bytes=2 * (data.nbytes + 1000)) == 1
+    assert cache.load("b") is None
+    assert cache.load("a") is not None and cache.load("c") is not None
+
+
+def test_cache_cli_info_and_clear(tmp_path, cache_dir):
+    path = tmp_path / "band.yaml"
+    path.write_text(BAND_YAML)
+    read_band_yaml(path)
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["cache", "info"])
+    assert result.exit_code == 0, result.output
+    assert "Entries   : 1" in result.output
+    assert str(cache_dir) in result.output
+
+    result = runner.invoke(main, ["cache", "clear"])
+    assert result.exit_code == 0, result.output
+    assert "Removed 1 cache entry" in result.output
+    assert cache.cache_info()["entries"] == 0
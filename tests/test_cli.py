@@ -175,6 +175,94 @@ def test_pl_force_mode_basic(cli_runner, mock_dependencies):
         )
 
 
+def test_pl_force_mode_auto_grid_and_energy_window(cli_runner, mock_dependencies):
+    """Verifies --auto_grid and --energy_window are forwarded to the engine."""
+    with cli_runner.isolated_filesystem():
+        Path("band.yaml").touch()
+        Path("OUTCAR_gs").touch()
+        Path("OUTCAR_es").touch()
+
+        result = cli_runner.invoke(
+            main,
+            [
+                "pl",
+                "force",
+                "--band_yaml",
+                "band.yaml",
+                "--outcar_gs",
+                "OUTCAR_gs",
+                "--outcar_es",
+                "OUTCAR_es",
+                "--auto_grid",
+                "--energy_window",
+                "0.5,2.5",
+            ],
+        )
+
+        assert result.exit_code == 0, f"Command failed with output: {result.output}"
+        kwargs = mock_dependencies["Photoluminescence"].call_args[1]
+        assert kwargs["auto_grid"] is True
+        assert kwargs["energy_window"] == (0.5, 2.5)
+
+
+def test_pl_force_mode_band_hdf5(cli_runner, mock_dependencies):
+    """Verifies --band_hdf5 replaces the band.yaml reader and excludes --band_yaml."""
+    with (
+        cli_runner.isolated_filesystem(),
+        patch("defectpl.phonon.read_band_hdf5") as mock_hdf5,
+    ):
+        mock_hdf5.return_value = (MagicMock(), MagicMock(), MagicMock())
+        for name in ("band.hdf5", "band.yaml", "OUTCAR_gs", "OUTCAR_es"):
+            Path(name).touch()
+        args = ["pl", "force", "--outcar_gs", "OUTCAR_gs", "--outcar_es", "OUTCAR_es"]
+
+        result = cli_runner.invoke(main, args + ["--band_hdf5", "band.hdf5"])
+
+        assert result.exit_code == 0, f"Command failed with output: {result.output}"
+        mock_hdf5.assert_called_once_with("band.hdf5", structure=None)
+        mock_dependencies["read_band_yaml"].assert_not_called()
+
+        both = cli_runner.invoke(
+            main, args + ["--band_hdf5", "band.hdf5", "--band_yaml", "band.yaml"]
+        )
+        assert both.exit_code != 0
+
+
+def test_global_fft_backend_option(cli_runner, mock_dependencies):
+    """Verifies --fft_backend/--fft_workers set the process-wide FFT backend."""
+    from defectpl.fft import get_fft_backend, set_fft_backend
+
+    with cli_runner.isolated_filesystem():
+        Path("band.yaml").touch()
+        Path("OUTCAR_gs").touch()
+        Path("OUTCAR_es").touch()
+
+        try:
+            result = cli_runner.invoke(
+                main,
+                [
+                    "--fft_backend",
+                    "scipy",
+                    "--fft_workers",
+                    "2",
+                    "pl",
+                    "force",
+                    "--band_yaml",
+                    "band.yaml",
+                    "--outcar_gs",
+                    "OUTCAR_gs",
+                    "--outcar_es",
+                    "OUTCAR_es",
+                ],
+            )
+            assert result.exit_code == 0, f"Command failed with output: {result.output}"
+            backend = get_fft_backend()
+            assert backend.name == "scipy"
+            assert backend.workers == 2
+        finally:
+            set_fft_backend("numpy")
+
+
 def test_standalone_plot_command(cli_runner, mock_dependencies):
     """Verifies the standalone plot command safely loads JSON records and delegates to the Plotter."""
     with cli_runner.isolated_filesystem():
@@ -238,3 +326,42 @@ def test_standalone_plot_type_filtering(cli_runner, mock_dependencies):
         # Intensity should be called, but Mode plots should be skipped completely
         plotter_instance.plot_intensity_vs_penergy.assert_called_once()
         plotter_instance.plot_penergy_vs_pmode.assert_not_called()
+
+
+def test_overlay_mirror_uses_pl_generating_function(cli_runner):
+    """Verifies overlay --mirror plots the fused PL/absorption pair without --abs."""
+    import numpy as np
+    from defectpl.defectpl import Photoabsorption, Photoluminescence
+
+    rng = np.random.default_rng(0)
+    pl = Photoluminescence(
+        frequencies=np.linspace(0.02, 0.08, 6),
+        eigenvectors=rng.normal(size=(6, 2, 3)),
+        masses=np.array([12.0, 14.0]),
+        dR=rng.normal(scale=0.02, size=(2, 3)),
+        EZPL=1.9,
+        resolution=200,
+        max_energy=3.0,
+    )
+    pl_inputs = ("frequencies", "eigenvectors", "masses", "dR", "EZPL", "resolution")
+    with (
+        cli_runner.isolated_filesystem(),
+        patch("monty.serialization.loadfn", return_value=pl),
+        patch("defectpl.plot.Plotter") as mock_plotter,
+    ):
+        Path("pl.json").touch()
+        result = cli_runner.invoke(main, ["overlay", "--pl", "pl.json", "--mirror"])
+
+        assert result.exit_code == 0, f"Command failed with output: {result.output}"
+        assert "Stokes shift" in result.output
+        kwargs = mock_plotter.return_value.plot_pl_absorption_vs_penergy.call_args[1]
+        ref = Photoabsorption(
+            **{k: getattr(pl, k) for k in pl_inputs}, max_energy=pl.max_energy
+        )
+        np.testing.assert_allclose(kwargs["absorption"], ref.absorption, atol=1e-9)
+
+        Path("abs.json").touch()
+        both = cli_runner.invoke(
+            main, ["overlay", "--pl", "pl.json", "--abs", "abs.json", "--mirror"]
+        )
+        assert both.exit_code != 0
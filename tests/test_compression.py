@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for transparent decompression in io/compression.py.
+"""
+
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from defectpl.io.compression import is_compressed, zopen
+
+TEXT = "".join(f"line {i:04d}\n" for i in range(2000))
+
+
+def _compress(path, data: bytes):
+    suffix = path.suffix
+    if suffix == ".gz":
+        data = gzip.compress(data)
+    elif suffix == ".bz2":
+        data = bz2.compress(data)
+    elif suffix == ".xz":
+        data = lzma.compress(data)
+    elif suffix == ".zst":
+        zstandard = pytest.importorskip("zstandard")
+        data = zstandard.ZstdCompressor().compress(data)
+    path.write_bytes(data)
+    return path
+
+
+def _tracking(opener, opened: list):
+    """Wrap *opener* so every file object it returns is recorded in *opened*."""
+
+    def wrapped(*args, **kwargs):
+        opened.append(opener(*args, **kwargs))
+        return opened[-1]
+
+    return wrapped
+
+
+@pytest.mark.parametrize("suffix", ["", ".gz", ".bz2", ".xz", ".zst"])
+def test_zopen_text_binary_and_seek(tmp_path, suffix):
+    path = _compress(tmp_path / f"OUTCAR{suffix}", TEXT.encode())
+    assert is_compressed(path) == bool(suffix)
+
+    with zopen(path) as f:
+        assert f.read() == TEXT
+    with zopen(path, "rb") as f:
+        assert f.readline() == b"line 0000\n"
+        f.seek(10 * 1500)
+        assert f.readline() == b"line 1500\n"
+        f.seek(10 * 3)  # backward seeks restart decompression
+        assert f.readline() == b"line 0003\n"
+        assert f.tell() == 40
+
+
+def test_zopen_is_read_only(tmp_path):
+    with pytest.raises(ValueError, match="only reads"):
+        zopen(tmp_path / "OUTCAR.gz", "w")
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".zst"])
+def test_zopen_closes_file_when_wrapper_fails(tmp_path, monkeypatch, suffix):
+    from defectpl.io import compression
+
+    path = _compress(tmp_path / f"OUTCAR{suffix}", TEXT.encode())
+    opened = []
+    if suffix == ".gz":
+        monkeypatch.setattr(gzip, "open", _tracking(gzip.open, opened))
+    else:
+        monkeypatch.setattr(compression, "open", _tracking(open, opened), raising=False)
+    with pytest.raises(LookupError):
+        zopen(path, encoding="no-such-codec")
+    assert len(opened) == 1 and opened[0].closed
+
+
+def test_zstd_close_releases_file_handle(tmp_path, monkeypatch):
+    from defectpl.io import compression
+
+    path = _compress(tmp_path / "OUTCAR.zst", TEXT.encode())
+    opened = []
+    monkeypatch.setattr(compression, "open", _tracking(open, opened), raising=False)
+    with zopen(path, "rb") as f:
+        f.seek(10 * 1500)
+        f.seek(0)  # backward seek reopens the file
+        assert f.readline() == b"line 0000\n"
+    assert len(opened) == 2
+    assert all(handle.closed for handle in opened)
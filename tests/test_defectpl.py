@@ -3,6 +3,7 @@
 Unit test suite for the Defect Optical Properties Engine (DefectPL) core module.
 """
 
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -12,10 +13,13 @@ from pymatgen.core import Structure, Lattice
 # Import target classes from the code module layout cleanly
 from defectpl.defectpl import (
     Photoabsorption,
+    PhotoluminescenceAbsorption,
     Photoluminescence,
     VibrationalSpectra1D,
     ConfigurationCoordinateDiagram,
 )
+from defectpl import utils
+from defectpl.utils import next_fast_len
 
 
 class TestPhotoluminescence(unittest.TestCase):
@@ -84,7 +88,7 @@ class TestPhotoluminescence(unittest.TestCase):
 
         active_dF = np.array([[0.5, 0.0, 0.0], [0.0, 0.5, 0.0]])
 
-        Photoluminescence(
+        pl = Photoluminescence(
             frequencies=self.frequencies,
             eigenvectors=self.eigenvectors,
             masses=self.masses,
@@ -93,6 +97,7 @@ class TestPhotoluminescence(unittest.TestCase):
             EZPL=self.EZPL,
             gamma=self.gamma,
         )
+        self.assertIs(pl.qks, mock_utils.calc_qks_force_vectorized.return_value)
         mock_utils.calc_qks_force_vectorized.assert_called_once()
 
     @patch("defectpl.defectpl.utils", autospec=True)
@@ -269,6 +274,406 @@ class TestPhotoabsorption(unittest.TestCase):
         mock_utils.calc_qks_vectorized.assert_called_once()
 
 
+def _toy_phonon_system(natoms=4, seed=0):
+    """Small but physical phonon set: orthonormal modes, positive frequencies."""
+    rng = np.random.default_rng(seed)
+    nmodes = 3 * natoms
+    q, _ = np.linalg.qr(rng.normal(size=(nmodes, nmodes)))
+    eigenvectors = q.T.reshape(nmodes, natoms, 3)
+    frequencies = np.linspace(0.01, 0.16, nmodes)
+    masses = np.full(natoms, 12.011)
+    dR = rng.normal(scale=0.05, size=(natoms, 3))
+    return frequencies, eigenvectors, masses, dR
+
+
+class _ToySystemTestCase(unittest.TestCase):
+    """
+    Engine inputs for :func:`_toy_phonon_system`.
+
+    ``self.kwargs`` holds the constructor arguments shared by the engine
+    tests; subclasses set ``natoms``, ``seed`` and ``engine_kwargs`` to
+    change only what differs.
+    """
+
+    natoms = 4
+    seed = 0
+    engine_kwargs: dict = {}
+
+    def setUp(self):
+        freqs, evecs, masses, dR = _toy_phonon_system(self.natoms, self.seed)
+        self.phonons = dict(frequencies=freqs, eigenvectors=evecs, masses=masses)
+        self.dR = dR
+        self.kwargs = {
+            **self.phonons,
+            "dR": dR,
+            "EZPL": 1.9,
+            "resolution": 200,
+            "max_energy": 3.0,
+            **self.engine_kwargs,
+        }
+
+
+class TestPhotoluminescenceSweep(_ToySystemTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pl = Photoluminescence(**self.kwargs)
+
+    def test_sweep_rows_match_individual_runs(self):
+        """Every row of the batched sweep equals a standalone engine run."""
+        res = self.pl.sweep(
+            EZPL=[1.8, 1.9], gamma=[1.0, 4.0], sigma=[6e-3, 9e-3], temperature=[0, 300]
+        )
+        self.assertEqual(len(res), 16)
+        self.assertEqual(res.intensity.shape, (16, len(self.pl.intensity)))
+        for i, params in enumerate(res.parameters):
+            ref = Photoluminescence(**{**self.kwargs, **params})
+            np.testing.assert_allclose(res.intensity[i], ref.intensity, atol=1e-10)
+            self.assertAlmostEqual(res.C_total[i], ref.C_total)
+
+    def test_sweep_defaults_reproduce_instance(self):
+        """A sweep with no arguments is a single row identical to the instance."""
+        res = self.pl.sweep()
+        self.assertEqual(len(res), 1)
+        np.testing.assert_allclose(res.intensity[0], self.pl.intensity, atol=1e-12)
+        np.testing.assert_allclose(
+            res.energies, np.arange(len(self.pl.intensity)) / self.pl.resolution
+        )
+
+    def test_temperature_series_matches_per_temperature_runs(self):
+        """The vectorized series reproduces one engine run per temperature."""
+        temps = np.array([0.0, 77.0, 300.0])
+        res = self.pl.temperature_series(temps)
+        self.assertEqual(res.intensity.shape, (3, len(self.pl.intensity)))
+        np.testing.assert_array_equal(res.temperature, temps)
+        for i, T in enumerate(temps):
+            ref = Photoluminescence(**{**self.kwargs, "temperature": T})
+            np.testing.assert_allclose(res.intensity[i], ref.intensity, atol=1e-10)
+            self.assertAlmostEqual(res.C_total[i], ref.C_total)
+
+
+class TestDirectTimeDomainMode(_ToySystemTestCase):
+    seed = 2
+    engine_kwargs = dict(temperature=300.0, sigma=(5e-3, 9e-3))
+
+    def test_direct_mode_matches_fft_mode(self):
+        """Closed-form S(t)/C(t,T) reproduce the grid + FFT lineshape."""
+        ref = Photoluminescence(**self.kwargs)
+        direct = Photoluminescence(**self.kwargs, st_method="direct")
+        self.assertTrue(np.all(np.isfinite(direct.intensity)))
+        self.assertFalse(direct.is_computed("S_omega"))
+        self.assertFalse(direct.is_computed("C_omega"))
+        # The lowest mode sits 2σ above ω = 0, where the grid route truncates
+        # its Gaussian tail; that edge effect bounds the agreement.
+        peak = np.abs(ref.intensity).max()
+        np.testing.assert_allclose(
+            direct.intensity, ref.intensity, rtol=0, atol=1e-3 * peak
+        )
+
+        absorption = Photoabsorption(**self.kwargs, st_method="direct")
+        abs_ref = Photoabsorption(**self.kwargs)
+        np.testing.assert_allclose(
+            absorption.absorption,
+            abs_ref.absorption,
+            rtol=0,
+            atol=1e-3 * np.abs(abs_ref.absorption).max(),
+        )
+
+    def test_direct_mode_round_trip_and_sweep(self):
+        pl = Photoluminescence(**self.kwargs, st_method="direct")
+        restored = Photoluminescence.from_dict(pl.as_dict())
+        self.assertEqual(restored.st_method, "direct")
+        np.testing.assert_allclose(restored.intensity, pl.intensity)
+        res = pl.sweep(gamma=[2.0, 4.0])
+        np.testing.assert_allclose(res.intensity[0], pl.intensity, atol=1e-10)
+
+    def test_weight_cutoff_skips_weakly_coupled_modes(self):
+        """Modes below the relative cutoff are dropped from S(t) and C(t, T)."""
+        full = Photoluminescence(**self.kwargs, st_method="direct")
+        Sks, nks = full.Sks, full.nks
+        cutoff = float(np.median(Sks / Sks.max()))
+        pl = Photoluminescence(**self.kwargs, st_method="direct", weight_cutoff=cutoff)
+        weak = Sks <= cutoff * Sks.max()
+        self.assertTrue(weak.any() and not weak.all())
+
+        args = (full.frequencies, np.where(weak, 0.0, Sks), pl.omega_range, pl.sigma)
+        np.testing.assert_allclose(pl.Sts, utils.calc_St_direct(*args), atol=1e-12)
+        thermal = nks * Sks
+        kept = np.where(thermal <= cutoff * thermal.max(), 0.0, thermal)
+        np.testing.assert_allclose(
+            pl.Cts,
+            np.real(utils.calc_St_direct(full.frequencies, kept, *args[2:])),
+            atol=1e-12,
+        )
+        self.assertFalse(np.allclose(pl.Sts, full.Sts))
+
+        pl.update(weight_cutoff=0.0)
+        self.assertFalse(pl.is_computed("Sts"))
+        np.testing.assert_allclose(pl.intensity, full.intensity)
+        restored = Photoluminescence.from_dict(
+            Photoluminescence(**self.kwargs, weight_cutoff=cutoff).as_dict()
+        )
+        self.assertEqual(restored.weight_cutoff, cutoff)
+
+    def test_invalid_st_method_raises(self):
+        with self.assertRaises(ValueError):
+            Photoluminescence(**self.kwargs, st_method="nufft")
+
+
+class TestLazyProperties(_ToySystemTestCase):
+    seed = 3
+    engine_kwargs = dict(temperature=100.0)
+
+    def test_properties_are_computed_on_access(self):
+        pl = Photoluminescence(**self.kwargs)
+        self.assertFalse(pl.is_computed("qks"))
+        self.assertGreater(pl.HR_factor, 0.0)
+        self.assertTrue(pl.is_computed("Sks"))
+        self.assertFalse(pl.is_computed("S_omega"))
+        self.assertFalse(pl.is_computed("intensity"))
+
+    def test_update_gamma_only_invalidates_generating_function(self):
+        pl = Photoluminescence(**self.kwargs)
+        self.assertEqual(pl.intensity.shape, pl.A_line.shape)
+        self.assertIs(pl.update(gamma=5.0), pl)
+        for name in ("qks", "Sks", "S_omega", "Sts", "nks", "Cts", "C_total"):
+            self.assertTrue(pl.is_computed(name), name)
+        for name in ("Gts", "A_line", "intensity"):
+            self.assertFalse(pl.is_computed(name), name)
+        ref = Photoluminescence(**{**self.kwargs, "gamma": 5.0})
+        np.testing.assert_allclose(pl.intensity, ref.intensity)
+
+    def test_update_temperature_only_invalidates_thermal_branch(self):
+        absorption = Photoabsorption(**self.kwargs)
+        self.assertTrue(np.all(np.isfinite(absorption.absorption)))
+        absorption.update(temperature=300.0)
+        for name in ("qks", "Sks", "HR_factor", "S_omega", "Sts"):
+            self.assertTrue(absorption.is_computed(name), name)
+        for name in ("nks", "C_omega", "Cts", "C_total", "Gts", "absorption"):
+            self.assertFalse(absorption.is_computed(name), name)
+        ref = Photoabsorption(**{**self.kwargs, "temperature": 300.0})
+        np.testing.assert_allclose(absorption.absorption, ref.absorption)
+
+    def test_update_rejects_unknown_inputs(self):
+        pl = Photoluminescence(**self.kwargs)
+        with self.assertRaises(TypeError):
+            pl.update(HR_factor=1.0)
+        with self.assertRaises(ValueError):
+            pl.update(dR=np.zeros_like(self.kwargs["dR"]))
+
+
+class TestGridAndEnergyWindow(_ToySystemTestCase):
+    seed = 4
+    engine_kwargs = dict(resolution=211)
+
+    def test_auto_grid_uses_fast_length_at_same_spacing(self):
+        pl = Photoluminescence(**self.kwargs, auto_grid=True)
+        npts = next_fast_len(int(3.0 * 211))
+        self.assertEqual(pl.omega_range[2], npts)
+        self.assertEqual(len(pl.intensity), npts)
+        self.assertAlmostEqual(pl.omega_range[1], npts / 211)
+        ref = Photoluminescence(**self.kwargs)
+        peak = np.argmax(np.abs(ref.intensity))
+        self.assertEqual(np.argmax(np.abs(pl.intensity)), peak)
+
+    def test_energy_window_slices_spectrum(self):
+        full = Photoluminescence(**self.kwargs)
+        window = (0.8, 2.2)
+        pl = Photoluminescence(**self.kwargs, energy_window=window)
+        self.assertGreaterEqual(pl.energies[0], window[0])
+        self.assertLessEqual(pl.energies[-1], window[1])
+        idx = np.rint(pl.energies * 211).astype(int)
+        np.testing.assert_allclose(pl.intensity, full.intensity[idx])
+        self.assertEqual(pl.energies.shape, pl.intensity.shape)
+
+        absorption = Photoabsorption(**self.kwargs, energy_window=window)
+        self.assertEqual(absorption.absorption.shape, absorption.energies.shape)
+        restored = Photoabsorption.from_dict(absorption.as_dict())
+        self.assertEqual(restored.energy_window, window)
+        np.testing.assert_allclose(restored.absorption, absorption.absorption)
+
+        res = pl.sweep(gamma=[2.0, 3.0])
+        np.testing.assert_allclose(res.energies, pl.energies)
+        np.testing.assert_allclose(res.intensity[0], pl.intensity, atol=1e-10)
+
+    def test_invalid_energy_window_raises(self):
+        with self.assertRaises(ValueError):
+            Photoluminescence(**self.kwargs, energy_window=(2.0, 1.0))
+
+
+class TestSinglePrecision(_ToySystemTestCase):
+    natoms = 8
+    seed = 5
+    engine_kwargs = dict(resolution=400, temperature=150.0)
+
+    @staticmethod
+    def _peak_and_fwhm(energies, intensity):
+        absolute = np.abs(intensity)
+        above = energies[absolute >= absolute.max() / 2]
+        return energies[np.argmax(absolute)], above[-1] - above[0]
+
+    def test_single_matches_double_within_documented_bound(self):
+        double = Photoluminescence(**self.kwargs)
+        single = Photoluminescence(**self.kwargs, precision="single")
+        self.assertEqual(single.eigenvectors.dtype, np.float32)
+        self.assertEqual(single.S_omega.dtype, np.float32)
+        self.assertEqual(single.Gts.dtype, np.complex64)
+        self.assertEqual(single.intensity.dtype, np.complex64)
+        self.assertEqual(single.Sks.dtype, np.float64)
+
+        self.assertAlmostEqual(single.HR_factor / double.HR_factor, 1.0, delta=1e-6)
+        peak_d, fwhm_d = self._peak_and_fwhm(double.energies, double.intensity)
+        peak_s, fwhm_s = self._peak_and_fwhm(single.energies, single.intensity)
+        self.assertEqual(peak_s, peak_d)
+        self.assertLessEqual(abs(fwhm_s - fwhm_d), 1.0 / 400)
+        I_d = np.abs(double.intensity)
+        np.testing.assert_allclose(
+            np.abs(single.intensity), I_d, rtol=0, atol=2e-5 * I_d.max()
+        )
+
+        absorption = Photoabsorption(
+            **self.kwargs, precision="single", st_method="direct"
+        )
+        abs_ref = Photoabsorption(**self.kwargs, st_method="direct")
+        self.assertEqual(absorption.absorption.dtype, np.complex64)
+        A_d = np.abs(abs_ref.absorption)
+        np.testing.assert_allclose(
+            np.abs(absorption.absorption), A_d, rtol=0, atol=2e-5 * A_d.max()
+        )
+
+    def test_precision_round_trip_and_update(self):
+        single = Photoluminescence(**self.kwargs, precision="single")
+        restored = Photoluminescence.from_dict(single.as_dict())
+        self.assertEqual(restored.precision, "single")
+        self.assertEqual(restored.eigenvectors.dtype, np.float32)
+        self.assertEqual(restored.intensity.dtype, np.complex64)
+        self.assertEqual(single.intensity.dtype, np.complex64)
+        single.update(precision="double")
+        self.assertFalse(single.is_computed("qks"))
+        self.assertEqual(single.intensity.dtype, np.complex128)
+        with self.assertRaises(ValueError):
+            Photoluminescence(**self.kwargs, precision="half")
+
+
+class TestPhotoluminescenceAbsorption(_ToySystemTestCase):
+    seed = 5
+    engine_kwargs = dict(temperature=50.0)
+
+    def test_matches_separate_engines(self):
+        both = PhotoluminescenceAbsorption(**self.kwargs)
+        pl = Photoluminescence(**self.kwargs)
+        absorption = Photoabsorption(**self.kwargs)
+        np.testing.assert_allclose(both.intensity, pl.intensity, atol=1e-12)
+        np.testing.assert_allclose(
+            both.absorption,
+            absorption.absorption,
+            atol=1e-12 * np.abs(absorption.absorption).max(),
+        )
+        self.assertTrue(both.is_computed("_spectra"))
+        self.assertGreater(both.stokes_shift, 0.0)
+        self.assertAlmostEqual(
+            both.stokes_shift, 2 * float(np.sum(pl.Sks * pl.frequencies))
+        )
+
+    def test_weak_coupling_stokes_shift_is_not_zero(self):
+        # HR ~ 0.25: the ZPL is the tallest peak, so the maxima coincide
+        pl = Photoluminescence(**self.kwargs)
+        dR = self.dR * np.sqrt(0.25 / pl.HR_factor)
+        both = PhotoluminescenceAbsorption(**{**self.kwargs, "dR": dR})
+        self.assertAlmostEqual(both.HR_factor, 0.25)
+        self.assertEqual(both.peak_shift, 0.0)
+        self.assertAlmostEqual(
+            both.stokes_shift, 2 * float(both.Sks @ both.frequencies)
+        )
+        self.assertGreater(both.stokes_shift, 0.0)
+
+    def test_from_photoluminescence_reuses_generating_function(self):
+        pl = Photoluminescence(**self.kwargs)
+        self.assertTrue(np.all(np.isfinite(pl.intensity)))
+        both = PhotoluminescenceAbsorption.from_photoluminescence(pl)
+        self.assertTrue(both.is_computed("Gts"))
+        self.assertFalse(both.is_computed("intensity"))
+        np.testing.assert_allclose(both.intensity, pl.intensity)
+        self.assertGreater(both.stokes_shift, 0.0)
+        self.assertTrue(np.isfinite(both.peak_shift))
+        both.update(gamma=5.0)
+        self.assertFalse(both.is_computed("peak_shift"))
+        self.assertTrue(both.is_computed("stokes_shift"))  # independent of gamma
+        self.assertTrue(pl.is_computed("intensity"))
+
+    def test_round_trip(self):
+        both = PhotoluminescenceAbsorption(**self.kwargs)
+        restored = PhotoluminescenceAbsorption.from_dict(both.as_dict())
+        self.assertIsInstance(restored, PhotoluminescenceAbsorption)
+        np.testing.assert_allclose(restored.absorption, both.absorption)
+
+
+class TestFromConfigurations(_ToySystemTestCase):
+    seed = 7
+    engine_kwargs = dict(temperature=100.0)
+
+    def setUp(self):
+        super().setUp()
+        self.dRs = np.stack([self.dR, 0.5 * self.dR, -self.dR])
+        self.common = {
+            k: self.kwargs[k] for k in ("resolution", "max_energy", "temperature")
+        }
+
+    def test_matches_individual_engines(self):
+        engines = Photoluminescence.from_configurations(
+            **self.phonons, EZPL=[1.8, 1.9, 2.0], dR=self.dRs, **self.common
+        )
+        self.assertEqual(len(engines), 3)
+        for ezpl, dR, pl in zip([1.8, 1.9, 2.0], self.dRs, engines):
+            ref = Photoluminescence(**self.phonons, EZPL=ezpl, dR=dR, **self.common)
+            np.testing.assert_allclose(pl.qks, ref.qks, rtol=1e-12)
+            np.testing.assert_allclose(pl.intensity, ref.intensity, atol=1e-10)
+        # Phonon-only properties are computed once and shared
+        self.assertIs(engines[2].iprs, engines[0].iprs)
+        self.assertIs(engines[2].eigenvectors, engines[0].eigenvectors)
+
+    def test_force_stack_and_update(self):
+        dFs = 3.0 * self.dRs
+        engines = Photoabsorption.from_configurations(
+            **self.phonons, EZPL=1.9, dF=dFs, **self.common
+        )
+        ref = Photoabsorption(**self.phonons, EZPL=1.9, dF=dFs[1], **self.common)
+        np.testing.assert_allclose(engines[1].qks, ref.qks, rtol=1e-12)
+        engines[1].update(dF=dFs[0])
+        np.testing.assert_allclose(engines[1].qks, engines[0].qks, rtol=1e-12)
+
+    def test_memory_mapped_eigenvectors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/eigenvectors.npy"
+            np.save(path, self.phonons["eigenvectors"])
+            mapped = np.load(path, mmap_mode="r")
+            pl = Photoluminescence(
+                **dict(self.phonons, eigenvectors=mapped),
+                EZPL=1.9,
+                dR=self.dRs[0],
+                **self.common,
+            )
+            ref = Photoluminescence(
+                **self.phonons, EZPL=1.9, dR=self.dRs[0], **self.common
+            )
+            self.assertIs(pl.eigenvectors, mapped)
+            np.testing.assert_allclose(pl.qks, ref.qks, rtol=1e-12)
+            np.testing.assert_allclose(pl.iprs, ref.iprs, rtol=1e-12)
+            np.testing.assert_allclose(pl.intensity, ref.intensity, atol=1e-10)
+            del pl, mapped
+
+    def test_invalid_stacks_raise(self):
+        with self.assertRaises(ValueError):
+            Photoluminescence.from_configurations(**self.phonons, EZPL=1.9)
+        with self.assertRaises(ValueError):
+            Photoluminescence.from_configurations(
+                **self.phonons, EZPL=1.9, dR=self.dRs[0]
+            )
+        with self.assertRaises(ValueError):
+            Photoluminescence.from_configurations(
+                **self.phonons, EZPL=[1.8, 1.9], dR=self.dRs
+            )
+
+
 class TestVibrationalSpectra1D(unittest.TestCase):
     def setUp(self):
         """Initialize configurations for 1D Harmonic Oscillator limits."""
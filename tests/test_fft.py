@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the pluggable FFT backends in fft.py.
+"""
+
+import importlib.util
+
+import numpy as np
+import pytest
+
+from defectpl.defectpl import Photoluminescence
+from defectpl.fft import (
+    fft_backend,
+    get_fft_backend,
+    set_fft_backend,
+)
+from defectpl.utils import calc_Spectrum_Intensity, calc_St
+
+
+@pytest.fixture(autouse=True)
+def restore_default_backend():
+    yield
+    set_fft_backend("numpy")
+
+
+def _available_backends():
+    names = ["numpy", "scipy"]
+    if importlib.util.find_spec("pyfftw") is not None:
+        names.append("pyfftw")
+    return names
+
+
+@pytest.mark.parametrize("name", _available_backends())
+def test_backends_match_numpy(name):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(3, 250)) + 1j * rng.normal(size=(3, 250))
+    backend = get_fft_backend(name, workers=2)
+    np.testing.assert_allclose(backend.fft(x), np.fft.fft(x, axis=-1), atol=1e-10)
+    np.testing.assert_allclose(backend.ifft(x), np.fft.ifft(x, axis=-1), atol=1e-12)
+    # A second call reuses any cached plan and must not alias the first result
+    first = backend.fft(x)
+    backend.fft(2 * x)
+    np.testing.assert_allclose(first, np.fft.fft(x, axis=-1), atol=1e-10)
+
+
+def test_backends_preserve_single_precision():
+    x = np.ones(64, dtype=np.float32)
+    assert get_fft_backend("scipy").ifft(x).dtype == np.complex64
+
+
+def test_utils_use_global_and_explicit_backend():
+    S = np.exp(-(((np.arange(400) - 40) / 5.0) ** 2))
+    ref = calc_St(S)
+    with fft_backend("scipy", workers=2) as active:
+        assert active.name == "scipy"
+        assert get_fft_backend().name == "scipy"
+        np.testing.assert_allclose(calc_St(S), ref, atol=1e-12)
+    assert get_fft_backend().name == "numpy"
+
+    A_ref, _ = calc_Spectrum_Intensity(ref, 1.0, 100.0)
+    A, _ = calc_Spectrum_Intensity(ref, 1.0, 100.0, backend="scipy")
+    np.testing.assert_allclose(A, A_ref, atol=1e-9)
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        set_fft_backend("mkl")
+    with pytest.raises(ValueError):
+        get_fft_backend("mkl")
+
+
+def test_engine_fft_backend_matches_default():
+    rng = np.random.default_rng(5)
+    q, _ = np.linalg.qr(rng.normal(size=(24, 24)))
+    kwargs = dict(
+        frequencies=np.linspace(0.01, 0.16, 24),
+        eigenvectors=q.T.reshape(24, 8, 3),
+        masses=np.full(8, 12.011),
+        dR=rng.normal(scale=0.05, size=(8, 3)),
+        EZPL=1.9,
+        resolution=400,
+        max_energy=3.0,
+        temperature=150.0,
+    )
+    ref = Photoluminescence(**kwargs)
+    pl = Photoluminescence(**kwargs, fft_backend="scipy", fft_workers=2)
+    assert pl._fft.name == "scipy"
+    np.testing.assert_allclose(pl.intensity, ref.intensity, atol=1e-10)
+    res = pl.sweep(gamma=[2.0, 4.0])
+    np.testing.assert_allclose(res.intensity[0], ref.intensity, atol=1e-10)
+    assert "fft_backend" not in pl.as_dict()
+    with pytest.raises(ValueError):
+        Photoluminescence(**kwargs, fft_backend="mkl")
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the isotope-substitution sweep in isotopes.py.
+"""
+
+import numpy as np
+import pytest
+from pymatgen.core import Lattice, Structure
+
+from defectpl.defectpl import Photoluminescence
+from defectpl.isotopes import isotope_masses, isotope_sweep
+from defectpl.phonon import calculate_gamma_phonons
+
+
+def _spring_crystal(n=3, a=2.5):
+    """Simple-cubic C/N supercell with central nearest/2nd-neighbour springs."""
+    grid = np.array([[x, y, z] for x in range(n) for y in range(n) for z in range(n)])
+    species = ["N"] + ["C"] * (n**3 - 1)
+    structure = Structure(Lattice.cubic(n * a), species, grid / n)
+    d = structure.frac_coords[None, :, :] - structure.frac_coords[:, None, :]
+    d = (d - np.rint(d)) @ structure.lattice.matrix
+    r = np.linalg.norm(d, axis=2)
+    k = np.where(r < 1.1 * a, 4.0, np.where(r < 1.1 * np.sqrt(2) * a, 0.5, 0.0))
+    np.fill_diagonal(k, 0.0)
+    r[r == 0.0] = 1.0
+    fc = -k[..., None, None] * d[..., :, None] * d[..., None, :]
+    fc /= r[..., None, None] ** 2
+    idx = np.arange(len(structure))
+    fc[idx, idx] = -fc.sum(axis=1)
+    return structure, fc
+
+
+def _displacements(natoms, seed=0):
+    dR = np.random.default_rng(seed).normal(scale=0.02, size=(natoms, 3))
+    return dR - dR.mean(axis=0)
+
+
+ENGINE = dict(resolution=200, max_energy=3.0, sigma=6e-3, gamma=0.01)
+
+
+def test_isotope_masses_elements_sites_and_errors():
+    structure, _ = _spring_crystal()
+    base = isotope_masses(structure, {})
+    assert base[0] == pytest.approx(14.007, abs=1e-3)
+
+    m = isotope_masses(structure, {"C": 13, 0: 15.5})
+    assert m[0] == 15.5
+    assert np.allclose(m[1:], 13.003354838)
+
+    # numpy integer site keys also override element entries
+    m = isotope_masses(structure, {np.int64(1): 12.5, "C": 13})
+    assert m[1] == 12.5 and m[2] == pytest.approx(13.003354838)
+
+    m = isotope_masses(structure, {0: 14})
+    assert m[0] == pytest.approx(14.003074, abs=1e-6)
+    assert np.array_equal(m[1:], base[1:])
+
+    with pytest.raises(ValueError, match="no O"):
+        isotope_masses(structure, {"O": 18})
+    with pytest.raises(ValueError, match="out of range"):
+        isotope_masses(structure, {len(structure): 13})
+    with pytest.raises(ValueError, match="Unknown isotope"):
+        isotope_masses(structure, {"C": 99})
+
+
+def test_isotope_sweep_matches_single_calculation(tmp_path):
+    structure, fc = _spring_crystal()
+    dR = _displacements(len(structure))
+    res = isotope_sweep(
+        structure, fc, [{}, {"C": 13}], EZPL=1.5, dR=dR, workers=2, **ENGINE
+    )
+    assert len(res) == 2
+    assert res.labels == ["base", "C13"]
+
+    phonons = calculate_gamma_phonons(structure, fc)
+    pl = Photoluminescence(
+        frequencies=phonons.frequencies,
+        eigenvectors=phonons.eigenvectors,
+        masses=phonons.masses,
+        EZPL=1.5,
+        dR=dR,
+        **ENGINE,
+    )
+    assert np.allclose(res.frequencies[0], pl.frequencies)
+    assert res.HR_factor[0] == pytest.approx(pl.HR_factor)
+    assert np.allclose(res.energies, pl.energies)
+    assert np.allclose(res.intensity[0], pl.intensity)
+
+    # Heavier carbon softens every optical mode
+    assert np.all(res.frequencies[1][3:] < res.frequencies[0][3:])
+
+
+def test_isotope_sweep_warm_start_matches_full_diagonalisation(monkeypatch):
+    from defectpl import isotopes
+
+    # Random springs lift the cubic degeneracies, as in a real defect cell
+    structure, fc = _spring_crystal(n=4)
+    natoms = len(structure)
+    jitter = np.random.default_rng(0).uniform(0.7, 1.3, size=(natoms, natoms))
+    fc = fc * (0.5 * (jitter + jitter.T))[..., None, None]
+    idx = np.arange(natoms)
+    fc[idx, idx] = 0.0
+    fc[idx, idx] = -fc.sum(axis=1)
+
+    solved = []
+    warm_start_eigh = isotopes._warm_start_eigh
+    monkeypatch.setattr(
+        isotopes,
+        "_warm_start_eigh",
+        lambda *args: solved.append(warm_start_eigh(*args)) or solved[-1],
+    )
+    dR = _displacements(natoms, seed=1)
+    variants = [{0: 15}, {5: 13}, isotope_masses(structure, {"N": 15, 3: 13})]
+    exact = isotope_sweep(structure, fc, variants, EZPL=1.5, dR=dR, **ENGINE)
+    warm = isotope_sweep(
+        structure, fc, variants, EZPL=1.5, dR=dR, warm_start=True, **ENGINE
+    )
+    assert len(solved) == 3 and all(eigh is not None for eigh in solved)
+    assert warm.labels[2] == "masses"
+    # Acoustic modes are ~0 and square roots amplify their tiny eigenvalue error
+    assert np.allclose(warm.frequencies[:, 3:], exact.frequencies[:, 3:], atol=1e-4)
+    assert np.allclose(warm.HR_factor, exact.HR_factor, rtol=1e-3)
+
+
+def test_isotope_sweep_validation():
+    structure, fc = _spring_crystal()
+    with pytest.raises(ValueError, match="at least one"):
+        isotope_sweep(structure, fc, [], EZPL=1.5, dR=np.zeros((27, 3)))
+    with pytest.raises(ValueError, match="does not match"):
+        isotope_sweep(structure, fc, [np.ones(5)], EZPL=1.5, dR=np.zeros((27, 3)))
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the diagonalization-free S(ω) in lanczos.py.
+"""
+
+import numpy as np
+import pytest
+from pymatgen.core import Lattice, Structure
+
+from defectpl.lanczos import (
+    calc_S_omega_lanczos,
+    lanczos_modes,
+    sparse_dynamical_matrix,
+)
+from defectpl.phonon import calculate_gamma_phonons, gamma_dynamical_matrix
+from defectpl.utils import (
+    calc_qks_force_vectorized,
+    calc_qks_vectorized,
+    calc_S_omega,
+    calc_Sks,
+)
+
+
+def _spring_crystal(n=3, k_nn=4.0, k_2nd=0.5):
+    """Simple-cubic n x n x n supercell with central nearest/2nd-neighbour springs."""
+    a = 2.5
+    grid = np.array([[x, y, z] for x in range(n) for y in range(n) for z in range(n)])
+    structure = Structure(Lattice.cubic(n * a), ["C", "N", "O"] * (n**3 // 3), grid / n)
+    natoms = len(structure)
+    fc = np.zeros((natoms, natoms, 3, 3))
+    for i in range(natoms):
+        for j in range(natoms):
+            if i == j:
+                continue
+            d = structure.frac_coords[j] - structure.frac_coords[i]
+            d = (d - np.rint(d)) @ structure.lattice.matrix
+            r = np.linalg.norm(d)
+            k = k_nn if r < 1.1 * a else (k_2nd if r < 1.1 * np.sqrt(2) * a else 0.0)
+            fc[i, j] -= k * np.outer(d, d) / r**2
+    for i in range(natoms):
+        fc[i, i] = -fc[i].sum(axis=0)
+    return structure, fc
+
+
+def test_sparse_dynamical_matrix_matches_dense_and_cutoff_keeps_asr(tmp_path):
+    structure, fc = _spring_crystal()
+    masses = np.array([site.specie.atomic_mass for site in structure])
+    dense = gamma_dynamical_matrix(fc, masses)
+    np.testing.assert_allclose(
+        sparse_dynamical_matrix(structure, fc).toarray(), dense, atol=1e-12
+    )
+
+    # Nearest neighbours only: fewer entries, translations still zero modes
+    cut = sparse_dynamical_matrix(structure, fc, cutoff=3.0)
+    assert cut.nnz < np.count_nonzero(dense)
+    translation = np.repeat(np.sqrt(masses), 3) * np.tile([1.0, 0.0, 0.0], len(masses))
+    np.testing.assert_allclose(cut @ translation, 0.0, atol=1e-12)
+
+    lines = [f"{len(fc)} {len(fc)}"]
+    for i in range(len(fc)):
+        for j in range(len(fc)):
+            lines.append(f"{i + 1} {j + 1}")
+            lines.extend(" ".join(f"{v:.15f}" for v in r) for r in fc[i, j])
+    (tmp_path / "FORCE_CONSTANTS").write_text("\n".join(lines) + "\n")
+    streamed = sparse_dynamical_matrix(
+        structure, tmp_path / "FORCE_CONSTANTS", cutoff=3.0
+    )
+    np.testing.assert_allclose(streamed.toarray(), cut.toarray(), atol=1e-12)
+
+    with pytest.raises(ValueError):
+        sparse_dynamical_matrix(structure, fc[:-1, :-1])
+
+
+@pytest.mark.parametrize("mode", ["dR", "dF"])
+def test_lanczos_S_omega_matches_diagonalisation(mode):
+    structure, fc = _spring_crystal()
+    phonons = calculate_gamma_phonons(structure, fc)
+    rng = np.random.default_rng(1)
+    vec = rng.normal(scale=0.05, size=(len(structure), 3))
+    if mode == "dR":
+        qks = calc_qks_vectorized(phonons.masses, vec, phonons.eigenvectors)
+    else:
+        qks = calc_qks_force_vectorized(
+            phonons.masses, vec, phonons.eigenvectors, phonons.frequencies
+        )
+    Sks = calc_Sks(qks, phonons.frequencies)
+    omega_range = [0.0, 0.3, 3000]
+    ref = calc_S_omega(phonons.frequencies, Sks, omega_range, sigma=6e-3)
+
+    dyn = sparse_dynamical_matrix(structure, fc)
+    freqs, S_eff = lanczos_modes(dyn, phonons.masses, niter=len(fc) * 3, **{mode: vec})
+    assert S_eff.sum() == pytest.approx(Sks.sum(), rel=1e-8)
+    S_omega = calc_S_omega_lanczos(
+        dyn, phonons.masses, omega_range, sigma=6e-3, niter=3 * len(fc), **{mode: vec}
+    )
+    np.testing.assert_allclose(S_omega, ref, atol=1e-6 * ref.max())
+
+    # A short run already captures the broadened shape and the HR factor
+    short = calc_S_omega_lanczos(
+        dyn, phonons.masses, omega_range, sigma=6e-3, niter=40, **{mode: vec}
+    )
+    assert np.abs(short - ref).max() < 0.05 * ref.max()
+
+
+def test_uncut_matrix_keeps_force_constants_that_break_asr():
+    """Without a cutoff the on-site blocks are left as given (no ASR rewrite)."""
+    structure, fc = _spring_crystal()
+    rng = np.random.default_rng(3)
+    noise = rng.normal(scale=0.05, size=fc.shape)
+    fc = fc + 0.5 * (noise + noise.transpose(1, 0, 3, 2))  # breaks ASR, stays symmetric
+    phonons = calculate_gamma_phonons(structure, fc)
+    vec = rng.normal(scale=0.05, size=(len(structure), 3))
+    Sks = calc_Sks(
+        calc_qks_vectorized(phonons.masses, vec, phonons.eigenvectors),
+        phonons.frequencies,
+    )
+    omega_range = [0.0, 0.3, 3000]
+    ref = calc_S_omega(phonons.frequencies, Sks, omega_range, sigma=6e-3)
+
+    dyn = sparse_dynamical_matrix(structure, fc)
+    np.testing.assert_allclose(
+        dyn.toarray(), gamma_dynamical_matrix(fc, phonons.masses), atol=1e-12
+    )
+    S_omega = calc_S_omega_lanczos(
+        dyn, phonons.masses, omega_range, sigma=6e-3, niter=3 * len(fc), dR=vec
+    )
+    np.testing.assert_allclose(S_omega, ref, atol=1e-6 * ref.max())
+    asr = sparse_dynamical_matrix(structure, fc, enforce_asr=True)
+    assert not np.allclose(asr.toarray(), dyn.toarray())
+
+
+def test_lanczos_modes_requires_a_seed():
+    structure, fc = _spring_crystal()
+    dyn = sparse_dynamical_matrix(structure, fc)
+    with pytest.raises(ValueError):
+        lanczos_modes(dyn, np.ones(len(fc)), dR=np.zeros((len(fc), 3)))
@@ -265,6 +265,18 @@ class TestNativeProcarParser:
         with pytest.raises(FileNotFoundError):
             _parse_procar_native(tmp_path / "PROCAR_ghost")
 
+    def test_parse_gzipped_procar(self, tmp_path: Path):
+        import gzip
+
+        p = tmp_path / "PROCAR.gz"
+        p.write_bytes(gzip.compress(_PROCAR_MINIMAL.encode()))
+        data = _parse_procar_native(p)
+        plain = _parse_procar_native(self._write_procar(tmp_path, _PROCAR_MINIMAL))
+        spin = data["spins"][0]
+        np.testing.assert_array_equal(
+            data["site_proj"][spin], plain["site_proj"][plain["spins"][0]]
+        )
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 3.  Neighbour detection helpers
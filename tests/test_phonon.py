@@ -6,6 +6,7 @@ Unit tests for the phonon.py module within the defectpl package layout.
 from pathlib import Path
 import numpy as np
 import pytest
+import yaml
 
 # ==============================================================================
 # CONFIGURATION / INPUT VARIABLES
@@ -17,8 +18,14 @@ MOCK_BAND_YAML_PATH = TEST_DIR / "band.yaml"
 # Import targets securely after path normalization
 from defectpl.phonon import (
     GammaPhononData,
+    band_yaml_to_npy,
+    calculate_gamma_phonons,
+    embed_force_constants,
+    read_band_hdf5,
     read_band_yaml,
+    read_force_constants,
     extract_gamma_phonon_data,
+    _read_band_yaml_full,
 )
 from defectpl.constants import THZ2EV
 
@@ -170,3 +177,314 @@ def test_gamma_phonon_data_serialization():
         reconstructed_data.eigenvectors, phonon_data.eigenvectors
     )
     np.testing.assert_allclose(reconstructed_data.masses, phonon_data.masses)
+
+
+def _write_phonopy_band_yaml(path, natom=3, nqpoint=2, seed=0):
+    """Write a band.yaml in phonopy's own block layout (header, comments, velocities)."""
+    rng = np.random.default_rng(seed)
+    lines = [
+        f"nqpoint: {nqpoint}",
+        "npath: 1",
+        "reciprocal_lattice:",
+        "- [     0.10000000,     0.00000000,     0.00000000 ] # a*",
+        f"natom: {natom}",
+        "points:",
+    ]
+    for i in range(natom):
+        lines += [
+            f"- symbol: C  # {i + 1}",
+            "  coordinates: [  0.000000000000000,  0.000000000000000,  0.0 ]",
+            f"  mass: {rng.uniform(1.0, 60.0):.6f}",
+        ]
+    lines += ["", "phonon:"]
+    for _ in range(nqpoint):
+        lines += [
+            "- q-position: [    0.0000000,    0.0000000,    0.0000000 ]",
+            "  distance:    0.0000000",
+            "  band:",
+        ]
+        for k in range(3 * natom):
+            lines += [
+                f"  - # {k + 1}",
+                f"    frequency: {rng.normal(5.0, 5.0):15.10f}",
+                "    group_velocity: [ 0.0000000, 0.0000000, 0.0000000 ]",
+                "    eigenvector:",
+            ]
+            for a in range(natom):
+                lines.append(f"    - # atom {a + 1}")
+                for re, im in rng.normal(scale=0.3, size=(3, 2)):
+                    lines.append(f"      - [ {re:17.14f}, {im:17.14f} ]")
+        lines.append("")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def _reference(path, q_idx):
+    freqs, evecs, masses = _read_band_yaml_full(path, q_idx)
+    freqs[freqs < 0.0] = 0.0
+    return freqs * THZ2EV, evecs, masses
+
+
+@pytest.mark.parametrize("q_idx", [0, 1])
+def test_read_band_yaml_stream_matches_yaml_loader(tmp_path, q_idx):
+    """The streaming reader is bit-identical to a full YAML load of the file."""
+    path = tmp_path / "band.yaml"
+    _write_phonopy_band_yaml(path)
+    for got, ref in zip(read_band_yaml(path, q_idx=q_idx), _reference(path, q_idx)):
+        assert got.dtype == ref.dtype and got.shape == ref.shape
+        assert np.array_equal(got, ref)
+
+
+def test_read_compressed_band_yaml_and_force_constants(tmp_path):
+    """band.yaml.gz and FORCE_CONSTANTS.bz2 are decompressed while streaming."""
+    import bz2
+    import gzip
+
+    path = tmp_path / "band.yaml"
+    _write_phonopy_band_yaml(path)
+    (tmp_path / "band.yaml.gz").write_bytes(gzip.compress(path.read_bytes()))
+    for got, ref in zip(
+        read_band_yaml(tmp_path / "band.yaml.gz", q_idx=1, use_cache=False),
+        read_band_yaml(path, q_idx=1, use_cache=False),
+    ):
+        assert np.array_equal(got, ref)
+
+    fc = np.random.default_rng(0).normal(size=(3, 3, 3, 3))
+    _write_force_constants(tmp_path / "FORCE_CONSTANTS", fc)
+    (tmp_path / "FORCE_CONSTANTS.bz2").write_bytes(
+        bz2.compress((tmp_path / "FORCE_CONSTANTS").read_bytes())
+    )
+    np.testing.assert_allclose(
+        read_force_constants(tmp_path / "FORCE_CONSTANTS.bz2"), fc
+    )
+
+
+def test_read_band_yaml_falls_back_for_other_layouts(tmp_path):
+    """A flow-style (JSON) band.yaml is read through the YAML loader fallback."""
+    import json
+
+    src = tmp_path / "band.yaml"
+    _write_phonopy_band_yaml(src, nqpoint=1)
+    ref = _reference(src, 0)
+    flow = tmp_path / "band_flow.yaml"
+    flow.write_text(json.dumps(yaml.safe_load(src.read_text())))
+    for got, expected in zip(read_band_yaml(flow), ref):
+        assert np.array_equal(got, expected)
+
+    with pytest.raises(IndexError):
+        read_band_yaml(src, q_idx=3)
+
+
+def test_band_yaml_to_npy_memory_maps_eigenvectors(tmp_path):
+    """Conversion to .npy is exact and reopens the eigenvectors as a memmap."""
+    from defectpl.core.structures import PhononData
+
+    src = tmp_path / "band.yaml"
+    _write_phonopy_band_yaml(src, natom=4, nqpoint=2)
+    data = band_yaml_to_npy(src, tmp_path / "npy", q_idx=1)
+    assert data.is_memmapped
+    assert data.natoms == 4 and data.nmodes == 12
+    assert data.meta["q_idx"] == 1
+    for got, ref in zip(data.as_tuple, _reference(src, 1)):
+        assert np.array_equal(got, ref)
+
+    # Round trip through save_npy / load_npy, mapped or loaded
+    copy = PhononData.load_npy(data.save_npy(tmp_path / "copy"), mmap_mode=None)
+    assert not copy.is_memmapped
+    assert np.array_equal(copy.eigenvectors, data.eigenvectors)
+
+    gamma = extract_gamma_phonon_data(src).to_phonon_data()
+    assert np.array_equal(gamma.eigenvectors, _reference(src, 0)[1])
+
+
+def _write_phonopy_band_hdf5(path, natom=3, shape=(2, 3), seed=0):
+    """Write a band.hdf5 in phonopy's layout; return frequencies and eigenvectors."""
+    h5py = pytest.importorskip("h5py")
+    rng = np.random.default_rng(seed)
+    nb = 3 * natom
+    freqs = rng.normal(5.0, 5.0, size=shape + (nb,))
+    evecs = rng.normal(size=shape + (nb, nb)) + 1j * rng.normal(size=shape + (nb, nb))
+    with h5py.File(path, "w") as f:
+        f["frequency"] = freqs
+        f["eigenvector"] = evecs
+        f["path"] = np.zeros(shape + (3,))
+    return freqs.reshape(-1, nb), evecs.reshape(-1, nb, nb)
+
+
+def test_read_band_hdf5_reads_one_q_point(tmp_path):
+    """Hyperslab read of the real eigenvectors matches phonopy's column layout."""
+    src = tmp_path / "band.hdf5"
+    freqs, evecs = _write_phonopy_band_hdf5(src, natom=3)
+    masses = np.array([12.0, 14.0, 16.0])
+
+    for q_idx in (0, 4):
+        f, e, m = read_band_hdf5(src, q_idx, masses=masses)
+        expected = freqs[q_idx].copy()
+        expected[expected < 0.0] = 0.0
+        np.testing.assert_allclose(f, expected * THZ2EV)
+        assert e.shape == (9, 3, 3) and e.dtype == np.float64
+        np.testing.assert_array_equal(e, evecs[q_idx].real.T.reshape(9, 3, 3))
+        np.testing.assert_array_equal(m, masses)
+
+    with pytest.raises(ValueError, match="no masses"):
+        read_band_hdf5(src)
+    structure = _cubic_crystal(1)
+    structure.append("N", [0.5, 0.5, 0.5])
+    structure.append("O", [0.5, 0.0, 0.0])
+    np.testing.assert_allclose(
+        read_band_hdf5(src, structure=structure)[2], [12.011, 14.007, 15.999], atol=1e-3
+    )
+    with pytest.raises(ValueError, match="out of range"):
+        read_band_hdf5(src, 6, masses=masses)
+
+    # Masses from phonopy.yaml, picked up by the read_band_yaml dispatch
+    points = [{"symbol": s, "mass": float(m)} for s, m in zip("CNO", masses + 0.5)]
+    cell = {"supercell": {"points": points}, "unit_cell": {"points": points[:1]}}
+    (tmp_path / "phonopy.yaml").write_text(yaml.safe_dump(cell))
+    f, e, m = read_band_yaml(src)
+    np.testing.assert_array_equal(m, masses + 0.5)
+    np.testing.assert_array_equal(e, evecs[0].real.T.reshape(9, 3, 3))
+
+
+def _write_force_constants(path, fc, rows=None):
+    n1, n2 = fc.shape[:2]
+    rows = range(1, n1 + 1) if rows is None else rows
+    lines = [f"{n1:4d} {n2:4d}"]
+    for i, row in enumerate(rows):
+        for j in range(n2):
+            lines.append(f"{row:4d} {j + 1:4d}")
+            lines.extend(" ".join(f"{v:22.15f}" for v in r) for r in fc[i, j])
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_calculate_gamma_phonons_diatomic_spring(tmp_path):
+    """Two atoms joined by a spring k along x: ω = sqrt(k (1/m1 + 1/m2))."""
+    from pymatgen.core import Lattice, Structure
+
+    from defectpl.constants import AMU2KG, ANG2M, EV2J, HBAR_EVS
+
+    k = 5.0  # eV/Å²
+    fc = np.zeros((2, 2, 3, 3))
+    fc[0, 0, 0, 0] = fc[1, 1, 0, 0] = k
+    fc[0, 1, 0, 0] = fc[1, 0, 0, 0] = -k
+    _write_force_constants(tmp_path / "FORCE_CONSTANTS", fc)
+    structure = Structure(Lattice.cubic(10.0), ["C", "O"], [[0, 0, 0], [0.1, 0, 0]])
+    structure.to(filename=str(tmp_path / "POSCAR"), fmt="poscar")
+
+    data = calculate_gamma_phonons(tmp_path / "POSCAR", tmp_path / "FORCE_CONSTANTS")
+    m1, m2 = data.masses
+    omega = np.sqrt(k * (1 / m1 + 1 / m2) * EV2J / (ANG2M**2 * AMU2KG))
+    assert data.nmodes == 6 and data.eigenvectors.shape == (6, 2, 3)
+    assert data.frequencies[-1] == pytest.approx(HBAR_EVS * omega, rel=1e-12)
+    np.testing.assert_allclose(data.frequencies[:-1], 0.0, atol=1e-12)
+    stretch = data.eigenvectors[-1]
+    assert abs(stretch[0, 0]) == pytest.approx(np.sqrt(m2 / (m1 + m2)))
+
+    # Subset eigensolver: only the stretching mode, or only the zero modes
+    high = calculate_gamma_phonons(structure, fc, frequency_range=(0.01, 1.0))
+    assert high.nmodes == 1
+    assert high.frequencies[0] == pytest.approx(data.frequencies[-1], rel=1e-12)
+    assert (
+        calculate_gamma_phonons(structure, fc, frequency_range=(0.0, 0.01)).nmodes == 5
+    )
+
+
+def test_read_force_constants_rejects_compact_and_mismatch(tmp_path):
+    rng = np.random.default_rng(0)
+    fc = rng.normal(size=(3, 3, 3, 3))
+    _write_force_constants(tmp_path / "FORCE_CONSTANTS", fc)
+    np.testing.assert_allclose(read_force_constants(tmp_path / "FORCE_CONSTANTS"), fc)
+    with pytest.raises(ValueError, match="do not match"):
+        calculate_gamma_phonons(masses=np.ones(2), force_constants=fc)
+
+    _write_force_constants(tmp_path / "FC_compact", fc[:1], rows=[1])
+    with pytest.raises(ValueError, match="compact"):
+        read_force_constants(tmp_path / "FC_compact")
+
+
+def _cubic_crystal(n, a=2.5):
+    from pymatgen.core import Lattice, Structure
+
+    grid = np.array([[x, y, z] for x in range(n) for y in range(n) for z in range(n)])
+    return Structure(Lattice.cubic(n * a), ["C"] * n**3, grid / n)
+
+
+def _spring_force_constants(structure, stiff_site=None, a=2.5):
+    """Central nearest/next-nearest springs; springs to *stiff_site* doubled."""
+    frac = structure.frac_coords
+    d = frac[None, :, :] - frac[:, None, :]
+    d = (d - np.rint(d)) @ structure.lattice.matrix
+    r = np.linalg.norm(d, axis=2)
+    k = np.where(r < 1.1 * a, 4.0, np.where(r < 1.1 * np.sqrt(2) * a, 0.5, 0.0))
+    np.fill_diagonal(k, 0.0)
+    if stiff_site is not None:
+        k[stiff_site, :] *= 2.0
+        k[:, stiff_site] *= 2.0
+    r[r == 0.0] = 1.0
+    fc = (
+        -k[..., None, None]
+        * d[..., :, None]
+        * d[..., None, :]
+        / r[..., None, None] ** 2
+    )
+    idx = np.arange(len(frac))
+    fc[idx, idx] = -fc.sum(axis=1)
+    return fc
+
+
+def _site_at(structure, frac):
+    d = structure.frac_coords - frac
+    return int(np.argmin(np.linalg.norm(d - np.rint(d), axis=1)))
+
+
+def test_embed_force_constants_reproduces_large_cell_model():
+    bulk = _cubic_crystal(4)
+    fc_bulk = _spring_force_constants(bulk)
+    fc_def = _spring_force_constants(bulk, stiff_site=0)
+    center = bulk.frac_coords[0]
+
+    perfect = embed_force_constants(bulk, fc_bulk, bulk, fc_bulk, 2, center)
+    assert len(perfect.structure) == 512
+    ref = _spring_force_constants(perfect.structure)
+    np.testing.assert_allclose(
+        perfect.force_constants.toarray(),
+        ref.transpose(0, 2, 1, 3).reshape(1536, 1536),
+        atol=1e-12,
+    )
+
+    emb = embed_force_constants(bulk, fc_bulk, bulk, fc_def, 2, center, radius=3.6)
+    assert len(emb.defect_indices) == 19  # the site, 6 NN and 12 2NN
+    stiff = _site_at(emb.structure, [0.0, 0.0, 0.0])
+    assert stiff in emb.defect_indices
+    ref = _spring_force_constants(emb.structure, stiff_site=stiff)
+    np.testing.assert_allclose(
+        emb.force_constants.toarray(),
+        ref.transpose(0, 2, 1, 3).reshape(1536, 1536),
+        atol=1e-12,
+    )
+
+    # Hand-off to the dense eigensolver and the sparse/Lanczos engines
+    phonons = calculate_gamma_phonons(emb.structure, emb.force_constants)
+    ref_phonons = calculate_gamma_phonons(emb.structure, ref)
+    np.testing.assert_allclose(phonons.frequencies, ref_phonons.frequencies, atol=1e-9)
+    assert emb.dynamical_matrix().shape == (1536, 1536)
+
+
+def test_embed_force_constants_vacancy_and_validation():
+    bulk = _cubic_crystal(4)
+    fc_bulk = _spring_force_constants(bulk)
+    vacancy = bulk.copy()
+    vacancy.remove_sites([0])
+    fc_vac = _spring_force_constants(vacancy)
+
+    emb = embed_force_constants(bulk, fc_bulk, vacancy, fc_vac, [2, 2, 2], [0, 0, 0])
+    assert len(emb.structure) == 511
+    masses = emb.masses
+    translation = np.repeat(np.ones_like(masses), 3) * np.tile([0.0, 1.0, 0.0], 511)
+    np.testing.assert_allclose(emb.force_constants @ translation, 0.0, atol=1e-12)
+
+    with pytest.raises(ValueError, match="radius"):
+        embed_force_constants(bulk, fc_bulk, vacancy, fc_vac, 2, [0, 0, 0], radius=6.0)
+    with pytest.raises(ValueError, match="cutoff"):
+        embed_force_constants(bulk, fc_bulk, vacancy, fc_vac, 2, [0, 0, 0], cutoff=6.0)
+    with pytest.raises(ValueError, match="do not match"):
+        embed_force_constants(bulk, fc_bulk, vacancy, fc_bulk, 2, [0, 0, 0])
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the defect point group and symmetry-adapted phonon blocks.
+"""
+
+import numpy as np
+import pytest
+from pymatgen.core import Lattice, Structure
+
+from defectpl.phonon import calculate_gamma_phonons
+from defectpl.symmetry import defect_symmetry, symmetry_blocks
+from defectpl.utils import calc_qks_vectorized, calc_Sks
+
+
+def _spring_crystal(n, species=None, a=2.5):
+    """Simple-cubic n x n x n C supercell with central nearest/2nd-neighbour springs."""
+    grid = np.array([[x, y, z] for x in range(n) for y in range(n) for z in range(n)])
+    structure = Structure(Lattice.cubic(n * a), ["C"] * n**3, grid / n)
+    for index, specie in (species or {}).items():
+        structure.replace(index, specie)
+    d = structure.frac_coords[None, :, :] - structure.frac_coords[:, None, :]
+    d = (d - np.rint(d)) @ structure.lattice.matrix
+    r = np.linalg.norm(d, axis=2)
+    k = np.where(r < 1.1 * a, 4.0, np.where(r < 1.1 * np.sqrt(2) * a, 0.5, 0.0))
+    k[0] *= 1.5  # stiffer springs around the defect at the origin
+    k[:, 0] *= 1.5
+    np.fill_diagonal(k, 0.0)
+    r[r == 0.0] = 1.0
+    fc = -k[..., None, None] * d[..., :, None] * d[..., None, :]
+    fc /= r[..., None, None] ** 2
+    idx = np.arange(len(structure))
+    fc[idx, idx] = -fc.sum(axis=1)
+    return structure, fc
+
+
+def _c3v_crystal(n=4):
+    """N at the origin and O at (1, 1, 1)/n: C3v about [111]."""
+    return _spring_crystal(n, {0: "N", n * n + n + 1: "O"})
+
+
+def test_defect_symmetry_labels_and_dimensions():
+    structure, _ = _spring_crystal(3)
+    structure.remove_sites([0])  # vacancy: full cubic site symmetry
+    sym = defect_symmetry(structure, [0, 0, 0])
+    assert sym.point_group == "m-3m" and len(sym) == 48 and len(sym.classes) == 10
+    blocks = symmetry_blocks(sym)
+    assert sum(b.size for b in blocks) == 3 * len(structure)
+    assert blocks[0].label == "A1g"
+    oh = set("A1g A2g Eg T1g T2g A1u A2u Eu T1u T2u".split())
+    assert {b.label for b in blocks} <= oh
+    # Translations of the whole cell are a T1u triplet
+    assert "T1u" in {b.label for b in blocks}
+
+    structure, _ = _c3v_crystal()
+    sym = defect_symmetry(structure, [0, 0, 0])
+    blocks = symmetry_blocks(sym)
+    assert sym.point_group == "3m"
+    assert [b.label for b in blocks] == ["A1", "A2", "E"]
+    assert sum(b.size for b in blocks) == 3 * len(structure)
+    for block in blocks:
+        for B in block.bases:
+            np.testing.assert_allclose(
+                (B.T @ B).toarray(), np.eye(B.shape[1]), atol=1e-10
+            )
+
+    dR = np.random.default_rng(0).normal(size=(len(structure), 3))
+    sym_dR = sym.symmetrize(dR)
+    np.testing.assert_allclose(sym.symmetrize(sym_dR), sym_dR, atol=1e-12)
+    assert blocks[0].weight(sym_dR.ravel()) == pytest.approx(np.sum(sym_dR**2))
+
+
+def test_symmetry_adapted_phonons_match_full_diagonalisation():
+    structure, fc = _c3v_crystal()
+    center = [0.0, 0.0, 0.0]
+    full = calculate_gamma_phonons(structure, fc)
+
+    every = calculate_gamma_phonons(structure, fc, defect_center=center)
+    np.testing.assert_allclose(every.frequencies, full.frequencies, atol=1e-9)
+    assert every.meta["point_group"] == "3m"
+    assert len(every.meta["irreps"]) == every.nmodes == full.nmodes
+
+    # A symmetric dR only needs the A1 block, with the same HR factor
+    sym = defect_symmetry(structure, center)
+    dR = sym.symmetrize(np.random.default_rng(1).normal(scale=0.02, size=(64, 3)))
+    a1 = calculate_gamma_phonons(structure, fc, defect_center=center, dR=dR)
+    assert set(a1.meta["irreps"]) == {"A1"} and a1.nmodes < full.nmodes / 3
+
+    def hr(p):
+        return calc_Sks(
+            calc_qks_vectorized(p.masses, dR, p.eigenvectors), p.frequencies
+        )
+
+    assert hr(a1).sum() == pytest.approx(hr(full).sum(), rel=1e-8)
+
+    # E modes for Jahn-Teller analysis come in degenerate pairs
+    e = calculate_gamma_phonons(structure, fc, defect_center=center, irreps=["E"])
+    assert set(e.meta["irreps"]) == {"E"}
+    np.testing.assert_allclose(e.frequencies[::2], e.frequencies[1::2], atol=1e-9)
+
+    with pytest.raises(ValueError, match="do not occur"):
+        calculate_gamma_phonons(structure, fc, defect_center=center, irreps=["T2"])
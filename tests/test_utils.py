@@ -29,6 +29,20 @@ from defectpl.utils import (
     calc_Absorption_Intensity,
     calc_effective_phonon_frequency,
     calc_IPR_alkauskas,
+    broaden_spectral_weights,
+    calc_St_direct,
+    calc_Ct_direct,
+    next_fast_len,
+    energy_window_indices,
+    calc_Emission_Absorption_Intensity,
+    calc_peak_shift,
+    calc_stokes_shift,
+    calc_qks_batch,
+    calc_qks_force_batch,
+    mode_blocks,
+    project_modes,
+    calc_qks_vectorized,
+    calc_qks_force_vectorized,
 )
 
 # =====================================================================
@@ -110,6 +124,42 @@ def test_calc_S_omega():
     assert np.any(S_omega > 0.0)
 
 
+def test_broaden_spectral_weights_matches_dense_gaussians():
+    frequencies = np.array([0.02, 0.05, 0.11, 0.16])
+    weights = np.array([[0.4, 0.0, 1.2, 0.3], [0.1, 0.2, 0.0, 0.5]])
+    omega_range = [0.0, 0.2, 801]
+    sigma = (3e-3, 9e-3)
+    grid = np.linspace(*omega_range[:2], omega_range[2])
+    sigmas = 3e-3 + 6e-3 * (frequencies - 0.02) / 0.14
+    dense = np.stack(
+        [
+            sum(
+                w * gaussian_broadening(grid, f, sk)
+                for w, f, sk in zip(row, frequencies, sigmas)
+            )
+            for row in weights
+        ]
+    )
+    result = broaden_spectral_weights(frequencies, weights, omega_range, sigma)
+    assert result.shape == (2, 801)
+    np.testing.assert_allclose(result, dense, rtol=0, atol=1e-5 * dense.max())
+    np.testing.assert_allclose(
+        broaden_spectral_weights(frequencies, weights[1], omega_range, sigma), result[1]
+    )
+
+
+def test_calc_S_omega_variable_sigma_conserves_weight():
+    frequencies = np.array([0.05, 0.1])
+    Sks = np.array([1.5, 0.5])
+    omega_range = [0.0, 0.3, 3001]
+    dw = 0.3 / 3000
+    S_omega = calc_S_omega(frequencies, Sks, omega_range, sigma=(4e-3, 1e-2))
+    assert np.sum(S_omega) * dw == pytest.approx(2.0, rel=1e-6)
+    # The wider high-frequency peak is lower than a uniform-width one
+    S_uniform = calc_S_omega(frequencies, Sks, omega_range, sigma=4e-3)
+    assert S_omega[1000] < S_uniform[1000]
+
+
 def test_calc_IPR():
     # Fully localized on atom 0: IPR = 1
     eigenvectors = np.array([[[1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]])
@@ -146,6 +196,97 @@ def test_time_domain_transforms():
     assert len(A_intensity) == 64
 
 
+@pytest.mark.parametrize("npts", [2000, 2001])
+def test_calc_St_direct_matches_fft_route(npts):
+    rng = np.random.default_rng(3)
+    freqs = np.sort(rng.uniform(0.03, 0.17, 40))
+    Sks = rng.random(40) * 0.05
+    omega_range = [0.0, 2.0, npts]
+    sigma = (4e-3, 8e-3)
+    ref = calc_St(calc_S_omega(freqs, Sks, omega_range, sigma))
+    direct = calc_St_direct(freqs, Sks, omega_range, sigma, chunk_size=7)
+    np.testing.assert_allclose(direct, ref, rtol=0, atol=1e-6 * np.abs(ref).max())
+
+    nks = calc_phonon_occupation(freqs, np.array([100.0, 300.0]))
+    Ct = calc_Ct_direct(freqs, Sks, nks, omega_range, sigma)
+    Ct_ref = calc_Ct(calc_C_omega(freqs, Sks, nks, omega_range, sigma))
+    assert Ct.shape == (2, npts)
+    np.testing.assert_allclose(Ct, Ct_ref, rtol=0, atol=1e-6 * np.abs(Ct_ref).max())
+
+
+def test_calc_St_direct_weight_cutoff_skips_small_modes():
+    freqs = np.array([0.05, 0.08])
+    Sks = np.array([1.0, 1e-9])
+    omega_range = [0.0, 1.0, 500]
+    full = calc_St_direct(freqs, Sks, omega_range)
+    cut = calc_St_direct(freqs, Sks, omega_range, weight_cutoff=1e-6)
+    only_first = calc_St_direct(freqs[:1], Sks[:1], omega_range)
+    np.testing.assert_allclose(cut, only_first)
+    np.testing.assert_allclose(cut, full, atol=1e-6)
+
+
+def test_time_domain_transforms_batched_rows_match():
+    rng = np.random.default_rng(1)
+    S_stack = rng.random((3, 64))
+    St = calc_St(S_stack)
+    Gts = calc_Gts(St, np.array([1.0, 2.0, 3.0]), np.array([1.0, 2.0, 5.0]), 100.0)
+    A, intensity = calc_Spectrum_Intensity(Gts, np.array([0.2, 0.3, 0.4]), 100.0)
+    for i, (hr, g, e) in enumerate([(1.0, 1.0, 0.2), (2.0, 2.0, 0.3), (3.0, 5.0, 0.4)]):
+        St_i = calc_St(S_stack[i])
+        Gts_i = calc_Gts(St_i, hr, g, 100.0)
+        A_i, I_i = calc_Spectrum_Intensity(Gts_i, e, 100.0)
+        np.testing.assert_allclose(St[i], St_i)
+        np.testing.assert_allclose(Gts[i], Gts_i)
+        np.testing.assert_allclose(intensity[i], I_i)
+
+
+def test_next_fast_len_is_smallest_5_smooth():
+    def is_smooth(n):
+        for p in (2, 3, 5):
+            while n % p == 0:
+                n //= p
+        return n == 1
+
+    for n in (1, 7, 997, 4999, 5003, 12289):
+        fast = next_fast_len(n)
+        assert fast >= n and is_smooth(fast)
+        assert not any(is_smooth(m) for m in range(n, fast))
+
+
+def test_spectrum_energy_window_matches_full_slice():
+    rng = np.random.default_rng(1)
+    Gts = rng.normal(size=(2, 500)) + 1j * rng.normal(size=(2, 500))
+    idx = energy_window_indices(500, 100.0, (0.5, 2.5))
+    assert idx[0] == 50 and idx[-1] == 250
+    for func in (calc_Spectrum_Intensity, calc_Absorption_Intensity):
+        A_full, I_full = func(Gts, np.array([1.9, 2.0]), 100.0)
+        A_win, I_win = func(Gts, np.array([1.9, 2.0]), 100.0, energy_window=(0.5, 2.5))
+        np.testing.assert_array_equal(A_win, A_full[:, idx])
+        np.testing.assert_array_equal(I_win, I_full[:, idx])
+
+
+def test_lineshape_transforms_preserve_single_precision():
+    freqs = np.linspace(0.01, 0.1, 12)
+    Sks = np.linspace(0.1, 0.5, 12)
+    omega_range = [0.0, 2.0, 400]
+    S32 = calc_S_omega(freqs, Sks.astype(np.float32), omega_range)
+    assert S32.dtype == np.float32
+    St32 = calc_St(S32)
+    assert St32.dtype == np.complex64
+    assert calc_St_direct(freqs, Sks.astype(np.float32), omega_range).dtype == (
+        np.complex64
+    )
+    Gts32 = calc_Gts(St32, Sks.sum(), 2.0, 200.0)
+    assert Gts32.dtype == np.complex64
+    A32, I32 = calc_Spectrum_Intensity(Gts32, 1.5, 200.0)
+    assert I32.dtype == np.complex64
+
+    Gts64 = calc_Gts(
+        calc_St(calc_S_omega(freqs, Sks, omega_range)), Sks.sum(), 2.0, 200.0
+    )
+    np.testing.assert_allclose(Gts32, Gts64, atol=1e-5 * np.abs(Gts64).max())
+
+
 # =====================================================================
 # PYMATGEN STRUCTURE DEPENDENT VASP FILE PARSER TESTS
 # =====================================================================
@@ -234,6 +375,31 @@ def test_calc_phonon_occupation_bose_einstein_limit():
     assert nks[0] == pytest.approx(0.169, abs=0.01)
 
 
+def test_calc_phonon_occupation_temperature_array():
+    freqs = np.array([0.0, 0.02, 0.05])
+    temps = np.array([0.0, 100.0, 300.0])
+    nks = calc_phonon_occupation(freqs, temps)
+    assert nks.shape == (3, 3)
+    for i, T in enumerate(temps):
+        np.testing.assert_allclose(nks[i], calc_phonon_occupation(freqs, T))
+    # Zero-frequency modes never diverge
+    assert np.all(nks[:, 0] == 0.0)
+
+
+def test_calc_C_omega_temperature_matrix_rows_match():
+    freqs = np.array([0.02, 0.04, 0.06])
+    Sks = np.array([0.5, 0.3, 0.1])
+    omega_range = [0.0, 0.1, 400]
+    nks = calc_phonon_occupation(freqs, np.array([0.0, 150.0, 400.0]))
+    C = calc_C_omega(freqs, Sks, nks, omega_range, sigma=(4e-3, 8e-3))
+    assert C.shape == (3, 400)
+    for i in range(3):
+        np.testing.assert_allclose(
+            C[i], calc_C_omega(freqs, Sks, nks[i], omega_range, sigma=(4e-3, 8e-3))
+        )
+    np.testing.assert_allclose(calc_C_total(nks, Sks), nks @ Sks)
+
+
 def test_calc_C_omega_zero_temperature():
     freqs = np.array([0.02, 0.04])
     Sks = np.array([0.5, 0.3])
@@ -319,6 +485,67 @@ def test_calc_Absorption_Intensity_omega1_prefactor():
     np.testing.assert_allclose(np.abs(intensity_abs), np.abs(A_abs) * omega, rtol=1e-10)
 
 
+def _toy_generating_function(resolution=200, npoints=800):
+    freqs = np.array([0.03, 0.05, 0.07])
+    Sks = np.array([1.0, 0.8, 0.5])
+    S_omega = calc_S_omega(freqs, Sks, [0, npoints / resolution, npoints], 5e-3)
+    return calc_Gts(calc_St(S_omega), Sks.sum(), 2.0, resolution)
+
+
+def test_calc_Absorption_Intensity_sideband_above_zpl():
+    Gts = _toy_generating_function()
+    energies = np.arange(Gts.size) / 200
+    _, intensity = calc_Spectrum_Intensity(Gts, 2.0, 200)
+    _, absorption = calc_Absorption_Intensity(Gts, 2.0, 200)
+    below, above = energies < 1.97, energies > 2.03
+    assert np.abs(intensity[below]).sum() > 10 * np.abs(intensity[above]).sum()
+    assert np.abs(absorption[above]).sum() > 10 * np.abs(absorption[below]).sum()
+
+
+def test_calc_Emission_Absorption_Intensity_matches_separate_transforms():
+    Gts = np.stack([_toy_generating_function(), _toy_generating_function() ** 2])
+    window = (1.5, 2.5)
+    fused = calc_Emission_Absorption_Intensity(Gts, 2.0, 200, energy_window=window)
+    pl = calc_Spectrum_Intensity(Gts, 2.0, 200, energy_window=window)
+    ab = calc_Absorption_Intensity(Gts, 2.0, 200, energy_window=window)
+    for got, ref in zip(fused, pl + ab):
+        np.testing.assert_allclose(got, ref, atol=1e-12 * np.abs(ref).max())
+
+
+def test_calc_peak_shift_peak_distance():
+    energies = np.linspace(1.0, 3.0, 201)
+    intensity = np.exp(-(((energies - 1.8) / 0.1) ** 2))
+    absorption = np.exp(-(((energies - 2.3) / 0.1) ** 2))
+    assert calc_peak_shift(energies, intensity, absorption) == pytest.approx(0.5)
+
+
+def test_calc_stokes_shift_is_twice_the_relaxation_energy():
+    frequencies = np.array([0.02, 0.05, 0.08])
+    Sks = np.array([0.1, 0.2, 0.05])
+    assert calc_stokes_shift(frequencies, Sks) == pytest.approx(2 * 0.016)
+
+
+def test_calc_qks_batch_matches_per_configuration():
+    rng = np.random.default_rng(4)
+    masses = rng.uniform(10.0, 60.0, 5)
+    eigenvectors = rng.normal(size=(15, 5, 3))
+    frequencies = np.linspace(0.0, 0.1, 15)
+    stack = rng.normal(size=(4, 5, 3))
+    q_disp = calc_qks_batch(masses, stack, eigenvectors)
+    q_force = calc_qks_force_batch(masses, stack, eigenvectors, frequencies)
+    assert q_disp.shape == q_force.shape == (4, 15)
+    for c in range(4):
+        np.testing.assert_allclose(
+            q_disp[c], calc_qks_vectorized(masses, stack[c], eigenvectors), rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            q_force[c],
+            calc_qks_force_vectorized(masses, stack[c], eigenvectors, frequencies),
+            rtol=1e-12,
+        )
+    assert np.all(q_force[:, 0] == 0.0)
+
+
 def test_calc_effective_phonon_frequency_uniform():
     freqs = np.array([0.02, 0.04, 0.06])
     dq = np.array([1.0, 1.0, 1.0])
@@ -349,3 +576,28 @@ def test_calc_IPR_alkauskas_range():
     ipr_alk = calc_IPR_alkauskas(eigenvectors)
     assert np.all(ipr_alk >= 1.0 - 1e-10)
     assert np.all(ipr_alk <= natoms + 1e-10)
+
+
+def test_mode_streamed_projection_and_ipr_on_memmap(tmp_path):
+    rng = np.random.default_rng(5)
+    eigenvectors = rng.normal(size=(12, 4, 3))
+    mapped = np.lib.format.open_memmap(
+        tmp_path / "evecs.npy", mode="w+", dtype=float, shape=eigenvectors.shape
+    )
+    mapped[:] = eigenvectors
+    # Two modes (2 * 4 * 3 doubles) per block
+    blocks = list(mode_blocks(mapped, block_bytes=2 * 12 * 8))
+    assert len(blocks) == 6 and blocks[-1][0] == slice(10, 12)
+
+    stack = rng.normal(size=(3, 4, 3))
+    expected = np.einsum("kij,cij->ck", eigenvectors, stack)
+    np.testing.assert_allclose(
+        project_modes(stack, mapped, block_bytes=100), expected, rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        project_modes(stack[0], mapped, block_bytes=100), expected[0], rtol=1e-12
+    )
+    np.testing.assert_allclose(calc_IPR(mapped), calc_IPR(eigenvectors), rtol=1e-14)
+    np.testing.assert_allclose(
+        calc_IPR_alkauskas(mapped), calc_IPR_alkauskas(eigenvectors), rtol=1e-14
+    )
@@ -21,15 +21,22 @@ MOCK_EIGENVAL_PATH = TEST_DIR / "EIGENVAL"
 
 # Import targets securely after path normalization
 from defectpl.io.vasp import (
+    OUTCAR_EXTRACTORS,
+    OutcarExtractor,
     OutcarParser,
+    OutcarTrajectory,
     check_outcar_convergence,
     get_final_structure_and_forces_from_outcar,
     get_first_structure_and_forces_from_outcar,
     get_nions,
+    get_outcar_trajectory,
     get_species_and_index_map,
     get_structures_and_forces,
     get_spin_multiplicity,
+    index_outcar,
     read_eigenval_file,
+    register_outcar_extractor,
+    scan_outcar,
 )
 
 # ==============================================================================
@@ -192,6 +199,42 @@ def test_get_structures_and_forces_with_poscar():
     assert structures[0].species[0].symbol == "Ga"
 
 
+def test_outcar_trajectory_arrays_structures_and_npz(tmp_path, monkeypatch):
+    """The array trajectory backs the Structure wrappers and round-trips via npz."""
+    traj = get_outcar_trajectory(MOCK_OUTCAR_PATH)
+    assert len(traj) == traj.nsteps == 2 and traj.natoms == 2
+    assert traj.positions.shape == traj.forces.shape == (2, 2, 3)
+    assert list(traj.species) == ["Ga", "As"]
+    np.testing.assert_allclose(traj.lattices[-1], 5.1 * np.eye(3))
+
+    structures, forces = get_structures_and_forces(MOCK_OUTCAR_PATH)
+    assert traj.structure(0) == structures[0] and traj.structure() == structures[-1]
+    np.testing.assert_array_equal(np.array(forces), traj.forces)
+    with_poscar = get_outcar_trajectory(MOCK_OUTCAR_PATH, MOCK_POSCAR_PATH)
+    assert list(with_poscar.species) == ["Ga", "As"]
+
+    path = traj.to_npz(tmp_path / "traj")
+    assert path.name == "traj.npz"
+    loaded = OutcarTrajectory.from_npz(path)
+    for name in ("positions", "forces", "lattices", "species"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(traj, name))
+    loaded = OutcarTrajectory.from_npz(traj.to_npz(tmp_path / "z.npz", True))
+    assert loaded.structure(1) == structures[1]
+
+    with pytest.raises(ValueError, match="species"):
+        OutcarTrajectory(traj.positions, traj.forces, traj.lattices, ["Ga"])
+    with pytest.raises(ValueError, match="forces shape"):
+        OutcarTrajectory(traj.positions, traj.forces[:1], traj.lattices, traj.species)
+
+    # The parser's trajectory comes from its cached scan; no Structure is built
+    import pymatgen.core
+
+    parser = OutcarParser(MOCK_OUTCAR_PATH)
+    monkeypatch.setattr(pymatgen.core, "Structure", None)
+    assert parser.trajectory is parser.get_trajectory()
+    np.testing.assert_array_equal(parser.trajectory.positions, traj.positions)
+
+
 def test_get_first_and_last_standalone():
     """Verifies index-targeted tracking wrapper shortcuts."""
     struct_first, force_first = get_first_structure_and_forces_from_outcar(
@@ -221,6 +264,196 @@ def test_outcar_parser_class():
     assert conv["structural_converged"] is True
 
 
+@pytest.mark.parametrize("text", ["", " not an OUTCAR\n just text\n"])
+def test_outcar_without_nions_raises(tmp_path, text):
+    """Trajectory readers report the missing NIONS token, not a reshape error."""
+    path = tmp_path / "OUTCAR"
+    path.write_text(text)
+    with pytest.raises(ValueError, match="NIONS"):
+        get_structures_and_forces(path)
+    with pytest.raises(ValueError, match="NIONS"):
+        get_outcar_trajectory(path)
+    for attr in ("positions", "forces", "lattices", "natoms"):
+        with pytest.raises(ValueError, match="NIONS"):
+            getattr(OutcarParser(path), attr)
+
+
+def test_outcar_index_seeks_to_every_step(tmp_path):
+    """Checks indexed and end-of-file access against the full trajectory parse."""
+    structures, forces = get_structures_and_forces(MOCK_OUTCAR_PATH)
+    index = index_outcar(MOCK_OUTCAR_PATH)
+    assert index.nsteps == 2 and len(index.lattice_offsets) == 2
+
+    parser = OutcarParser(MOCK_OUTCAR_PATH)
+    struct_last, force_last = parser.get_final_structure_and_forces()
+    assert parser._index is None  # reverse scan, no full index built
+    assert struct_last == structures[-1]
+    np.testing.assert_allclose(force_last, forces[-1])
+
+    for step in (0, 1, -1, -2):
+        struct, force = parser.get_step(step)
+        assert struct == structures[step]
+        np.testing.assert_allclose(force, forces[step])
+    assert parser.nsteps == 2
+    with pytest.raises(IndexError):
+        parser.get_step(2)
+
+    empty = tmp_path / "OUTCAR"
+    empty.write_text(" NIONS =       2\n")
+    with pytest.raises(ValueError, match="No POSITION"):
+        OutcarParser(empty).get_final_structure_and_forces()
+    truncated = tmp_path / "OUTCAR_cut"
+    truncated.write_text(MOCK_OUTCAR_PATH.read_text()[:-300])
+    with pytest.raises(ValueError, match="Premature end"):
+        get_final_structure_and_forces_from_outcar(truncated)
+
+
+def test_scan_outcar_collects_everything_in_one_pass():
+    """The single-pass scanner agrees with the dedicated readers."""
+    scan = scan_outcar(MOCK_OUTCAR_PATH)
+    assert scan["nions"] == 2
+    assert scan["species"] == (["Ga", "As"], [1, 1])
+    assert scan["convergence"] == check_outcar_convergence(MOCK_OUTCAR_PATH)
+    assert scan["timing"] == {"total_cpu_time": 120.5}
+    traj = scan["trajectory"]
+    assert traj["lattices"].shape == (2, 3, 3)
+    np.testing.assert_allclose(traj["lattices"][1], 5.1 * np.eye(3))
+    np.testing.assert_allclose(traj["positions"][1, 1], [1.26, 1.26, 1.26])
+    np.testing.assert_allclose(traj["forces"][0, 0], [0.01, 0.02, 0.03])
+
+    # Header-only extractors stop before the trajectory, so no tail is seen
+    assert scan_outcar(MOCK_OUTCAR_PATH, ["nions"]) == {"nions": 2}
+    with pytest.raises(ValueError, match="Unknown OUTCAR extractor"):
+        scan_outcar(MOCK_OUTCAR_PATH, ["magnetization"])
+
+
+def test_block_parsing_of_ragged_and_malformed_rows(tmp_path):
+    """Position/force tables are parsed per block, whatever the row widths."""
+    text = MOCK_OUTCAR_PATH.read_text()
+    row = "      1.26000   1.26000   1.26000        -0.00100  -0.00200  -0.00300\n"
+    ragged = tmp_path / "OUTCAR_ragged"
+    ragged.write_text(text.replace(row, " 1.26 1.26   1.26 -0.001 -0.002 -0.003\n"))
+    expected = scan_outcar(MOCK_OUTCAR_PATH, ["trajectory"])["trajectory"]
+    traj = scan_outcar(ragged, ["trajectory"])["trajectory"]
+    for key in expected:
+        np.testing.assert_array_equal(traj[key], expected[key])
+    struct, force = OutcarParser(ragged).get_final_structure_and_forces()
+    np.testing.assert_array_equal(force, expected["forces"][-1])
+
+    malformed = tmp_path / "OUTCAR_bad"
+    malformed.write_text(text.replace(row, row.replace("1.26000", "*******", 1)))
+    with pytest.raises(ValueError, match="Malformed OUTCAR block"):
+        scan_outcar(malformed, ["trajectory"])
+    with pytest.raises(ValueError, match="Malformed OUTCAR block"):
+        OutcarParser(malformed).get_step(-1)
+
+
+def test_registered_extractor_and_cached_parser_properties(monkeypatch):
+    """Custom extractors join the scan; the parser reads the file once."""
+
+    monkeypatch.setitem(OUTCAR_EXTRACTORS, "accuracy", None)  # removed afterwards
+
+    @register_outcar_extractor("accuracy")
+    class _Accuracy(OutcarExtractor):
+        triggers = ("reached required accuracy",)
+
+        def feed(self, line, lines):
+            self.done = True
+
+        def result(self, tail):
+            return self.done
+
+    import defectpl.io.vasp as vasp
+
+    calls = []
+    scan = vasp.scan_outcar
+    monkeypatch.setattr(
+        vasp, "scan_outcar", lambda *args: calls.append(args) or scan(*args)
+    )
+    parser = OutcarParser(MOCK_OUTCAR_PATH)
+    assert parser.scan["accuracy"] is True
+    assert parser.species == ["Ga", "As"] and parser.ions_per_type == [1, 1]
+    assert parser.forces.shape == parser.positions.shape == (2, 2, 3)
+    assert parser.lattices.shape == (2, 3, 3)
+    assert parser.check_convergence()["finished_cleanly"] is True
+    assert parser.timing["total_cpu_time"] == 120.5
+    structures, forces = parser.get_structures_and_forces()
+    assert structures[-1] == parser.get_final_structure_and_forces()[0]
+    assert parser.nsteps == 2 and parser.get_step(0)[0] == structures[0]
+    assert len([args for args in calls if len(args) == 1]) == 1  # one full read
+
+
+def test_parser_seek_path_reads_header_and_species_once(monkeypatch):
+    """Step reads share one header scan and one POSCAR read."""
+    import defectpl.io.vasp as vasp
+
+    scans, poscars = [], []
+    scan, species = vasp.scan_outcar, vasp._outcar_species
+    monkeypatch.setattr(
+        vasp, "scan_outcar", lambda *args: scans.append(args) or scan(*args)
+    )
+    monkeypatch.setattr(
+        vasp, "_outcar_species", lambda *args: poscars.append(args) or species(*args)
+    )
+    parser = OutcarParser(MOCK_OUTCAR_PATH)
+    assert scans == []  # nothing is read at construction
+    first = parser.get_first_structure_and_forces()[0]
+    last = parser.get_final_structure_and_forces()[0]
+    assert parser.natoms == 2 and first.species == last.species
+    assert scans == [(parser.filename_path, ["nions", "species"])]
+    for _ in range(2):
+        parser.get_final_structure_and_forces(MOCK_POSCAR_PATH)
+    assert len(poscars) == 1 and "scan" not in parser.__dict__
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz"])
+def test_compressed_outcar_matches_plain(tmp_path, suffix):
+    """Compressed OUTCARs are read without unpacking them to disk."""
+    import gzip
+    import lzma
+
+    compress = gzip.compress if suffix == ".gz" else lzma.compress
+    path = tmp_path / f"OUTCAR{suffix}"
+    path.write_bytes(compress(MOCK_OUTCAR_PATH.read_bytes()))
+
+    assert get_nions(path) == 2
+    assert get_species_and_index_map(path) == ["Ga", "As"]
+    assert check_outcar_convergence(path) == check_outcar_convergence(MOCK_OUTCAR_PATH)
+    structures, forces = get_structures_and_forces(MOCK_OUTCAR_PATH)
+    got_structures, got_forces = get_structures_and_forces(path)
+    assert got_structures == structures
+    np.testing.assert_allclose(np.array(got_forces), np.array(forces))
+
+    parser = OutcarParser(path)
+    struct, force = parser.get_final_structure_and_forces()
+    assert struct == structures[-1]
+    np.testing.assert_allclose(force, forces[-1])
+    struct, force = get_first_structure_and_forces_from_outcar(path)
+    assert struct == structures[0]
+    assert np.array_equal(
+        index_outcar(path).step_offsets, index_outcar(MOCK_OUTCAR_PATH).step_offsets
+    )
+    assert parser.get_step(-2)[0] == structures[0]
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".zst"])
+def test_read_compressed_eigenval_file(tmp_path, suffix):
+    """.gz goes through pymatgen, .zst through the stream parser: same result."""
+    data = MOCK_EIGENVAL_PATH.read_bytes()
+    if suffix == ".gz":
+        import gzip
+
+        data = gzip.compress(data)
+    else:
+        data = pytest.importorskip("zstandard").ZstdCompressor().compress(data)
+    path = tmp_path / f"EIGENVAL{suffix}"
+    path.write_bytes(data)
+    got, ref = read_eigenval_file(path), read_eigenval_file(MOCK_EIGENVAL_PATH)
+    assert got.keys() == ref.keys()
+    for key in ref:
+        np.testing.assert_equal(got[key], ref[key])
+
+
 # ==============================================================================
 # KOHN-SHAM & ELECTRONIC TEST CASES
 # ==============================================================================
@@ -259,3 +492,76 @@ def test_read_eigenval_file(monkeypatch):
     # |7 - 7| / 2 = 0 -> Spin Multiplicity = 1.0
     assert data["spin_multiplicity"] == 1.0
     assert data["nelect"] == 862
+
+
+# ==============================================================================
+# MULTI-YAML COMPARISON
+# ==============================================================================
+
+
+def _write_band_yaml(path, seed):
+    """Minimal two-atom Γ-only band.yaml with random modes."""
+    import yaml
+
+    rng = np.random.default_rng(seed)
+    bands = [
+        {
+            "frequency": float(f),
+            "eigenvector": rng.normal(scale=0.5, size=(2, 3, 2)).tolist(),
+        }
+        for f in np.linspace(0.5, 20.0, 6)
+    ]
+    data = {
+        "natom": 2,
+        "points": [{"symbol": "Ga", "mass": 69.723}, {"symbol": "As", "mass": 74.922}],
+        "phonon": [{"q-position": [0.0, 0.0, 0.0], "band": bands}],
+    }
+    path.write_text(yaml.safe_dump(data))
+
+
+def test_run_dynamic_yaml_comparison_parallel_matches_serial(tmp_path, monkeypatch):
+    """Process-pool comparison returns the serial intensities in input order."""
+    import matplotlib.pyplot as plt
+    from defectpl.io.vasp import run_dynamic_yaml_comparison
+
+    monkeypatch.setenv("DEFECTPL_CACHE", "0")
+    yamls = [tmp_path / f"band_{i}.yaml" for i in range(3)]
+    for i, path in enumerate(yamls):
+        _write_band_yaml(path, seed=i)
+    gs = Structure.from_file(MOCK_POSCAR_PATH)
+    es = gs.copy()
+    es.translate_sites([1], [0.01, 0.0, 0.0])
+
+    curves = {}
+    for jobs in (1, 2):
+        plotted = []
+        monkeypatch.setattr(
+            plt, "plot", lambda y, *a, plotted=plotted, **k: plotted.append(y)
+        )
+        out = run_dynamic_yaml_comparison(
+            yamls, gs, es, tmp_path, 1.5, 2.0, 1.0, 3.0, f"cmp{jobs}.png", jobs=jobs
+        )
+        assert out.is_file()
+        curves[jobs] = plotted
+
+    assert len(curves[2]) == 3
+    for serial, parallel in zip(curves[1], curves[2]):
+        np.testing.assert_allclose(parallel, serial)
+    assert not np.allclose(curves[1][0], curves[1][1])
+
+
+def test_run_dynamic_yaml_comparison_serial_leaves_no_state(tmp_path, monkeypatch):
+    """The serial path does not park dR in the worker-state global."""
+    from defectpl.io import vasp
+
+    monkeypatch.setenv("DEFECTPL_CACHE", "0")
+    path = tmp_path / "band.yaml"
+    _write_band_yaml(path, seed=0)
+    gs = Structure.from_file(MOCK_POSCAR_PATH)
+    es = gs.copy()
+    es.translate_sites([1], [0.01, 0.0, 0.0])
+
+    vasp.run_dynamic_yaml_comparison(
+        [path], gs, es, tmp_path, 1.5, 2.0, 1.0, 3.0, "cmp.png", jobs=1
+    )
+    assert vasp._COMPARISON_STATE == {}